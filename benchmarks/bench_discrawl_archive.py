@@ -0,0 +1,228 @@
+"""
+discrawl query latency benchmark
+Usage: python3 benchmarks/bench_discrawl_archive.py [--rows N] [--runs N] [--db PATH]
+                                                    [--binary PATH --config PATH]
+
+Builds a synthetic discrawl-style archive (1M messages by default, kept at
+--db so later runs reuse it) and times the messages, search and mentions
+queries two ways:
+
+sqlite:      the in-process read-only path the discrawl tools use now.
+subprocess:  a fresh process per query that opens the database, runs the same
+             SQL and prints NDJSON, which is parsed like discrawl --json
+             output. This stands in for process start + config load +
+             database open. Pass --binary and --config to time a real
+             discrawl build against its own archive instead.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from discord_py_self_mcp.discrawl_archive import (
+    DiscrawlArchive,
+    DiscrawlArchiveConfig,
+    _build_query,
+    read_schema,
+    resolve_channel_ids,
+)
+from discord_py_self_mcp.tools.discrawl import RowStream, _run_discrawl_rows
+
+SCHEMA = """
+CREATE TABLE channels (id TEXT PRIMARY KEY, guild_id TEXT, name TEXT);
+CREATE TABLE members (
+    guild_id TEXT, user_id TEXT, username TEXT, display_name TEXT,
+    PRIMARY KEY (guild_id, user_id)
+);
+CREATE TABLE messages (
+    id TEXT PRIMARY KEY, guild_id TEXT, channel_id TEXT, author_id TEXT,
+    created_at TEXT, content TEXT
+);
+CREATE INDEX messages_channel_created ON messages(channel_id, created_at);
+CREATE INDEX messages_created ON messages(created_at);
+CREATE VIRTUAL TABLE message_fts USING fts5(message_id UNINDEXED, content);
+CREATE TABLE mention_events (
+    message_id TEXT, guild_id TEXT, channel_id TEXT,
+    target_type TEXT, target_id TEXT, target_name TEXT
+);
+CREATE INDEX mention_events_target ON mention_events(target_id);
+"""
+
+CHANNELS = 50
+AUTHORS = 200
+WORDS = [f"word{index}" for index in range(5000)]
+QUERIES = {
+    "messages": {"channel": "channel-7", "max_rows": 50},
+    "search": {"query": "word42 word43", "max_rows": 50},
+    "mentions": {"target": "user-3", "max_rows": 50},
+}
+BATCH = 10000
+
+STAND_IN = """
+import json, sqlite3, sys
+db = sqlite3.connect(sys.argv[1])
+db.row_factory = sqlite3.Row
+sql, params = json.loads(sys.argv[2])
+for row in db.execute(sql, params):
+    print(json.dumps({k: row[k] for k in row.keys() if row[k] is not None}))
+"""
+
+
+def build_archive(path: Path, rows: int) -> None:
+    print(f"building {rows} row archive at {path} ...", flush=True)
+    started = time.perf_counter()
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=OFF")
+    db.executescript(SCHEMA)
+    db.executemany(
+        "INSERT INTO channels VALUES (?, '1', ?)",
+        [(str(100 + index), f"channel-{index}") for index in range(CHANNELS)],
+    )
+    db.executemany(
+        "INSERT INTO members VALUES ('1', ?, ?, NULL)",
+        [(str(1000 + index), f"user-{index}") for index in range(AUTHORS)],
+    )
+    rng = random.Random(0)
+    for start in range(0, rows, BATCH):
+        messages, mentions = [], []
+        for index in range(start, min(start + BATCH, rows)):
+            message_id = str(10**17 + index)
+            content = " ".join(rng.choices(WORDS, k=rng.randint(3, 20)))
+            if rng.random() < 0.02:
+                target = rng.randrange(AUTHORS)
+                content += f" @user-{target}"
+                mentions.append((message_id, str(1000 + target), f"user-{target}"))
+            created = f"2025-{1 + index * 12 // rows:02d}-01T00:00:{index % 60:02d}Z"
+            messages.append(
+                (
+                    message_id,
+                    str(100 + rng.randrange(CHANNELS)),
+                    str(1000 + rng.randrange(AUTHORS)),
+                    created,
+                    content,
+                )
+            )
+        with db:
+            db.executemany("INSERT INTO messages VALUES (?, '1', ?, ?, ?, ?)", messages)
+            db.executemany(
+                "INSERT INTO message_fts (message_id, content) VALUES (?, ?)",
+                [(row[0], row[4]) for row in messages],
+            )
+            db.executemany(
+                "INSERT INTO mention_events VALUES (?, '1', NULL, 'user', ?, ?)", mentions
+            )
+    db.close()
+    print(f"built in {time.perf_counter() - started:.1f}s", flush=True)
+
+
+async def time_sqlite(archive: DiscrawlArchive, command: str, arguments: dict) -> float:
+    started = time.perf_counter()
+    result = await archive.query(command, arguments, 0, arguments["max_rows"] + 1)
+    elapsed = time.perf_counter() - started
+    assert result is not None, f"{command} not answerable from the archive"
+    return elapsed
+
+
+async def time_stand_in(path: Path, sql_and_params: list, count: int) -> float:
+    sql, params = sql_and_params
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-S",
+        "-c",
+        STAND_IN,
+        str(path),
+        json.dumps([sql + " LIMIT ?", [*params, count]]),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await process.communicate()
+    RowStream().feed(stdout, final=True)
+    return time.perf_counter() - started
+
+
+async def time_binary(binary: str, config: str, command: str, arguments: dict) -> float:
+    args = []
+    for key in ("channel", "target"):
+        if key in arguments:
+            args.extend([f"--{key}", arguments[key]])
+    if "query" in arguments:
+        args.append(arguments["query"])
+    count = arguments["max_rows"] + 1
+    payload = {
+        "command": command,
+        "args": ["--json", "--limit", str(count), *args],
+        "binary": binary,
+        "config_path": config,
+    }
+    started = time.perf_counter()
+    await _run_discrawl_rows(payload, 0, arguments["max_rows"], 20000)
+    return time.perf_counter() - started
+
+
+def summarize(name: str, latencies: list[float]) -> str:
+    return (
+        f"  {name:<11} mean={statistics.fmean(latencies) * 1000:8.2f}ms "
+        f"p50={statistics.median(latencies) * 1000:8.2f}ms "
+        f"max={max(latencies) * 1000:8.2f}ms"
+    )
+
+
+async def run(args) -> None:
+    path = Path(args.db)
+    if not path.exists():
+        build_archive(path, args.rows)
+    archive = DiscrawlArchive(DiscrawlArchiveConfig(path=path))
+    db = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    schema = read_schema(db)
+
+    for command, arguments in QUERIES.items():
+        print(f"{command} {json.dumps(arguments)}")
+        await time_sqlite(archive, command, arguments)  # open the connection
+        sqlite_times = [
+            await time_sqlite(archive, command, arguments) for _ in range(args.runs)
+        ]
+        print(summarize("sqlite", sqlite_times))
+        if args.binary:
+            other = [
+                await time_binary(args.binary, args.config, command, arguments)
+                for _ in range(args.runs)
+            ]
+            print(summarize("discrawl", other))
+        else:
+            channel_ids = None
+            if "channel" in arguments:
+                channel_ids = resolve_channel_ids(db, arguments["channel"])
+            built = _build_query(schema, command, arguments, channel_ids)
+            other = [
+                await time_stand_in(path, built, arguments["max_rows"] + 1)
+                for _ in range(args.runs)
+            ]
+            print(summarize("subprocess", other))
+        ratio = statistics.median(other) / statistics.median(sqlite_times)
+        print(f"  speedup    {ratio:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="discrawl query latency benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--db", default="/tmp/discrawl-bench.db")
+    parser.add_argument("--binary", help="time a real discrawl binary instead")
+    parser.add_argument("--config", help="discrawl config for --binary")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
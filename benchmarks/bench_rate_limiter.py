@@ -0,0 +1,115 @@
+"""
+Rate limiter admission benchmark
+Usage: python3 benchmarks/bench_rate_limiter.py [--waiters N] [--rounds N]
+
+Compares admission latency of the GCRA limiter against the previous
+list-and-lock implementation with N concurrent waiters. Limits are set high
+enough that nobody has to sleep, so the numbers are pure bookkeeping cost.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from discord_py_self_mcp.rate_limiter import RateLimitConfig, RateLimiter
+
+UNLIMITED = 10**9
+
+
+class LegacyRateLimiter:
+    """The message path of the pre-GCRA limiter, kept for comparison."""
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self._message_timestamps: list = []
+        self._cooldown_until: float = 0
+        self._lock = asyncio.Lock()
+
+    async def wait_if_needed(self, action_type: str = "message"):
+        async with self._lock:
+            while True:
+                now = time.time()
+                if now < self._cooldown_until:
+                    await asyncio.sleep(self._cooldown_until - now)
+                    continue
+
+                self._message_timestamps[:] = [
+                    t for t in self._message_timestamps if now - t < 60
+                ]
+                msg_in_minute = len(self._message_timestamps)
+                msg_in_second = sum(
+                    1 for timestamp in self._message_timestamps if now - timestamp < 1
+                )
+                if msg_in_minute >= self.config.messages_per_minute:
+                    self._cooldown_until = time.time() + self.config.cooldown_on_limit
+                    continue
+                if msg_in_second >= self.config.messages_per_second:
+                    await asyncio.sleep(
+                        max(0.0, 1.0 - (now - self._message_timestamps[-1]))
+                    )
+                    continue
+
+                self._message_timestamps.append(time.time())
+                return
+
+
+async def measure(limiter, waiters: int) -> list[float]:
+    latencies: list[float] = []
+
+    async def waiter():
+        started = time.perf_counter()
+        await limiter.wait_if_needed("message")
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(waiter() for _ in range(waiters)))
+    return latencies
+
+
+def summarize(name: str, latencies: list[float], elapsed: float) -> str:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{name:<8} total={elapsed * 1000:8.2f}ms "
+        f"mean={statistics.fmean(latencies) * 1e6:9.1f}us "
+        f"p50={statistics.median(latencies) * 1e6:9.1f}us "
+        f"p99={p99 * 1e6:9.1f}us"
+    )
+
+
+async def run(waiters: int, rounds: int) -> None:
+    config = RateLimitConfig(
+        enabled=True,
+        messages_per_minute=UNLIMITED,
+        messages_per_second=UNLIMITED,
+        actions_per_minute=UNLIMITED,
+    )
+    print(f"{waiters} concurrent waiters, {rounds} round(s)")
+    for name, factory in (
+        ("legacy", lambda: LegacyRateLimiter(config)),
+        ("gcra", lambda: RateLimiter(config)),
+    ):
+        limiter = factory()
+        latencies: list[float] = []
+        started = time.perf_counter()
+        for _ in range(rounds):
+            latencies.extend(await measure(limiter, waiters))
+        print(summarize(name, latencies, time.perf_counter() - started))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate limiter admission benchmark")
+    parser.add_argument("--waiters", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.waiters, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+MCP server cold-start benchmark
+Usage: python3 benchmarks/bench_startup.py [--runs N] [--mode daemon|local] [--offline]
+
+Spawns `python -m discord_py_self_mcp.main` and times how long it takes from
+process start until the stdio `initialize` response arrives.
+
+daemon: a stand-in daemon socket answers the startup ping, so the server runs
+        as a thin client and never imports discord.py (no token needed).
+local:  MCP_DAEMON_MODE=off with your DISCORD_TOKEN; the gateway login runs
+        in the background and does not delay the handshake. With --offline
+        the login is replaced by a no-op, so no token or network is needed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from discord_py_self_mcp.cli_runtime import APP_NAME
+from discord_py_self_mcp.daemon_protocol import encode_frame, read_frame
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "0"},
+    },
+}
+AUTH_TOKEN = "bench-startup"
+SERVER_ARGV = ["-m", "discord_py_self_mcp.main"]
+# Runs the server with Client.start stubbed out. discord.py is still imported
+# where the real server imports it, so the timing matches, but nothing logs in.
+OFFLINE_SERVER_ARGV = [
+    "-c",
+    "import discord_py_self_mcp.main as main\n"
+    "start_local_client = main._start_local_client\n"
+    "def offline_start_local_client():\n"
+    "    from discord_py_self_mcp.bot import client\n"
+    "    async def no_login(token):\n"
+    "        pass\n"
+    "    client.start = no_login\n"
+    "    start_local_client()\n"
+    "main._start_local_client = offline_start_local_client\n"
+    "main.main()\n",
+]
+
+
+async def _serve_ping(reader, writer):
+    try:
+        hello = await read_frame(reader)
+        if hello is None:
+            return
+        writer.write(encode_frame({"type": "hello", "ok": True, "version": hello.get("version")}))
+        while True:
+            frame = await read_frame(reader)
+            if frame is None:
+                break
+            writer.write(encode_frame({"id": frame.get("id"), "result": {"ok": True}}))
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_fake_daemon(runtime_dir: Path):
+    """Listen where the server looks for the daemon when XDG_RUNTIME_DIR=runtime_dir."""
+    app_dir = runtime_dir / APP_NAME
+    app_dir.mkdir(parents=True, exist_ok=True)
+    (app_dir / "daemon.auth").write_text(AUTH_TOKEN, encoding="utf-8")
+    return await asyncio.start_unix_server(_serve_ping, path=str(app_dir / "daemon.sock"))
+
+
+async def measure_initialize(
+    env: dict, timeout: float = 30.0, argv: list[str] = SERVER_ARGV
+) -> float:
+    """Seconds from spawning the server until its initialize response."""
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        *argv,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=str(PROJECT_ROOT),
+        env=env,
+    )
+    try:
+        process.stdin.write((json.dumps(INITIALIZE_REQUEST) + "\n").encode())
+        await process.stdin.drain()
+        line = await asyncio.wait_for(process.stdout.readline(), timeout)
+        elapsed = time.perf_counter() - started
+        response = json.loads(line)
+        if response.get("id") != 1 or "result" not in response:
+            raise RuntimeError(f"Unexpected initialize response: {response}")
+        return elapsed
+    finally:
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+
+
+async def measure_daemon_mode(runs: int, timeout: float = 30.0) -> list[float]:
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        server = await start_fake_daemon(Path(runtime_dir))
+        env = {**os.environ, "XDG_RUNTIME_DIR": runtime_dir, "MCP_DAEMON_MODE": "require"}
+        try:
+            return [await measure_initialize(env, timeout) for _ in range(runs)]
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
+async def measure_local_mode(
+    runs: int, offline: bool = False, timeout: float = 30.0
+) -> list[float]:
+    """With ``offline`` the login is stubbed out and any token will do."""
+    token = "bench-startup-offline" if offline else os.getenv("DISCORD_TOKEN")
+    if not token:
+        raise SystemExit("local mode needs DISCORD_TOKEN (or --offline)")
+    env = {**os.environ, "MCP_DAEMON_MODE": "off", "DISCORD_TOKEN": token}
+    argv = OFFLINE_SERVER_ARGV if offline else SERVER_ARGV
+    return [await measure_initialize(env, timeout, argv) for _ in range(runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", choices=("daemon", "local"), default="daemon")
+    parser.add_argument("--offline", action="store_true", help="local mode without logging in")
+    args = parser.parse_args()
+
+    if args.mode == "daemon":
+        samples = asyncio.run(measure_daemon_mode(args.runs))
+    else:
+        samples = asyncio.run(measure_local_mode(args.runs, offline=args.offline))
+    print(f"time to initialize ({args.mode} mode, {args.runs} runs)")
+    print(f"  min     {min(samples) * 1000:8.1f} ms")
+    print(f"  median  {statistics.median(samples) * 1000:8.1f} ms")
+    print(f"  max     {max(samples) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import os
+import secrets
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+
+from discord_py_self_mcp.cli_runtime import APP_NAME
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+CHUNK_SIZE = 64 * 1024
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_INLINE_MAX_BYTES = 1024 * 1024
+_TEMP_PREFIX = ".partial-"
+
+
+def default_cache_dir() -> Path:
+    base = os.getenv("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / APP_NAME / "attachments"
+
+
+@dataclass
+class AttachmentCacheConfig:
+    path: Path
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    inline_max_bytes: int = DEFAULT_INLINE_MAX_BYTES
+
+
+@dataclass
+class CachedAttachment:
+    attachment_id: int
+    path: Path
+    sha256: str
+    size: int
+
+
+class AttachmentTooLarge(Exception):
+    pass
+
+
+class AttachmentDownloadError(Exception):
+    pass
+
+
+class AttachmentCache:
+    """Content-addressed on-disk cache for attachment downloads.
+
+    Files are streamed to disk in chunks and stored as ``<id>-<sha256>``;
+    a hit refreshes the file's mtime, and the oldest files are evicted once
+    the directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, config: Optional[AttachmentCacheConfig] = None):
+        self.config = config or self._load_from_env()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Keyed by (attachment id, max_bytes) so a waiter never inherits
+        # another caller's size limit.
+        self._inflight: Dict[Tuple[int, Optional[int]], asyncio.Future] = {}
+
+    @classmethod
+    def _load_from_env(cls) -> AttachmentCacheConfig:
+        path = os.getenv("ATTACHMENT_CACHE_DIR")
+        return AttachmentCacheConfig(
+            path=Path(path).expanduser() if path else default_cache_dir(),
+            max_bytes=int(os.getenv("ATTACHMENT_CACHE_MAX_BYTES", str(DEFAULT_CACHE_MAX_BYTES))),
+            inline_max_bytes=int(
+                os.getenv("ATTACHMENT_INLINE_MAX_BYTES", str(DEFAULT_INLINE_MAX_BYTES))
+            ),
+        )
+
+    @property
+    def directory(self) -> Path:
+        return Path(self.config.path)
+
+    def lookup(self, attachment_id: int) -> Optional[CachedAttachment]:
+        if not self.directory.is_dir():
+            return None
+        for path in self.directory.glob(f"{int(attachment_id)}-*"):
+            sha256 = path.name.split("-", 1)[1]
+            try:
+                os.utime(path)
+                size = path.stat().st_size
+            except FileNotFoundError:
+                continue
+            return CachedAttachment(int(attachment_id), path, sha256, size)
+        return None
+
+    async def fetch(self, attachment, max_bytes: Optional[int] = None) -> CachedAttachment:
+        """Return the cached file for ``attachment``, downloading it if needed."""
+        cached = self.lookup(attachment.id)
+        if cached is not None:
+            return cached
+
+        key = (attachment.id, max_bytes)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            cached = await self._download(attachment, max_bytes)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark it retrieved so an unshared failure is not logged by asyncio.
+            future.exception()
+            raise
+        else:
+            future.set_result(cached)
+            return cached
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _download(self, attachment, max_bytes: Optional[int]) -> CachedAttachment:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self.directory / f"{_TEMP_PREFIX}{attachment.id}-{secrets.token_hex(4)}"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(temp_path, "wb") as handle:
+                # discord.py attachments carry the client's HTTP client.
+                http = getattr(attachment, "_http", None)
+                async for chunk in self._iter_chunks(attachment.url, http):
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise AttachmentTooLarge(
+                            f"Attachment {attachment.id} exceeds max_bytes={max_bytes}"
+                        )
+                    digest.update(chunk)
+                    handle.write(chunk)
+            sha256 = digest.hexdigest()
+            final_path = self.directory / f"{int(attachment.id)}-{sha256}"
+            os.replace(temp_path, final_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        self.evict(keep=final_path)
+        return CachedAttachment(int(attachment.id), final_path, sha256, size)
+
+    async def _iter_chunks(self, url: str, http: Any = None) -> AsyncIterator[bytes]:
+        session, options = _client_session(http)
+        if session is None:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession()
+            session = self._session
+        async with session.get(url, **options) as response:
+            if response.status != 200:
+                raise AttachmentDownloadError(
+                    f"Attachment download failed with HTTP {response.status}"
+                )
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                yield chunk
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Delete least recently used files until the cache fits; returns bytes freed."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.startswith(_TEMP_PREFIX):
+                continue
+            stat = entry.stat()
+            total += stat.st_size
+            if keep is None or entry.path != str(keep):
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        freed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total - freed <= self.config.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            freed += size
+        if freed:
+            log_to_stderr(f"[ATTACHMENT_CACHE] Evicted {freed} bytes")
+        return freed
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def _client_session(http: Any) -> Tuple[Optional[aiohttp.ClientSession], dict]:
+    """The Discord client's session and proxy settings, so downloads take the same route."""
+    if http is None:
+        return None, {}
+    # discord.py keeps the session name-mangled on its HTTPClient.
+    session = getattr(http, "_HTTPClient__session", None)
+    if not isinstance(session, aiohttp.ClientSession) or session.closed:
+        session = None
+    options = {}
+    if getattr(http, "proxy", None):
+        options["proxy"] = http.proxy
+        if getattr(http, "proxy_auth", None):
+            options["proxy_auth"] = http.proxy_auth
+    return session, options
+
+
+_global_attachment_cache: Optional[AttachmentCache] = None
+
+
+def get_attachment_cache(config: Optional[AttachmentCacheConfig] = None) -> AttachmentCache:
+    global _global_attachment_cache
+    if _global_attachment_cache is None:
+        _global_attachment_cache = AttachmentCache(config)
+    return _global_attachment_cache
@@ -1,14 +1,19 @@
 import discord
 import inspect
 import importlib
+import os
 import sys
 from typing import Dict, Any
 from google.protobuf import json_format
 from dotenv import load_dotenv
-from discord_py_self_mcp.captcha.solver import HCaptchaSolver
 from discord_py_self_mcp.rate_limiter import (
     RateLimiter,
 )
+from discord_py_self_mcp.message_store import MessageStore
+from discord_py_self_mcp.event_bus import get_event_bus
+from discord_py_self_mcp.gateway_cache import GatewayCache, GatewayCacheConfig
+from discord_py_self_mcp.readiness import readiness
+from discord_py_self_mcp.resolver import get_resolver
 from discord_py_self_mcp.logging_utils import log_to_stderr
 
 load_dotenv()
@@ -44,13 +49,97 @@ def init_rate_limiter():
     return rate_limiter
 
 
+message_store = None
+
+
+def init_message_store():
+    global message_store
+    message_store = MessageStore()
+    if message_store.is_enabled():
+        log_to_stderr(f"[MESSAGE_STORE] Enabled at {message_store.config.path}")
+    return message_store
+
+
+gateway_cache = None
+
+
+def init_gateway_cache():
+    global gateway_cache
+    gateway_cache = GatewayCache()
+    config = gateway_cache.config
+    if config == GatewayCacheConfig():
+        return gateway_cache
+    scope = f"{len(config.guild_ids)} guilds" if config.guild_ids else "all guilds"
+    log_to_stderr(
+        f"[GATEWAY] max_messages={config.max_messages}, member_cache={config.member_cache}, "
+        f"chunking={config.chunking}, subscriptions: {scope}"
+    )
+    return gateway_cache
+
+
+def _store_event(action: str, *args) -> None:
+    if not (message_store and message_store.is_enabled()):
+        return
+    try:
+        getattr(message_store, action)(*args)
+    except Exception as exc:
+        log_to_stderr(f"[MESSAGE_STORE] {action} failed: {exc}")
+
+
+def _publish_message(kind: str, message: discord.Message) -> None:
+    bus = get_event_bus()
+    if not bus.has_subscribers():
+        return
+    # tools.embed pulls in the tool registry; only needed once someone listens.
+    from discord_py_self_mcp.tools.embed import serialize_message
+
+    channel = message.channel
+    bus.publish(
+        kind,
+        channel_id=channel.id,
+        guild_id=message.guild.id if message.guild else None,
+        parent_id=getattr(channel, "parent_id", None),
+        build=lambda: {"message": serialize_message(message)},
+    )
+
+
+def _publish_delete(client: discord.Client, channel_id: int, guild_id, message_ids) -> None:
+    bus = get_event_bus()
+    if not bus.has_subscribers():
+        return
+    channel = client.get_channel(channel_id)
+    bus.publish(
+        "message_delete",
+        channel_id=channel_id,
+        guild_id=guild_id,
+        parent_id=getattr(channel, "parent_id", None),
+        build=lambda: {"message_ids": [str(message_id) for message_id in message_ids]},
+    )
+
+
 captcha_solver = None
 
 
 class SelfBot(discord.Client):
     def __init__(self):
         init_rate_limiter()
-        super().__init__()
+        init_message_store()
+        init_gateway_cache()
+        super().__init__(
+            http_trace=rate_limiter.routes.trace_config(), **gateway_cache.client_options()
+        )
+
+    async def start(self, token: str, *, reconnect: bool = True) -> None:
+        readiness.begin()
+        try:
+            await super().start(token, reconnect=reconnect)
+        except Exception as exc:
+            readiness.fail(f"{type(exc).__name__}: {exc}")
+            raise
+
+    async def setup_hook(self):
+        # Runs right after login: REST calls and ``self.user`` work from here.
+        readiness.mark("rest")
 
     async def on_ready(self):
         user_id = self.user.id if self.user else "unknown"
@@ -61,6 +150,21 @@ class SelfBot(discord.Client):
         if rate_limiter and rate_limiter.is_enabled():
             log_to_stderr(f"[RATE_LIMIT] Active - {rate_limiter.get_stats()}")
 
+        # READY means a new gateway session; events may have been missed.
+        _store_event("reset_live")
+        get_resolver(self).clear()
+        gateway_cache.reset()
+        readiness.mark("gateway")
+        await gateway_cache.subscribe_scope(self)
+
+    async def on_guild_join(self, guild: discord.Guild):
+        await gateway_cache.subscribe_guild(self, guild)
+
+    def schedule_chunk(self, guild: discord.Guild) -> None:
+        """Called on a member cache miss; chunks the guild when chunking is lazy."""
+        if gateway_cache.config.chunking == "lazy":
+            gateway_cache.schedule_chunk(guild)
+
     async def on_connect(self):
         log_to_stderr("[CONNECT] Connected to Discord gateway")
 
@@ -79,6 +183,79 @@ class SelfBot(discord.Client):
     async def on_resumed(self):
         log_to_stderr("[RESUMED] Session resumed")
 
+    async def on_message(self, message: discord.Message):
+        _store_event("add_message", message)
+        _publish_message("message_create", message)
+
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        _store_event("update_message", after)
+        _publish_message("message_edit", after)
+
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        get_resolver(self).invalidate_message(payload.channel_id, payload.message_id)
+        if payload.cached_message is not None:
+            return  # handled by on_message_edit
+        channel = self.get_channel(payload.channel_id)
+        if channel is None or "author" not in payload.data:
+            return
+        try:
+            message = discord.Message(
+                state=self._connection, channel=channel, data=payload.data
+            )
+        except Exception:
+            return
+        _store_event("update_message", message)
+        _publish_message("message_edit", message)
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        get_resolver(self).invalidate_message(payload.channel_id, payload.message_id)
+        _store_event("delete_messages", [payload.message_id])
+        _publish_delete(self, payload.channel_id, payload.guild_id, [payload.message_id])
+
+    async def on_raw_bulk_message_delete(
+        self, payload: discord.RawBulkMessageDeleteEvent
+    ):
+        for message_id in payload.message_ids:
+            get_resolver(self).invalidate_message(payload.channel_id, message_id)
+        _store_event("delete_messages", payload.message_ids)
+        _publish_delete(self, payload.channel_id, payload.guild_id, sorted(payload.message_ids))
+
+    # Resolver invalidation: objects fetched over REST are not updated by the
+    # gateway, so drop them when Discord reports a change.
+
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        get_resolver(self).invalidate_message(payload.channel_id, payload.message_id)
+
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        get_resolver(self).invalidate_message(payload.channel_id, payload.message_id)
+
+    async def on_raw_reaction_clear(self, payload: discord.RawReactionClearEvent):
+        get_resolver(self).invalidate_message(payload.channel_id, payload.message_id)
+
+    async def on_guild_channel_update(self, before, after):
+        get_resolver(self).invalidate_channel(after.id)
+
+    async def on_guild_channel_delete(self, channel):
+        get_resolver(self).invalidate_channel(channel.id)
+
+    async def on_private_channel_delete(self, channel):
+        get_resolver(self).invalidate_channel(channel.id)
+
+    async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
+        get_resolver(self).invalidate_channel(after.id)
+
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        get_resolver(self).invalidate_channel(payload.thread_id)
+
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        get_resolver(self).invalidate_user(after.id)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        get_resolver(self).invalidate_member(after.guild.id, after.id)
+
+    async def on_member_remove(self, member: discord.Member):
+        get_resolver(self).invalidate_member(member.guild.id, member.id)
+
     async def on_captcha(self, data: Dict[str, Any]) -> str:
         return await solve_captcha()
 
@@ -94,6 +271,10 @@ async def solve_captcha() -> str:
         )
 
     if captcha_solver is None:
+        # hcaptcha_challenger pulls in Playwright and takes seconds to import,
+        # so it is only loaded once a captcha actually has to be solved.
+        from discord_py_self_mcp.captcha.solver import HCaptchaSolver
+
         captcha_solver = HCaptchaSolver(
             sitekey="a9b5fb07-92ff-493f-86fe-352a2803b3df",
             host="discord.com",
@@ -0,0 +1,222 @@
+import asyncio
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_POLL_INTERVAL = 2.0
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+# Editors often save by writing a temp file and renaming it over the
+# original, so the parent directories are watched rather than the files.
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+ChangeCallback = Callable[[Set[Path]], Awaitable[None]]
+
+
+def project_module_files(extra: Iterable[Path] = ()) -> Set[Path]:
+    """Source files of every loaded project module, plus ``extra``."""
+    files = {Path(path).resolve() for path in extra}
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if not filename or not filename.endswith(".py"):
+            continue
+        path = Path(filename).resolve()
+        if PACKAGE_DIR in path.parents:
+            files.add(path)
+    return files
+
+
+def file_digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class CodeWatcher:
+    """Calls ``on_change`` once per burst of edits to the watched files.
+
+    Uses inotify on Linux, so an idle daemon is never woken up; elsewhere it
+    falls back to comparing mtimes every ``poll_interval`` seconds. Events
+    that arrive within ``debounce`` seconds of each other are merged, and
+    files whose content did not actually change (e.g. ``touch``) are dropped.
+    """
+
+    def __init__(
+        self,
+        files: Iterable[Path],
+        on_change: ChangeCallback,
+        *,
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        self.files = {Path(path).resolve() for path in files}
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.backend = "inotify" if use_inotify and _load_inotify() else "poll"
+        self._digests: Dict[Path, Optional[str]] = {}
+        self._pending: Set[Path] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _snapshot(self) -> None:
+        self._digests = {path: file_digest(path) for path in self.files}
+
+    def _changed(self, candidates: Set[Path]) -> Set[Path]:
+        changed = set()
+        for path in candidates:
+            digest = file_digest(path)
+            if digest != self._digests.get(path):
+                self._digests[path] = digest
+                changed.add(path)
+        return changed
+
+    def _notify(self, paths: Iterable[Path]) -> None:
+        self._pending.update(paths)
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        self._snapshot()
+        self._wakeup = asyncio.Event()
+        if self.backend == "inotify":
+            watcher = self._watch_inotify()
+        else:
+            watcher = self._watch_mtimes()
+        watch_task = asyncio.create_task(watcher)
+        watch_task.add_done_callback(self._log_crash)
+        try:
+            while True:
+                await self._wakeup.wait()
+                # Let the burst settle before looking at what changed.
+                while True:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self.debounce)
+                    except asyncio.TimeoutError:
+                        break
+                self._wakeup.clear()
+                candidates, self._pending = self._pending, set()
+                changed = self._changed(candidates)
+                if changed:
+                    await self.on_change(changed)
+        finally:
+            watch_task.cancel()
+
+    @staticmethod
+    def _log_crash(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            log_to_stderr(f"[WATCH] Watcher stopped: {type(exc).__name__}: {exc}")
+
+    async def _watch_inotify(self) -> None:
+        libc = _load_inotify()
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            # e.g. EMFILE once fs.inotify.max_user_instances is used up
+            log_to_stderr(
+                f"[WATCH] inotify_init1 failed: errno {ctypes.get_errno()}; polling instead"
+            )
+            self.backend = "poll"
+            await self._watch_mtimes()
+            return
+        directories: Dict[int, Path] = {}
+        unwatched: Set[Path] = set()
+        try:
+            for directory in sorted({path.parent for path in self.files}):
+                wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+                if wd < 0:
+                    log_to_stderr(
+                        f"[WATCH] Cannot watch {directory}: errno {ctypes.get_errno()}; "
+                        "polling its files instead"
+                    )
+                    unwatched.update(path for path in self.files if path.parent == directory)
+                    continue
+                directories[wd] = directory
+
+            loop = asyncio.get_running_loop()
+            loop.add_reader(fd, self._read_inotify, fd, directories)
+            try:
+                if unwatched:
+                    await self._watch_mtimes(unwatched)
+                else:
+                    await asyncio.Future()
+            finally:
+                loop.remove_reader(fd)
+        finally:
+            os.close(fd)
+
+    def _read_inotify(self, fd: int, directories: Dict[int, Path]) -> None:
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed.update(self.files)
+                continue
+            directory = directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if path in self.files:
+                changed.add(path)
+        if changed:
+            self._notify(changed)
+
+    def _mtimes(self, files: Iterable[Path]) -> Dict[Path, Optional[tuple]]:
+        stats = {}
+        for path in files:
+            try:
+                stat = path.stat()
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stats[path] = None
+        return stats
+
+    async def _watch_mtimes(self, files: Optional[Set[Path]] = None) -> None:
+        files = self.files if files is None else files
+        previous = self._mtimes(files)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = self._mtimes(files)
+            changed = {path for path in files if current[path] != previous[path]}
+            previous = current
+            if changed:
+                self._notify(changed)
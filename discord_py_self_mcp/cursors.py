@@ -0,0 +1,86 @@
+import base64
+import binascii
+from collections import OrderedDict
+from typing import Optional
+
+CURSOR_PREFIX = "c1"
+CONTINUATION_PREFIX = "h1"
+HISTORY_DIRECTIONS = ("backward", "forward")
+MAX_RETAINED_CHANNELS = 1000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode(*fields) -> str:
+    raw = ":".join(str(field) for field in fields).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(token: str, prefix: str, channel_id: int) -> list[str]:
+    """Fields after the channel id; the token must belong to ``channel_id``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        fields = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+        if fields[0] != prefix or len(fields) < 3:
+            raise ValueError(fields[0])
+        token_channel = int(fields[1])
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor(f"Invalid cursor '{token}'") from exc
+    if token_channel != int(channel_id):
+        raise InvalidCursor(f"Cursor belongs to channel {token_channel}, not {channel_id}")
+    return fields[2:]
+
+
+def encode_cursor(channel_id: int, message_id: int) -> str:
+    return _encode(CURSOR_PREFIX, int(channel_id), int(message_id))
+
+
+def decode_cursor(cursor: str, channel_id: int) -> int:
+    """Return the message id a cursor points at; it must belong to ``channel_id``."""
+    fields = _decode(cursor, CURSOR_PREFIX, channel_id)
+    if len(fields) != 1 or not fields[0].isdigit():
+        raise InvalidCursor(f"Invalid cursor '{cursor}'")
+    return int(fields[0])
+
+
+def encode_continuation(channel_id: int, direction: str, message_id: int) -> str:
+    return _encode(CONTINUATION_PREFIX, int(channel_id), direction, int(message_id))
+
+
+def decode_continuation(token: str, channel_id: int) -> tuple[str, int]:
+    """Return ``(direction, message_id)`` for a history continuation token."""
+    fields = _decode(token, CONTINUATION_PREFIX, channel_id)
+    if len(fields) != 2 or fields[0] not in HISTORY_DIRECTIONS or not fields[1].isdigit():
+        raise InvalidCursor(f"Invalid continuation token '{token}'")
+    return fields[0], int(fields[1])
+
+
+class CursorStore:
+    """Newest message id returned per channel, for ``since_last_read`` reads."""
+
+    def __init__(self, max_channels: int = MAX_RETAINED_CHANNELS):
+        self.max_channels = max_channels
+        self._positions: "OrderedDict[int, int]" = OrderedDict()
+
+    def get(self, channel_id: int) -> Optional[int]:
+        return self._positions.get(int(channel_id))
+
+    def advance(self, channel_id: int, message_id: int) -> None:
+        channel_id = int(channel_id)
+        current = self._positions.get(channel_id)
+        self._positions[channel_id] = max(int(message_id), current or 0)
+        self._positions.move_to_end(channel_id)
+        while len(self._positions) > self.max_channels:
+            self._positions.popitem(last=False)
+
+
+_global_cursor_store: Optional[CursorStore] = None
+
+
+def get_cursor_store() -> CursorStore:
+    global _global_cursor_store
+    if _global_cursor_store is None:
+        _global_cursor_store = CursorStore()
+    return _global_cursor_store
@@ -0,0 +1,203 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+from mcp.types import ContentBlock
+from pydantic import TypeAdapter
+
+from discord_py_self_mcp.cli_runtime import AUTH_FILE, SOCKET_PATH
+from discord_py_self_mcp.daemon_protocol import (
+    ProtocolError,
+    encode_frame,
+    hello_frame,
+    read_frame,
+)
+from discord_py_self_mcp.progress import ProgressCallback
+
+DAEMON_MODES = ("auto", "off", "require")
+CONNECT_TIMEOUT = 1.0
+
+_content_adapter = TypeAdapter(list[ContentBlock])
+
+
+class DaemonUnavailable(Exception):
+    """The daemon socket could not be reached."""
+
+
+class DaemonResponseLost(Exception):
+    """The request reached the daemon but its response never came back.
+
+    The daemon may already have run it, so the call must not be retried.
+    """
+
+
+class DaemonError(Exception):
+    """The daemon answered with an error instead of a result."""
+
+
+def daemon_mode() -> str:
+    mode = os.getenv("MCP_DAEMON_MODE", "auto").strip().lower()
+    return mode if mode in DAEMON_MODES else "auto"
+
+
+def _read_auth_token(auth_file: Path) -> Optional[str]:
+    try:
+        token = auth_file.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return token or None
+
+
+class DaemonClient:
+    """Forwards tool calls to ``scripts/daemon.py`` over its private socket.
+
+    The daemon owns the only gateway session and caches; every MCP process
+    that finds its socket becomes a thin client of it. One framed connection
+    is kept open and shared by concurrent calls.
+    """
+
+    def __init__(self, socket_path: Path = SOCKET_PATH, auth_file: Path = AUTH_FILE):
+        self.socket_path = Path(socket_path)
+        self.auth_file = Path(auth_file)
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._event_handlers: dict[int, Callable[[dict], None]] = {}
+        self._next_id = 0
+        self._connect_lock = asyncio.Lock()
+
+    def _connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def _connect(self) -> None:
+        async with self._connect_lock:
+            if self._connected():
+                return
+
+            token = _read_auth_token(self.auth_file)
+            if not token or not self.socket_path.exists():
+                raise DaemonUnavailable(f"No daemon socket at {self.socket_path}")
+
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_unix_connection(str(self.socket_path)), CONNECT_TIMEOUT
+                )
+                writer.write(encode_frame(hello_frame(token)))
+                await writer.drain()
+                hello = await asyncio.wait_for(read_frame(reader), CONNECT_TIMEOUT)
+            except (OSError, asyncio.TimeoutError, ProtocolError) as exc:
+                raise DaemonUnavailable(f"Cannot connect to daemon: {exc}") from exc
+
+            if not hello or not hello.get("ok"):
+                writer.close()
+                error = (hello or {}).get("error", "handshake failed")
+                raise DaemonUnavailable(f"Daemon rejected connection: {error}")
+
+            self._writer = writer
+            self._reader_task = asyncio.create_task(self._read_responses(reader, writer))
+
+    async def _read_responses(self, reader: asyncio.StreamReader, writer) -> None:
+        # Waiters still pending here have had their request written already.
+        error: Exception = DaemonResponseLost("Daemon closed the connection")
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                if "event" in frame:
+                    handler = self._event_handlers.get(frame.get("id"))
+                    if handler is not None:
+                        handler(frame["event"])
+                    continue
+                waiter = self._pending.pop(frame.get("id"), None)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(frame.get("result") or {})
+        except (OSError, asyncio.IncompleteReadError, ProtocolError) as exc:
+            error = DaemonResponseLost(f"Daemon connection lost: {exc}")
+        finally:
+            if self._writer is writer:
+                self._writer = None
+            writer.close()
+            pending, self._pending = self._pending, {}
+            for waiter in pending.values():
+                if not waiter.done():
+                    waiter.set_exception(error)
+
+    async def request(
+        self,
+        command: str,
+        args: dict,
+        timeout: Optional[float] = None,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> dict:
+        """Send one request; ``on_event`` receives partial results if streamed."""
+        await self._connect()
+        self._next_id += 1
+        request_id = self._next_id
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = waiter
+        frame = {"id": request_id, "command": command, "args": args}
+        if on_event is not None:
+            frame["stream"] = True
+            self._event_handlers[request_id] = on_event
+        try:
+            self._writer.write(encode_frame(frame))
+            await self._writer.drain()
+        except (OSError, AttributeError) as exc:
+            self._pending.pop(request_id, None)
+            self._event_handlers.pop(request_id, None)
+            raise DaemonUnavailable(f"Daemon connection lost: {exc}") from exc
+
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+            self._event_handlers.pop(request_id, None)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+
+    async def ping(self) -> bool:
+        try:
+            response = await self.request("ping", {}, timeout=CONNECT_TIMEOUT)
+        except (DaemonUnavailable, DaemonResponseLost, asyncio.TimeoutError):
+            return False
+        return response.get("ok") is True
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict,
+        *,
+        priority: Optional[str] = None,
+        ready_timeout: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[ContentBlock]:
+        """Run a tool in the daemon; ``on_progress`` receives its progress updates."""
+        args = {"name": name, "arguments": arguments}
+        if priority:
+            args["priority"] = priority
+        if ready_timeout is not None:
+            args["ready_timeout"] = ready_timeout
+
+        on_event = None
+        if on_progress is not None:
+            sending: set[asyncio.Task] = set()
+
+            def on_event(event: dict) -> None:
+                if "progress" not in event:
+                    return
+                task = asyncio.create_task(
+                    on_progress(event["progress"], event.get("total"), event.get("message"))
+                )
+                sending.add(task)
+                task.add_done_callback(sending.discard)
+
+        response = await self.request("call_tool", args, on_event=on_event)
+        if "error" in response:
+            raise DaemonError(response["error"])
+        return _content_adapter.validate_python(response["content"])
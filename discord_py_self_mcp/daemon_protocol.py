@@ -0,0 +1,85 @@
+"""
+Daemon socket framing: a 4-byte big-endian length followed by UTF-8 JSON.
+
+A connection opens with a ``hello`` frame (auth token and protocol version).
+Requests then carry an ``id`` echoed by their response, so several can be in
+flight on one connection and complete out of order. Pre-framing clients send
+one bare JSON object instead; a frame header never starts with ``{`` (that
+would be over 2 GiB), so the first byte tells them apart.
+"""
+
+import asyncio
+import json
+import socket
+import struct
+from typing import Optional
+
+PROTOCOL_VERSION = 1
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+LEGACY_PREFIX = b"{"
+
+_HEADER = struct.Struct(">I")
+
+
+class ProtocolError(Exception):
+    """A peer sent a frame that cannot be decoded."""
+
+
+def encode_frame(payload: dict) -> bytes:
+    body = json.dumps(payload).encode()
+    if len(body) > MAX_FRAME_BYTES:
+        raise ProtocolError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_BYTES}")
+    return _HEADER.pack(len(body)) + body
+
+
+def _decode_body(body: bytes) -> dict:
+    try:
+        payload = json.loads(body.decode())
+    except ValueError as exc:
+        raise ProtocolError(f"Invalid frame body: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ProtocolError("Frame body must be a JSON object")
+    return payload
+
+
+def _frame_length(header: bytes) -> int:
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ProtocolError(f"Frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+    return length
+
+
+async def read_frame(reader, prefix: bytes = b"") -> Optional[dict]:
+    """Read one frame from an asyncio stream; ``None`` on a clean EOF.
+
+    ``prefix`` holds header bytes the caller already consumed.
+    """
+    try:
+        header = prefix + await reader.readexactly(_HEADER.size - len(prefix))
+    except asyncio.IncompleteReadError as exc:
+        if not exc.partial and not prefix:
+            return None
+        raise ProtocolError("Connection closed inside a frame header") from exc
+    body = await reader.readexactly(_frame_length(header))
+    return _decode_body(body)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise ProtocolError("Daemon closed the connection mid-frame")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_frame(sock: socket.socket) -> dict:
+    """Blocking counterpart of :func:`read_frame` for plain sockets."""
+    header = _recv_exactly(sock, _HEADER.size)
+    return _decode_body(_recv_exactly(sock, _frame_length(header)))
+
+
+def hello_frame(auth_token: str) -> dict:
+    return {"type": "hello", "version": PROTOCOL_VERSION, "auth": auth_token}
@@ -0,0 +1,354 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+DEFAULT_CONFIG_PATH = Path.home() / ".discrawl" / "config.toml"
+DEFAULT_DB_PATH = Path.home() / ".discrawl" / "discrawl.db"
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+ARCHIVE_MODES = ("auto", "off")
+
+MESSAGE_COLUMNS = ("id", "guild_id", "channel_id", "author_id", "created_at", "content")
+FTS_TABLES = ("message_fts", "messages_fts")
+MENTION_TABLES = ("mention_events", "message_mentions", "mentions")
+MEMBER_NAME_COLUMNS = ("nick", "display_name", "global_name", "username")
+
+
+@dataclass
+class DiscrawlArchiveConfig:
+    mode: str = "auto"
+    # None reads db_path from the discrawl config, then the default location.
+    path: Optional[Path] = None
+    mmap_size: int = DEFAULT_MMAP_SIZE
+
+
+@dataclass(frozen=True)
+class ArchiveSchema:
+    """The parts of a discrawl database this reader knows how to query."""
+
+    fts_table: Optional[str] = None
+    # FTS rows point at messages either by a message_id column or by rowid.
+    fts_key: str = "rowid"
+    mentions_table: Optional[str] = None
+    mention_columns: Tuple[str, ...] = ()
+    has_channel_names: bool = False
+    member_name_columns: Tuple[str, ...] = ()
+
+
+def resolve_db_path(config_path: Optional[str] = None) -> Path:
+    """Where discrawl keeps its archive, according to its config file."""
+    config = Path(config_path).expanduser() if config_path else DEFAULT_CONFIG_PATH
+    if tomllib is not None and config.is_file():
+        try:
+            data = tomllib.loads(config.read_text())
+        except (OSError, tomllib.TOMLDecodeError):
+            data = {}
+        database = data.get("database")
+        value = data.get("db_path")
+        if not value and isinstance(database, dict):
+            value = database.get("path")
+        if value:
+            return Path(str(value)).expanduser()
+    return DEFAULT_DB_PATH
+
+
+def fts_phrase_query(text: str) -> str:
+    """Quote every word so user input is never parsed as FTS5 syntax."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def _columns(db: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+
+
+def _first_table(tables: set, candidates) -> Optional[str]:
+    return next((name for name in candidates if name in tables), None)
+
+
+def read_schema(db: sqlite3.Connection) -> Optional[ArchiveSchema]:
+    """Inspect a discrawl database; None if its messages table is not recognised."""
+    tables = {
+        row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    if "messages" not in tables or not set(MESSAGE_COLUMNS) <= _columns(db, "messages"):
+        return None
+
+    fts_table = _first_table(tables, FTS_TABLES)
+    fts_key = "rowid"
+    if fts_table and "message_id" in _columns(db, fts_table):
+        fts_key = "message_id"
+
+    mentions_table = _first_table(tables, MENTION_TABLES)
+    mention_columns: Tuple[str, ...] = ()
+    if mentions_table:
+        columns = _columns(db, mentions_table)
+        if {"message_id", "target_id"} <= columns:
+            mention_columns = tuple(
+                name for name in ("target_type", "target_id", "target_name") if name in columns
+            )
+        else:
+            mentions_table = None
+
+    member_names: Tuple[str, ...] = ()
+    if "members" in tables:
+        columns = _columns(db, "members")
+        if {"guild_id", "user_id"} <= columns:
+            member_names = tuple(name for name in MEMBER_NAME_COLUMNS if name in columns)
+
+    return ArchiveSchema(
+        fts_table=fts_table,
+        fts_key=fts_key,
+        mentions_table=mentions_table,
+        mention_columns=mention_columns,
+        has_channel_names="channels" in tables and {"id", "name"} <= _columns(db, "channels"),
+        member_name_columns=member_names,
+    )
+
+
+class DiscrawlArchive:
+    """Read-only, in-process queries against discrawl's SQLite archive.
+
+    Serves the messages, search and mentions tools without starting a
+    discrawl process. Connections are opened read-only with a shared cache
+    and memory-mapped I/O, one per worker thread. discrawl puts the database
+    in WAL mode, so these reads never block a running sync.
+    Any query the schema can't answer returns None, and the caller falls
+    back to the discrawl binary.
+    """
+
+    def __init__(self, config: Optional[DiscrawlArchiveConfig] = None):
+        self.config = config or self._load_from_env()
+        self._local = threading.local()
+        self._schemas: Dict[Path, ArchiveSchema] = {}
+        self.queries = 0
+        self.fallbacks = 0
+
+    @classmethod
+    def _load_from_env(cls) -> DiscrawlArchiveConfig:
+        mode = os.getenv("DISCRAWL_DIRECT", "auto").strip().lower()
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"DISCRAWL_DIRECT must be one of auto, off, got '{mode}'")
+        path = os.getenv("DISCRAWL_DB")
+        return DiscrawlArchiveConfig(
+            mode=mode,
+            path=Path(path).expanduser() if path else None,
+            mmap_size=int(os.getenv("DISCRAWL_MMAP_SIZE", str(DEFAULT_MMAP_SIZE))),
+        )
+
+    def is_enabled(self) -> bool:
+        return self.config.mode != "off"
+
+    def db_path(self, config_path: Optional[str] = None) -> Path:
+        return self.config.path or resolve_db_path(config_path)
+
+    def _connection(self, path: Path) -> sqlite3.Connection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        db = connections.get(path)
+        if db is None:
+            uri = f"{path.resolve().as_uri()}?mode=ro&cache=shared"
+            db = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            db.row_factory = sqlite3.Row
+            db.execute(f"PRAGMA mmap_size={int(self.config.mmap_size)}")
+            db.execute("PRAGMA query_only=1")
+            connections[path] = db
+        return db
+
+    def _schema(self, path: Path, db: sqlite3.Connection) -> Optional[ArchiveSchema]:
+        schema = self._schemas.get(path)
+        if schema is None:
+            # Not cached when missing: the first sync may not have run yet.
+            schema = read_schema(db)
+            if schema is not None:
+                self._schemas[path] = schema
+        return schema
+
+    async def query(
+        self, command: str, arguments: dict, offset: int, count: int
+    ) -> Optional[Tuple[Path, List[Dict[str, Any]]]]:
+        """Run ``command`` against the archive; None means use the discrawl binary."""
+        if not self.is_enabled():
+            return None
+        path = self.db_path(arguments.get("config_path"))
+        if not path.is_file():
+            return None
+        result = await asyncio.to_thread(self._query, path, command, arguments, offset, count)
+        if result is None:
+            self.fallbacks += 1
+            return None
+        self.queries += 1
+        return path, result
+
+    def _query(
+        self, path: Path, command: str, arguments: dict, offset: int, count: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        try:
+            db = self._connection(path)
+            schema = self._schema(path, db)
+            if schema is None:
+                return None
+            channel = _text_arg(arguments, "channel")
+            channel_ids = None
+            if channel is not None and schema.has_channel_names:
+                channel_ids = resolve_channel_ids(db, channel)
+            built = _build_query(schema, command, arguments, channel_ids)
+            if built is None:
+                return None
+            if count <= 0:
+                return []
+            sql, params = built
+            rows = db.execute(sql + " LIMIT ? OFFSET ?", [*params, count, offset]).fetchall()
+        except sqlite3.Error as e:
+            log_to_stderr(f"[DISCRAWL] Archive query failed, using discrawl instead: {e}")
+            return None
+        return [{key: row[key] for key in row.keys() if row[key] is not None} for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.config.mode,
+            "path": str(self.db_path()),
+            "queries": self.queries,
+            "fallbacks": self.fallbacks,
+        }
+
+
+def _text_arg(arguments: dict, key: str) -> Optional[str]:
+    value = arguments.get(key)
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def resolve_channel_ids(db: sqlite3.Connection, channel: str) -> List[str]:
+    """Ids of the channels a ``channel`` argument (id or name) refers to."""
+    rows = db.execute(
+        "SELECT id FROM channels WHERE id = ? OR name = ?", (channel, channel.lstrip("#"))
+    ).fetchall()
+    return [str(row[0]) for row in rows]
+
+
+def _build_query(
+    schema: ArchiveSchema,
+    command: str,
+    arguments: dict,
+    channel_ids: Optional[List[str]] = None,
+) -> Optional[Tuple[str, list]]:
+    columns = ["m.id", "m.guild_id", "m.channel_id", "m.author_id", "m.created_at", "m.content"]
+    joins: List[str] = []
+    clauses: List[str] = []
+    params: list = []
+    order = "m.created_at DESC, m.rowid DESC"
+
+    if schema.has_channel_names:
+        columns.append("c.name AS channel_name")
+        joins.append("LEFT JOIN channels c ON c.id = m.channel_id")
+    author_name = None
+    if schema.member_name_columns:
+        names = ", ".join(f"u.{name}" for name in schema.member_name_columns)
+        author_name = f"COALESCE({names})"
+        columns.append(f"{author_name} AS author_name")
+        joins.append("LEFT JOIN members u ON u.user_id = m.author_id AND u.guild_id = m.guild_id")
+
+    if command == "search":
+        query = _text_arg(arguments, "query")
+        if schema.fts_table is None or query is None:
+            return None
+        message_key = "id" if schema.fts_key == "message_id" else "rowid"
+        source = (
+            f"{schema.fts_table} f JOIN messages m ON m.{message_key} = f.{schema.fts_key}"
+        )
+        clauses.append(f"{schema.fts_table} MATCH ?")
+        params.append(fts_phrase_query(query))
+        order = "f.rank, m.created_at DESC, m.rowid DESC"
+    elif command == "mentions":
+        if schema.mentions_table is None:
+            return None
+        source = f"{schema.mentions_table} e JOIN messages m ON m.id = e.message_id"
+        columns.extend(f"e.{name}" for name in schema.mention_columns)
+        target = _text_arg(arguments, "target")
+        if target is not None:
+            if "target_name" in schema.mention_columns:
+                clauses.append("(e.target_id = ? OR e.target_name = ?)")
+                params.extend([target, target.lstrip("@")])
+            else:
+                clauses.append("e.target_id = ?")
+                params.append(target)
+        mention_type = _text_arg(arguments, "type")
+        if mention_type is not None:
+            if "target_type" not in schema.mention_columns:
+                return None
+            clauses.append("e.target_type = ?")
+            params.append(mention_type)
+    elif command == "messages":
+        source = "messages m"
+    else:
+        return None
+
+    guild = _text_arg(arguments, "guild")
+    if guild is not None:
+        clauses.append("m.guild_id = ?")
+        params.append(guild)
+    channel = _text_arg(arguments, "channel")
+    if channel is not None:
+        if schema.has_channel_names:
+            # IN rather than OR keeps the (channel_id, created_at) index usable.
+            channel_ids = channel_ids or [channel]
+        else:
+            channel_ids = [channel]
+        # A single id lets the (channel_id, created_at) index supply the order.
+        clauses.append(f"m.channel_id IN ({', '.join('?' * len(channel_ids))})")
+        params.extend(channel_ids)
+    author = _text_arg(arguments, "author")
+    if author is not None:
+        if author_name:
+            member_name = author_name.replace("u.", "")
+            clauses.append(
+                "m.author_id IN "
+                f"(SELECT ? UNION SELECT user_id FROM members WHERE {member_name} = ?)"
+            )
+            params.extend([author, author.lstrip("@")])
+        else:
+            clauses.append("m.author_id = ?")
+            params.append(author)
+    since = _text_arg(arguments, "since")
+    if since is not None:
+        clauses.append("m.created_at >= ?")
+        params.append(since)
+    if arguments.get("days") is not None:
+        try:
+            days = float(arguments["days"])
+        except (TypeError, ValueError):
+            return None
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        clauses.append("m.created_at >= ?")
+        params.append(cutoff.strftime("%Y-%m-%dT%H:%M:%S"))
+    if command != "mentions" and arguments.get("include_empty") is not True:
+        clauses.append("TRIM(m.content) != ''")
+
+    sql = f"SELECT {', '.join(columns)} FROM {source} {' '.join(joins)}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    return sql + f" ORDER BY {order}", params
+
+
+_global_discrawl_archive: Optional[DiscrawlArchive] = None
+
+
+def get_discrawl_archive() -> DiscrawlArchive:
+    global _global_discrawl_archive
+    if _global_discrawl_archive is None:
+        _global_discrawl_archive = DiscrawlArchive()
+    return _global_discrawl_archive
@@ -0,0 +1,209 @@
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from discord_py_self_mcp.progress import current_progress
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_CACHE_SIZE = 128
+DEFAULT_CACHE_TTL = 300.0
+# Finished background jobs kept around for discrawl_sync_status.
+MAX_FINISHED_JOBS = 20
+
+# A query callable returns its response and whether it may be cached.
+QueryCall = Callable[[], Awaitable[Tuple[Any, bool]]]
+
+
+@dataclass
+class DiscrawlPoolConfig:
+    max_workers: int = DEFAULT_MAX_WORKERS
+    cache_size: int = DEFAULT_CACHE_SIZE
+    # Seconds a cached result stays valid; 0 keeps it until the next sync.
+    cache_ttl: float = DEFAULT_CACHE_TTL
+
+
+@dataclass
+class SyncJob:
+    """A discrawl sync running detached from the tool call that started it."""
+
+    id: str
+    key: str
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    # running, succeeded, failed, timed_out, or finished when it joined
+    # a sync someone else started and only has that run's result.
+    status: str = "running"
+    progress: Optional[str] = None
+    # Live output of the run; anything with a ``render()`` method.
+    output: Any = None
+    result: Any = None
+    task: Optional[asyncio.Task] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+
+class DiscrawlPool:
+    """Bounds, deduplicates and caches discrawl subprocess runs.
+
+    At most ``max_workers`` discrawl processes run at once. Read queries are
+    cached in an LRU keyed by their normalized arguments, and identical
+    queries that overlap share one process. Syncs with the same arguments
+    share one run, different syncs queue behind each other, and the cache is
+    cleared whenever a sync finishes. Syncs can also run as background jobs
+    that are polled by id.
+    """
+
+    def __init__(self, config: Optional[DiscrawlPoolConfig] = None):
+        self.config = config or self._load_from_env()
+        self._workers = asyncio.Semaphore(max(1, self.config.max_workers))
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._queries: Dict[str, asyncio.Task] = {}
+        self._syncs: Dict[str, asyncio.Task] = {}
+        self._sync_lock = asyncio.Lock()
+        self._jobs: "OrderedDict[str, SyncJob]" = OrderedDict()
+        # Bumped on every sync so queries started earlier don't cache stale rows.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.syncs = 0
+
+    @classmethod
+    def _load_from_env(cls) -> DiscrawlPoolConfig:
+        return DiscrawlPoolConfig(
+            max_workers=int(os.getenv("DISCRAWL_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))),
+            cache_size=int(os.getenv("DISCRAWL_CACHE_SIZE", str(DEFAULT_CACHE_SIZE))),
+            cache_ttl=float(os.getenv("DISCRAWL_CACHE_TTL", str(DEFAULT_CACHE_TTL))),
+        )
+
+    def worker(self) -> asyncio.Semaphore:
+        """Hold this while a discrawl process is running."""
+        return self._workers
+
+    def _cached(self, key: str) -> Optional[Any]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.config.cache_ttl > 0 and time.monotonic() - stored_at > self.config.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any) -> None:
+        if self.config.cache_size <= 0:
+            return
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.config.cache_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+    async def query(self, key: str, call: QueryCall) -> Any:
+        cached = self._cached(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        task = self._queries.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._run_query(key, call))
+            self._queries[key] = task
+            task.add_done_callback(lambda _task: self._queries.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel the others' result.
+        return await asyncio.shield(task)
+
+    async def _run_query(self, key: str, call: QueryCall) -> Any:
+        generation = self._generation
+        value, cacheable = await call()
+        if cacheable and generation == self._generation:
+            self._store(key, value)
+        return value
+
+    async def sync(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._syncs.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_sync(call))
+            self._syncs[key] = task
+            task.add_done_callback(lambda _task: self._syncs.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _run_sync(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        async with self._sync_lock:
+            self.syncs += 1
+            try:
+                return await call()
+            finally:
+                self.invalidate()
+
+    def start_job(self, key: str, run: Callable[[SyncJob], Awaitable[Any]]) -> SyncJob:
+        """Run a sync in the background; a running job with the same key is reused."""
+        for job in self._jobs.values():
+            if job.key == key and job.status == "running":
+                return job
+        job = SyncJob(id=uuid.uuid4().hex[:8], key=key)
+
+        async def runner() -> None:
+            # Nobody is waiting on the original call's progress token any more.
+            current_progress.set(None)
+            try:
+                job.result = await self.sync(key, lambda: run(job))
+                if job.status == "running":
+                    job.status = "finished"
+            except Exception as e:
+                job.status = "failed"
+                job.result = f"{type(e).__name__}: {e}"
+            finally:
+                job.finished_at = time.time()
+
+        job.task = asyncio.ensure_future(runner())
+        self._jobs[job.id] = job
+        finished = [item.id for item in self._jobs.values() if item.status != "running"]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+        return job
+
+    def get_job(self, job_id: str) -> Optional[SyncJob]:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> List[SyncJob]:
+        return list(self._jobs.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.config.max_workers,
+            "cached": len(self._cache),
+            "cache_size": self.config.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "running_queries": len(self._queries),
+            "running_syncs": len(self._syncs),
+            "syncs": self.syncs,
+            "jobs": sum(1 for job in self._jobs.values() if job.status == "running"),
+        }
+
+
+_global_discrawl_pool: Optional[DiscrawlPool] = None
+
+
+def get_discrawl_pool() -> DiscrawlPool:
+    global _global_discrawl_pool
+    if _global_discrawl_pool is None:
+        _global_discrawl_pool = DiscrawlPool()
+    return _global_discrawl_pool
@@ -0,0 +1,145 @@
+import asyncio
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set
+
+DEFAULT_SUBSCRIBER_BUFFER = 1000
+MAX_SUBSCRIBER_BUFFER = 10000
+
+
+def subscriber_buffer(value=None) -> int:
+    """Events buffered per subscriber; ``value`` overrides ``DAEMON_SUBSCRIBER_BUFFER``."""
+    if value is None:
+        value = os.getenv("DAEMON_SUBSCRIBER_BUFFER", str(DEFAULT_SUBSCRIBER_BUFFER))
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        size = DEFAULT_SUBSCRIBER_BUFFER
+    return max(1, min(size, MAX_SUBSCRIBER_BUFFER))
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    channel_ids: FrozenSet[int] = field(default_factory=frozenset)
+    guild_ids: FrozenSet[int] = field(default_factory=frozenset)
+    dms: bool = False
+
+    def is_empty(self) -> bool:
+        return not (self.channel_ids or self.guild_ids or self.dms)
+
+    def matches(
+        self, channel_id: int, guild_id: Optional[int], parent_id: Optional[int] = None
+    ) -> bool:
+        # A channel subscription includes the threads under that channel.
+        if channel_id in self.channel_ids or (parent_id and parent_id in self.channel_ids):
+            return True
+        if guild_id is None:
+            return self.dms
+        return guild_id in self.guild_ids
+
+
+class Subscription:
+    """Bounded event buffer for one subscriber.
+
+    Publishing never waits on a subscriber: when the buffer is full the
+    oldest event is dropped, and the subscriber is told how many it missed
+    with an ``overflow`` event before the next one it receives.
+    """
+
+    def __init__(self, event_filter: EventFilter, max_buffer: int):
+        self.filter = event_filter
+        self.max_buffer = max_buffer
+        self.delivered = 0
+        self.dropped = 0
+        self._buffer: deque = deque()
+        self._missed = 0
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def offer(self, event: dict) -> None:
+        if len(self._buffer) >= self.max_buffer:
+            self._buffer.popleft()
+            self.dropped += 1
+            self._missed += 1
+        self._buffer.append(event)
+        self._ready.set()
+
+    async def get(self) -> dict:
+        while not self._buffer:
+            self._ready.clear()
+            await self._ready.wait()
+        if self._missed:
+            missed, self._missed = self._missed, 0
+            return {"type": "overflow", "dropped": missed}
+        self.delivered += 1
+        return self._buffer.popleft()
+
+
+class EventBus:
+    """Fans gateway message events out to daemon subscribers."""
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+        self.published = 0
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def subscribe(
+        self, event_filter: EventFilter, max_buffer: Optional[int] = None
+    ) -> Subscription:
+        subscription = Subscription(event_filter, subscriber_buffer(max_buffer))
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def publish(
+        self,
+        kind: str,
+        *,
+        channel_id: int,
+        guild_id: Optional[int],
+        parent_id: Optional[int] = None,
+        build: Callable[[], Dict[str, Any]],
+    ) -> int:
+        """Deliver an event to matching subscribers; ``build`` runs only if there are any."""
+        targets = [
+            subscription
+            for subscription in self._subscriptions
+            if subscription.filter.matches(channel_id, guild_id, parent_id)
+        ]
+        if not targets:
+            return 0
+        event = {
+            "type": kind,
+            "channel_id": str(channel_id),
+            "guild_id": str(guild_id) if guild_id else None,
+            **build(),
+        }
+        for subscription in targets:
+            subscription.offer(event)
+        self.published += 1
+        return len(targets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self._subscriptions),
+            "published": self.published,
+            "buffered": sum(len(sub) for sub in self._subscriptions),
+            "dropped": sum(sub.dropped for sub in self._subscriptions),
+        }
+
+
+_global_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    global _global_event_bus
+    if _global_event_bus is None:
+        _global_event_bus = EventBus()
+    return _global_event_bus
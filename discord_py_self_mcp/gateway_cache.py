@@ -0,0 +1,205 @@
+import asyncio
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional
+
+import discord
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+DEFAULT_MAX_MESSAGES = 1000
+MEMBER_CACHE_POLICIES = ("all", "voice", "none")
+CHUNKING_MODES = ("startup", "lazy", "off")
+
+
+@dataclass
+class GatewayCacheConfig:
+    max_messages: Optional[int] = DEFAULT_MAX_MESSAGES
+    member_cache: str = "all"
+    # None subscribes to every guild, like discord.py does by default.
+    guild_ids: Optional[FrozenSet[int]] = None
+    chunking: str = "startup"
+
+
+def _parse_guild_ids(value: str) -> Optional[FrozenSet[int]]:
+    ids = frozenset(int(part) for part in value.replace(" ", "").split(",") if part)
+    return ids or None
+
+
+def _choice(name: str, value: str, choices) -> str:
+    value = value.strip().lower()
+    if value not in choices:
+        raise ValueError(f"{name} must be one of {', '.join(choices)}, got '{value}'")
+    return value
+
+
+class GatewayCache:
+    """How much of the gateway the client subscribes to and keeps in memory.
+
+    discord.py subscribes to and chunks every guild in READY and caches all
+    members and the last 1000 messages; on accounts in hundreds of guilds
+    that dominates RSS. This turns those knobs into client options and does
+    the scoped subscribing and lazy chunking discord.py has no option for.
+    """
+
+    def __init__(self, config: Optional[GatewayCacheConfig] = None):
+        self.config = config or self._load_from_env()
+        self._chunking: Dict[int, asyncio.Task] = {}
+        self._unchunkable: set[int] = set()
+
+    @classmethod
+    def _load_from_env(cls) -> GatewayCacheConfig:
+        max_messages = int(os.getenv("DISCORD_MAX_MESSAGES", str(DEFAULT_MAX_MESSAGES)))
+        return GatewayCacheConfig(
+            max_messages=max_messages if max_messages > 0 else None,
+            member_cache=_choice(
+                "DISCORD_MEMBER_CACHE",
+                os.getenv("DISCORD_MEMBER_CACHE", "all"),
+                MEMBER_CACHE_POLICIES,
+            ),
+            guild_ids=_parse_guild_ids(os.getenv("DISCORD_GUILD_IDS", "")),
+            chunking=_choice(
+                "DISCORD_GUILD_CHUNKING",
+                os.getenv("DISCORD_GUILD_CHUNKING", "startup"),
+                CHUNKING_MODES,
+            ),
+        )
+
+    def member_cache_flags(self) -> discord.MemberCacheFlags:
+        if self.config.member_cache == "none":
+            return discord.MemberCacheFlags.none()
+        if self.config.member_cache == "voice":
+            return discord.MemberCacheFlags(voice=True, other=False)
+        return discord.MemberCacheFlags.all()
+
+    def client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for ``discord.Client.__init__``."""
+        return {
+            "max_messages": self.config.max_messages,
+            "member_cache_flags": self.member_cache_flags(),
+            # With a guild scope we subscribe ourselves once READY arrives.
+            "request_guilds": self.config.guild_ids is None,
+            "chunk_guilds_at_startup": (
+                self.config.chunking == "startup" and self.config.guild_ids is None
+            ),
+        }
+
+    def is_subscribed(self, guild_id: int) -> bool:
+        return self.config.guild_ids is None or int(guild_id) in self.config.guild_ids
+
+    async def subscribe_guild(self, client, guild) -> None:
+        """Subscribe to a guild inside the configured scope and chunk it at startup."""
+        if self.config.guild_ids is None or guild.id not in self.config.guild_ids:
+            return
+        try:
+            await client._connection.request_guild(guild.id)
+        except Exception as exc:
+            log_to_stderr(f"[GATEWAY] Could not subscribe to guild {guild.id}: {exc}")
+            return
+        if self.config.chunking == "startup":
+            self.schedule_chunk(guild)
+
+    async def subscribe_scope(self, client) -> None:
+        if self.config.guild_ids is None:
+            return
+        for guild in client.guilds:
+            await self.subscribe_guild(client, guild)
+        log_to_stderr(
+            f"[GATEWAY] Subscribed to {len(self.config.guild_ids)} of {len(client.guilds)} guilds"
+        )
+
+    def schedule_chunk(self, guild) -> None:
+        """Load a guild's member list in the background, once."""
+        if self.config.chunking == "off" or self.config.member_cache == "none":
+            return
+        if getattr(guild, "chunked", True) or guild.id in self._unchunkable:
+            return
+        if guild.id in self._chunking or not self.is_subscribed(guild.id):
+            return
+        self._chunking[guild.id] = asyncio.create_task(self._chunk(guild))
+
+    async def _chunk(self, guild) -> None:
+        try:
+            await guild.chunk()
+        except Exception as exc:
+            # Large guilds hide offline members; REST lookups still work there.
+            self._unchunkable.add(guild.id)
+            log_to_stderr(f"[GATEWAY] Could not chunk guild {guild.id}: {exc}")
+        finally:
+            self._chunking.pop(guild.id, None)
+
+    def reset(self) -> None:
+        for task in self._chunking.values():
+            task.cancel()
+        self._chunking.clear()
+
+    def report(self, client, guild_id: Optional[int] = None, limit: int = 25) -> Dict[str, Any]:
+        """Cache sizes per guild, largest member caches first."""
+        messages_by_guild: Dict[Optional[int], int] = {}
+        cached_messages = list(getattr(client, "cached_messages", ()))
+        for message in cached_messages:
+            key = message.guild.id if message.guild else None
+            messages_by_guild[key] = messages_by_guild.get(key, 0) + 1
+
+        guilds = []
+        for guild in client.guilds:
+            if guild_id is not None and guild.id != guild_id:
+                continue
+            guilds.append(
+                {
+                    "id": str(guild.id),
+                    "name": guild.name,
+                    "member_count": guild.member_count,
+                    "cached_members": len(guild.members),
+                    "channels": len(guild.channels),
+                    "threads": len(guild.threads),
+                    "roles": len(guild.roles),
+                    "emojis": len(guild.emojis),
+                    "cached_messages": messages_by_guild.get(guild.id, 0),
+                    "chunked": guild.chunked,
+                    "subscribed": self.is_subscribed(guild.id),
+                }
+            )
+        guilds.sort(key=lambda entry: (entry["cached_members"], entry["channels"]), reverse=True)
+
+        return {
+            "config": {
+                "max_messages": self.config.max_messages,
+                "member_cache": self.config.member_cache,
+                "guild_ids": sorted(str(gid) for gid in self.config.guild_ids or ()),
+                "chunking": self.config.chunking,
+            },
+            "totals": {
+                "guilds": len(client.guilds),
+                "users": len(client.users),
+                "private_channels": len(client.private_channels),
+                "cached_messages": len(cached_messages),
+                "dm_cached_messages": messages_by_guild.get(None, 0),
+                "cached_members": sum(len(guild.members) for guild in client.guilds),
+                "chunks_in_progress": len(self._chunking),
+            },
+            "process": process_memory(),
+            "guilds": guilds[: max(1, limit)],
+        }
+
+
+def process_memory() -> Dict[str, Optional[int]]:
+    """Current and peak resident set size in bytes, where the platform reports them."""
+    rss = None
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            rss = int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    peak = None
+    try:
+        import resource  # not available on Windows
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+        if sys.platform != "darwin":
+            peak *= 1024
+    except (ImportError, OSError):
+        pass
+    return {"rss_bytes": rss, "peak_rss_bytes": peak}
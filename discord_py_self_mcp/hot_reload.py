@@ -0,0 +1,191 @@
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+PACKAGE = "discord_py_self_mcp"
+# Stateless helpers the tool modules import from; reloaded before the tools.
+RELOADABLE_HELPERS = (f"{PACKAGE}.tool_utils", f"{PACKAGE}.tools.embed")
+# The registry holds the handlers, metrics and catalog and must survive a reload.
+_PINNED_TOOL_MODULES = (
+    f"{PACKAGE}.tools",
+    f"{PACKAGE}.tools.registry",
+    f"{PACKAGE}.tools.catalog",
+)
+
+_reload_counter = 0
+
+
+def is_reloadable(module_name: str) -> bool:
+    if module_name in RELOADABLE_HELPERS:
+        return True
+    return module_name.startswith(f"{PACKAGE}.tools.") and module_name not in _PINNED_TOOL_MODULES
+
+
+def module_for_path(path: Path) -> Optional[str]:
+    path = Path(path).resolve()
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if filename and Path(filename).resolve() == path:
+            return name
+    return None
+
+
+def split_changes(changed: Iterable[Path]) -> Tuple[List[str], List[Path]]:
+    """Split changed files into reloadable module names and files that need a restart.
+
+    Files that were never imported are in neither list: their next import
+    already picks up the new code.
+    """
+    modules, others = [], []
+    for path in changed:
+        name = module_for_path(path)
+        if name is None:
+            continue
+        if is_reloadable(name):
+            modules.append(name)
+        else:
+            others.append(Path(path))
+    # Helpers first, so reloaded tool modules import their new versions.
+    modules.sort(key=lambda name: (name not in RELOADABLE_HELPERS, name))
+    return modules, others
+
+
+def _registry():
+    return sys.modules[f"{PACKAGE}.tools.registry"].registry
+
+
+def _rebind(replacements: Dict[int, object], extra_modules: Iterable[str] = ()) -> None:
+    """Point ``from x import y`` bindings in other modules at the reloaded objects."""
+    names = [name for name in sys.modules if name.startswith(PACKAGE)]
+    names.extend(["__main__", *extra_modules])
+    for name in names:
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for attr, value in list(vars(module).items()):
+            replacement = replacements.get(id(value))
+            if replacement is not None:
+                setattr(module, attr, replacement)
+
+
+def _import_fresh(name: str) -> types.ModuleType:
+    """Execute a module's current source into a new module object.
+
+    Unlike ``importlib.reload`` the old module keeps its own namespace, so
+    functions that are still running see the globals they started with.
+    """
+    old = sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, old.__file__)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules[name] = old
+        raise
+    parent, _, child = name.rpartition(".")
+    if parent in sys.modules:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def reload_modules(module_names: Iterable[str], extra_modules: Iterable[str] = ()) -> List[str]:
+    """Re-import stateless tool and helper modules while the process keeps running.
+
+    Tools a reloaded module registers replace the old registrations; calls
+    already running finish on the old code. If a module fails to import, its
+    old registrations are restored and the error is raised.
+    """
+    registry = _registry()
+    replacements: Dict[int, object] = {}
+    reloaded = []
+    for name in module_names:
+        old_module = sys.modules[name]
+        old_attrs = dict(vars(old_module))
+        owned = [tool for tool, owner in registry.modules.items() if owner == name]
+        saved = {
+            tool: (
+                registry.tools.get(tool),
+                registry.handlers.get(tool),
+                registry.priorities.get(tool),
+                registry.needs.get(tool),
+            )
+            for tool in owned
+        }
+        for tool in owned:
+            for table in (registry.tools, registry.handlers, registry.priorities, registry.needs):
+                table.pop(tool, None)
+            registry.modules.pop(tool, None)
+        try:
+            module = _import_fresh(name)
+        except BaseException:
+            for tool, (definition, handler, priority, needs) in saved.items():
+                registry.tools[tool] = definition
+                if handler is not None:
+                    registry.handlers[tool] = handler
+                registry.priorities[tool] = priority
+                registry.needs[tool] = needs
+                registry.modules[tool] = name
+            raise
+        for attr, old in old_attrs.items():
+            new = vars(module).get(attr)
+            if new is not None and new is not old and getattr(old, "__module__", None) == name:
+                replacements[id(old)] = new
+        replacements[id(old_module)] = module
+        reloaded.append(name)
+
+    _rebind(replacements, extra_modules)
+    return reloaded
+
+
+def _same_code(old: types.CodeType, new: types.CodeType) -> bool:
+    """Compare bytecode while ignoring line numbers, so edits elsewhere don't count."""
+    if old.co_code != new.co_code or old.co_names != new.co_names:
+        return False
+    if old.co_varnames != new.co_varnames or len(old.co_consts) != len(new.co_consts):
+        return False
+    for a, b in zip(old.co_consts, new.co_consts):
+        if isinstance(a, types.CodeType) and isinstance(b, types.CodeType):
+            if not _same_code(a, b):
+                return False
+        elif a != b:
+            return False
+    return True
+
+
+def reload_class(instance, path: Path, pinned_methods: Iterable[str]) -> bool:
+    """Re-execute ``path`` and move ``instance`` onto its new class.
+
+    Returns False without touching ``instance`` if any method in
+    ``pinned_methods`` changed; those hold the connection and need a restart.
+    """
+    global _reload_counter
+    cls = type(instance)
+    _reload_counter += 1
+    base_name = cls.__module__.split("_reload_")[0].strip("_").replace(".", "_")
+    spec = importlib.util.spec_from_file_location(
+        f"_{base_name}_reload_{_reload_counter}", path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    new_cls = getattr(module, cls.__name__)
+
+    for method in pinned_methods:
+        old = getattr(cls, method, None)
+        new = getattr(new_cls, method, None)
+        if old is None or new is None or not _same_code(old.__code__, new.__code__):
+            log_to_stderr(f"[RELOAD] {cls.__name__}.{method} changed; restart required")
+            return False
+
+    # Registered so later reloads can rebind names in it; only the newest
+    # reloaded copy is kept there.
+    sys.modules[spec.name] = module
+    if "_reload_" in cls.__module__:
+        sys.modules.pop(cls.__module__, None)
+    instance.__class__ = new_cls
+    return True
@@ -3,13 +3,24 @@ import os
 import sys
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from discord_py_self_mcp.bot import client
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource, ResourceLink
+from discord_py_self_mcp.daemon_client import (
+    DaemonClient,
+    DaemonResponseLost,
+    DaemonUnavailable,
+    daemon_mode,
+)
 from discord_py_self_mcp.logging_utils import log_to_stderr, mask_secret
+from discord_py_self_mcp.metrics import metrics_port, start_metrics_server
+from discord_py_self_mcp.progress import ProgressCallback, current_progress
 from discord_py_self_mcp.tools import registry
 
 app = Server("discord-selfbot-mcp")
 
+# Set when a running daemon serves tool calls for this process.
+daemon: DaemonClient | None = None
+_local_client_task: asyncio.Task | None = None
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -19,25 +30,144 @@ async def list_tools() -> list[Tool]:
 @app.call_tool()
 async def call_tool(
     name: str, arguments: dict
-) -> list[TextContent | ImageContent | EmbeddedResource]:
-    return await registry.call_tool(name, arguments)
+) -> list[TextContent | ImageContent | EmbeddedResource | ResourceLink]:
+    global daemon
+    priority = _request_meta("priority")
+    ready_timeout = _request_ready_timeout()
+    on_progress = _progress_sender()
+    if daemon is not None:
+        try:
+            return await daemon.call_tool(
+                name,
+                arguments,
+                priority=priority,
+                ready_timeout=ready_timeout,
+                on_progress=on_progress,
+            )
+        except DaemonResponseLost as exc:
+            # The daemon may have run the tool already; replaying it locally
+            # could send a message or add a reaction twice.
+            log_to_stderr(f"[DAEMON] {exc} during {name}; not retrying")
+            return [
+                TextContent(
+                    type="text",
+                    text=(
+                        f"Error calling {name}: {exc}. The daemon may have run it "
+                        "before the connection dropped, so it was not retried"
+                    ),
+                )
+            ]
+        except DaemonUnavailable as exc:
+            if daemon_mode() == "require":
+                raise
+            log_to_stderr(f"[DAEMON] {exc}; falling back to a local Discord connection")
+            daemon = None
+            _start_local_client()
+    token = current_progress.set(on_progress)
+    try:
+        return await registry.call_tool(
+            name, arguments, priority=priority, ready_timeout=ready_timeout
+        )
+    finally:
+        current_progress.reset(token)
 
 
-async def run_app():
+def _request_meta(key: str):
+    """A per-call override from the request's ``_meta`` (e.g. ``_meta.priority``)."""
+    try:
+        meta = app.request_context.meta
+    except LookupError:
+        return None
+    if meta is None or not meta.model_extra:
+        return None
+    return meta.model_extra.get(key)
+
+
+def _progress_sender() -> ProgressCallback | None:
+    """Progress notifications for the request, when it carries a progressToken."""
+    try:
+        context = app.request_context
+    except LookupError:
+        return None
+    progress_token = context.meta.progressToken if context.meta else None
+    if progress_token is None:
+        return None
+
+    async def send(progress: float, total: float | None, message: str | None) -> None:
+        await context.session.send_progress_notification(
+            progress_token,
+            progress,
+            total=total,
+            message=message,
+            related_request_id=str(context.request_id),
+        )
+
+    return send
+
+
+def _request_ready_timeout() -> float | None:
+    """Seconds to wait for the Discord connection, from ``_meta.ready_timeout``."""
+    value = _request_meta("ready_timeout")
+    try:
+        return None if value is None else max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _start_local_client() -> None:
+    """Open this process's own gateway session (used when no daemon serves it)."""
+    global _local_client_task
     token = os.getenv("DISCORD_TOKEN")
-    if not token:
+    if token and _local_client_task is None:
+        # Imported here so daemon-backed sessions never load discord.py.
+        from discord_py_self_mcp.bot import client
+
+        _local_client_task = asyncio.create_task(client.start(token))
+
+
+async def _connect_daemon() -> DaemonClient | None:
+    mode = daemon_mode()
+    if mode == "off":
+        return None
+
+    candidate = DaemonClient()
+    if await candidate.ping():
+        log_to_stderr(f"[DAEMON] Forwarding tool calls to daemon at {candidate.socket_path}")
+        return candidate
+
+    if mode == "require":
         sys.stderr.write(
-            "Error: DISCORD_TOKEN is not set. Configure it in your MCP client or run "
-            "`discord-py-self-mcp-setup`.\n"
+            "Error: MCP_DAEMON_MODE=require but no daemon is listening on "
+            f"{candidate.socket_path}. Start it with `python3 scripts/daemon.py start`.\n"
         )
         raise SystemExit(1)
+    return None
+
+
+async def run_app():
+    global daemon
+    daemon = await _connect_daemon()
+
+    if daemon is None:
+        token = os.getenv("DISCORD_TOKEN")
+        if not token:
+            sys.stderr.write(
+                "Error: DISCORD_TOKEN is not set. Configure it in your MCP client or run "
+                "`discord-py-self-mcp-setup`.\n"
+            )
+            raise SystemExit(1)
+
+        log_to_stderr("[STARTUP] Starting Discord connection")
+        log_to_stderr(f"[STARTUP] DISCORD_TOKEN: {mask_secret(token)}")
 
-    log_to_stderr("[STARTUP] Starting Discord connection")
-    log_to_stderr(f"[STARTUP] DISCORD_TOKEN: {mask_secret(token)}")
+        # Start Discord client in background
+        # We don't await it so it doesn't block the MCP server
+        _start_local_client()
 
-    # Start Discord client in background
-    # We don't await it so it doesn't block the MCP server
-    asyncio.create_task(client.start(token))
+        # A daemon serves its own metrics endpoint for the calls it runs.
+        port = metrics_port()
+        if port is not None:
+            await start_metrics_server(registry.metrics, port)
 
     async with stdio_server() as (read_stream, write_stream):
         await app.run(read_stream, write_stream, app.create_initialization_options())
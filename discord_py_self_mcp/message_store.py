@@ -0,0 +1,326 @@
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from discord_py_self_mcp.cli_runtime import APP_NAME
+
+_DEFAULT_STATE_DIR = Path.home() / ".local" / "state" / APP_NAME
+
+# Trigram FTS needs at least three characters to build a match expression;
+# shorter queries use a LIKE scan restricted to the channel index instead.
+MIN_FTS_QUERY_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    channel_id INTEGER NOT NULL,
+    guild_id INTEGER,
+    author_id INTEGER,
+    created_at TEXT,
+    line TEXT NOT NULL,
+    search_text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_channel_idx ON messages(channel_id, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    search_text,
+    content='messages',
+    content_rowid='id',
+    tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, search_text) VALUES (new.id, new.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, search_text)
+    VALUES ('delete', old.id, old.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, search_text)
+    VALUES ('delete', old.id, old.search_text);
+    INSERT INTO messages_fts(rowid, search_text) VALUES (new.id, new.search_text);
+END;
+CREATE TABLE IF NOT EXISTS coverage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel_id INTEGER NOT NULL,
+    first_id INTEGER NOT NULL,
+    last_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coverage_channel_idx ON coverage(channel_id, last_id);
+"""
+
+
+def default_store_path() -> Path:
+    base = os.getenv("XDG_STATE_HOME")
+    if base:
+        return Path(base) / APP_NAME / "messages.db"
+    return _DEFAULT_STATE_DIR / "messages.db"
+
+
+@dataclass
+class MessageStoreConfig:
+    enabled: bool = False
+    path: Path = _DEFAULT_STATE_DIR / "messages.db"
+
+
+@dataclass
+class StoredRecord:
+    id: int
+    channel_id: int
+    guild_id: Optional[int]
+    author_id: Optional[int]
+    created_at: Optional[str]
+    line: str
+    search_text: str
+
+
+def record_from_message(message) -> StoredRecord:
+    # Imported lazily: the tools package imports bot.py, which owns the store.
+    from discord_py_self_mcp.tools.embed import build_search_text, format_message_line
+
+    guild = getattr(message, "guild", None)
+    author = getattr(message, "author", None)
+    created_at = getattr(message, "created_at", None)
+    return StoredRecord(
+        id=int(message.id),
+        channel_id=int(message.channel.id),
+        guild_id=guild.id if guild else None,
+        author_id=author.id if author else None,
+        created_at=created_at.isoformat() if created_at else None,
+        line=format_message_line(message),
+        search_text=build_search_text(message),
+    )
+
+
+class MessageStore:
+    """On-disk message index fed by gateway events.
+
+    Coverage is tracked as contiguous ``[first_id, last_id]`` ranges per
+    channel. The range opened by gateway ingestion during this session is
+    "live": every newer message in that channel is known to the store, so
+    searches can answer from the index and only scan history below it.
+    """
+
+    def __init__(self, config: Optional[MessageStoreConfig] = None):
+        self.config = config or self._load_from_env()
+        self._live_ranges: dict[int, int] = {}
+        self._db: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def _load_from_env(cls) -> MessageStoreConfig:
+        path = os.getenv("MESSAGE_STORE_PATH")
+        return MessageStoreConfig(
+            enabled=os.getenv("MESSAGE_STORE_ENABLED", "false").lower() == "true",
+            path=Path(path).expanduser() if path else default_store_path(),
+        )
+
+    def is_enabled(self) -> bool:
+        return self.config.enabled
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = self._open()
+        return self._db
+
+    def _open(self) -> sqlite3.Connection:
+        path = Path(self.config.path)
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path))
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(_SCHEMA)
+        return db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def reset_live(self) -> None:
+        """Forget live ranges after a gateway session without resume.
+
+        Events may have been missed while disconnected, so the existing
+        ranges are kept as closed ranges and new events open fresh ones.
+        """
+        self._live_ranges.clear()
+
+    def live_since(self, channel_id: int) -> Optional[int]:
+        range_id = self._live_ranges.get(channel_id)
+        if range_id is None:
+            return None
+        row = self.db.execute(
+            "SELECT first_id FROM coverage WHERE id = ?", (range_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _upsert(self, record: StoredRecord) -> None:
+        self.db.execute(
+            "INSERT INTO messages (id, channel_id, guild_id, author_id, created_at, line, search_text) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET line = excluded.line, "
+            "search_text = excluded.search_text",
+            (
+                record.id,
+                record.channel_id,
+                record.guild_id,
+                record.author_id,
+                record.created_at,
+                record.line,
+                record.search_text,
+            ),
+        )
+
+    def add_message(self, message) -> None:
+        """Ingest a message delivered by the gateway (``on_message``)."""
+        record = record_from_message(message)
+        with self.db:
+            self._upsert(record)
+            range_id = self._live_ranges.get(record.channel_id)
+            if range_id is None:
+                cursor = self.db.execute(
+                    "INSERT INTO coverage (channel_id, first_id, last_id) VALUES (?, ?, ?)",
+                    (record.channel_id, record.id, record.id),
+                )
+                self._live_ranges[record.channel_id] = cursor.lastrowid
+            else:
+                self.db.execute(
+                    "UPDATE coverage SET last_id = MAX(last_id, ?) WHERE id = ?",
+                    (record.id, range_id),
+                )
+
+    def update_message(self, message) -> None:
+        """Refresh the indexed text of an edited message we already hold."""
+        record = record_from_message(message)
+        with self.db:
+            self.db.execute(
+                "UPDATE messages SET line = ?, search_text = ? WHERE id = ?",
+                (record.line, record.search_text, record.id),
+            )
+
+    def delete_messages(self, message_ids: Iterable[int]) -> None:
+        with self.db:
+            self.db.executemany(
+                "DELETE FROM messages WHERE id = ?",
+                [(int(message_id),) for message_id in message_ids],
+            )
+
+    def find_range(self, channel_id: int, message_id: int) -> Optional[tuple[int, int, int]]:
+        """Return ``(range_id, first_id, last_id)`` of a range containing the id."""
+        return self.db.execute(
+            "SELECT id, first_id, last_id FROM coverage "
+            "WHERE channel_id = ? AND first_id <= ? AND last_id >= ? "
+            "ORDER BY last_id DESC LIMIT 1",
+            (channel_id, message_id, message_id),
+        ).fetchone()
+
+    def add_history(
+        self,
+        channel_id: int,
+        messages: list,
+        *,
+        before_id: Optional[int] = None,
+        bridge_range_id: Optional[int] = None,
+    ) -> Optional[int]:
+        """Store a contiguous newest-first history scan and extend coverage.
+
+        ``before_id`` is the exclusive upper bound the scan started from:
+        ``None`` means it started at the newest message, otherwise it must be
+        the first id of this channel's live range. When the scan stopped at an
+        existing closed range, ``bridge_range_id`` merges that range in too.
+        Returns the new first id of the live range.
+        """
+        if not messages and bridge_range_id is None:
+            return self.live_since(channel_id)
+
+        records = [record_from_message(message) for message in messages]
+        with self.db:
+            for record in records:
+                self._upsert(record)
+
+            ids = [record.id for record in records]
+            first_id = min(ids) if ids else before_id
+            last_id = max(ids) if ids else before_id
+
+            if bridge_range_id is not None:
+                bridged = self.db.execute(
+                    "SELECT first_id, last_id FROM coverage WHERE id = ?",
+                    (bridge_range_id,),
+                ).fetchone()
+                if bridged:
+                    first_id = min(first_id, bridged[0]) if first_id else bridged[0]
+                    last_id = max(last_id, bridged[1]) if last_id else bridged[1]
+
+            range_id = self._live_ranges.get(channel_id)
+            if range_id is None:
+                cursor = self.db.execute(
+                    "INSERT INTO coverage (channel_id, first_id, last_id) VALUES (?, ?, ?)",
+                    (channel_id, first_id, last_id),
+                )
+                range_id = cursor.lastrowid
+                self._live_ranges[channel_id] = range_id
+            else:
+                self.db.execute(
+                    "UPDATE coverage SET first_id = MIN(first_id, ?), "
+                    "last_id = MAX(last_id, ?) WHERE id = ?",
+                    (first_id, last_id, range_id),
+                )
+
+            if bridge_range_id is not None and bridge_range_id != range_id:
+                self.db.execute("DELETE FROM coverage WHERE id = ?", (bridge_range_id,))
+
+        return self.live_since(channel_id)
+
+    def search(
+        self,
+        channel_id: int,
+        query: str,
+        limit: int,
+        *,
+        min_id: int = 0,
+        max_id: Optional[int] = None,
+    ) -> list[str]:
+        """Return formatted lines of matching messages, newest first."""
+        return [
+            record["line"]
+            for record in self.search_records(
+                channel_id, query, limit, min_id=min_id, max_id=max_id
+            )
+        ]
+
+    def search_records(
+        self,
+        channel_id: int,
+        query: str,
+        limit: int,
+        *,
+        min_id: int = 0,
+        max_id: Optional[int] = None,
+    ) -> list[dict]:
+        """Like ``search``, with the stored id, author id and timestamp of each line."""
+        query = query.lower()
+        upper = max_id if max_id is not None else (1 << 63) - 1
+        if len(query) >= MIN_FTS_QUERY_LENGTH:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = self.db.execute(
+                "SELECT m.id, m.author_id, m.created_at, m.line "
+                "FROM messages_fts f JOIN messages m ON m.id = f.rowid "
+                "WHERE messages_fts MATCH ? AND m.channel_id = ? "
+                "AND m.id >= ? AND m.id <= ? ORDER BY m.id DESC LIMIT ?",
+                (phrase, channel_id, min_id, upper, limit),
+            ).fetchall()
+        else:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            rows = self.db.execute(
+                "SELECT id, author_id, created_at, line FROM messages "
+                "WHERE channel_id = ? AND id >= ? AND id <= ? "
+                "AND search_text LIKE ? ESCAPE '\\' ORDER BY id DESC LIMIT ?",
+                (channel_id, min_id, upper, f"%{escaped}%", limit),
+            ).fetchall()
+        return [
+            {"id": row[0], "author_id": row[1], "created_at": row[2], "line": row[3]}
+            for row in rows
+        ]
+
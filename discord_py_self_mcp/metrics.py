@@ -0,0 +1,250 @@
+import asyncio
+import bisect
+import contextvars
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+METRIC_PREFIX = "discord_mcp"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with percentile estimates."""
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0-1) by interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+
+@dataclass
+class CallTiming:
+    """Time one tool call spends outside its own code, filled in as it runs."""
+
+    rate_limit_wait: float = 0.0
+    http: float = 0.0
+
+
+@dataclass
+class ToolMetrics:
+    calls: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    ready_wait_seconds: float = 0.0
+    max_ready_wait_seconds: float = 0.0
+    rate_limit_wait_seconds: float = 0.0
+    http_seconds: float = 0.0
+    response_bytes: int = 0
+
+    def snapshot(self) -> dict:
+        latency = self.latency
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_seconds": {
+                "p50": round(latency.percentile(0.50), 4),
+                "p95": round(latency.percentile(0.95), 4),
+                "p99": round(latency.percentile(0.99), 4),
+                "max": round(latency.max, 4),
+                "total": round(latency.sum, 4),
+            },
+            "ready_wait_seconds": round(self.ready_wait_seconds, 4),
+            "max_ready_wait_seconds": round(self.max_ready_wait_seconds, 4),
+            "rate_limit_wait_seconds": round(self.rate_limit_wait_seconds, 4),
+            "http_seconds": round(self.http_seconds, 4),
+            "response_bytes": self.response_bytes,
+        }
+
+
+current_call: contextvars.ContextVar[Optional[CallTiming]] = contextvars.ContextVar(
+    "current_call", default=None
+)
+
+
+def add_rate_limit_wait(seconds: float) -> None:
+    timing = current_call.get()
+    if timing is not None:
+        timing.rate_limit_wait += seconds
+
+
+def add_http_time(seconds: float) -> None:
+    timing = current_call.get()
+    if timing is not None:
+        timing.http += seconds
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class ServerMetrics:
+    """Per-tool call counters and latency histograms for one process."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.tools: Dict[str, ToolMetrics] = {}
+
+    def record_call(
+        self,
+        name: str,
+        *,
+        elapsed: float,
+        error: bool = False,
+        ready_wait: float = 0.0,
+        timing: Optional[CallTiming] = None,
+        response_bytes: int = 0,
+    ) -> None:
+        tool = self.tools.setdefault(name, ToolMetrics())
+        tool.calls += 1
+        tool.errors += int(error)
+        tool.latency.observe(elapsed)
+        tool.ready_wait_seconds += ready_wait
+        tool.max_ready_wait_seconds = max(tool.max_ready_wait_seconds, ready_wait)
+        if timing is not None:
+            tool.rate_limit_wait_seconds += timing.rate_limit_wait
+            tool.http_seconds += timing.http
+        tool.response_bytes += response_bytes
+
+    def snapshot(self, tool: Optional[str] = None) -> dict:
+        names = [tool] if tool else sorted(self.tools)
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "calls": sum(item.calls for item in self.tools.values()),
+            "errors": sum(item.errors for item in self.tools.values()),
+            "tools": {
+                name: self.tools[name].snapshot() for name in names if name in self.tools
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str, samples) -> None:
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for tool_name, value in samples:
+                lines.append(f'{metric}{{tool="{_escape_label(tool_name)}"}} {value}')
+
+        items = sorted(self.tools.items())
+        family("tool_calls_total", "counter", "Tool calls.", [(n, t.calls) for n, t in items])
+        family(
+            "tool_errors_total",
+            "counter",
+            "Tool calls that raised or returned an error.",
+            [(n, t.errors) for n, t in items],
+        )
+
+        metric = f"{METRIC_PREFIX}_tool_duration_seconds"
+        lines.append(f"# HELP {metric} Tool call latency.")
+        lines.append(f"# TYPE {metric} histogram")
+        for tool_name, tool in items:
+            label = _escape_label(tool_name)
+            cumulative = 0
+            for bound, count in zip(tool.latency.bounds + ("+Inf",), tool.latency.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{tool="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{tool="{label}"}} {tool.latency.sum}')
+            lines.append(f'{metric}_count{{tool="{label}"}} {tool.latency.count}')
+
+        family(
+            "tool_ready_wait_seconds_total",
+            "counter",
+            "Time tool calls waited for the Discord connection.",
+            [(n, t.ready_wait_seconds) for n, t in items],
+        )
+        family(
+            "tool_rate_limit_wait_seconds_total",
+            "counter",
+            "Time tool calls waited in apply_rate_limit.",
+            [(n, t.rate_limit_wait_seconds) for n, t in items],
+        )
+        family(
+            "tool_http_seconds_total",
+            "counter",
+            "Time tool calls spent in Discord HTTP requests.",
+            [(n, t.http_seconds) for n, t in items],
+        )
+        family(
+            "tool_response_bytes_total",
+            "counter",
+            "Serialized size of tool results.",
+            [(n, t.response_bytes) for n, t in items],
+        )
+        return "\n".join(lines) + "\n"
+
+
+def metrics_port() -> Optional[int]:
+    value = os.getenv("METRICS_PORT", "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        log_to_stderr(f"[METRICS] Ignoring invalid METRICS_PORT={value!r}")
+        return None
+
+
+async def start_metrics_server(
+    metrics: ServerMetrics, port: int, host: Optional[str] = None
+) -> asyncio.AbstractServer:
+    """Serve ``GET /metrics`` in the Prometheus text format on a local port."""
+    host = host or os.getenv("METRICS_HOST", "127.0.0.1")
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), 5)
+            while (await asyncio.wait_for(reader.readline(), 5)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", metrics.render_prometheus().encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status, body, content_type = "404 Not Found", b"not found\n", "text/plain"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    log_to_stderr(f"[METRICS] Serving Prometheus metrics on http://{host}:{port}/metrics")
+    return server
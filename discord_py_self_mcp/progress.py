@@ -0,0 +1,25 @@
+import contextvars
+from typing import Awaitable, Callable, Optional
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+# Set for the duration of a tool call whose caller asked for progress updates
+# (an MCP progressToken, or a streaming daemon request).
+current_progress: contextvars.ContextVar[Optional[ProgressCallback]] = contextvars.ContextVar(
+    "current_progress", default=None
+)
+
+
+async def report_progress(
+    progress: float, total: Optional[float] = None, message: Optional[str] = None
+) -> None:
+    """Send a progress update for the running tool call, if anyone listens."""
+    callback = current_progress.get()
+    if callback is None:
+        return
+    try:
+        await callback(progress, total, message)
+    except Exception as exc:
+        log_to_stderr(f"[PROGRESS] Could not send progress update: {exc}")
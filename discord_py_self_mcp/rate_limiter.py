@@ -1,10 +1,13 @@
 import os
 import time
 import asyncio
-from typing import Dict, Optional, Any
+from collections import deque
+from contextvars import ContextVar
+from typing import Deque, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from discord_py_self_mcp.logging_utils import log_to_stderr
+from discord_py_self_mcp.route_limits import RouteBucketRegistry, RouteSpec
 
 
 @dataclass
@@ -14,19 +17,117 @@ class RateLimitConfig:
     messages_per_second: int = 1
     actions_per_minute: int = 5
     cooldown_on_limit: int = 60
+    # Seconds of queueing that promote a waiter by one priority lane.
+    priority_aging: float = 10.0
+
+
+# Lanes in admission order. Tools pick a default lane at registration; callers
+# may override it per request.
+PRIORITY_LANES = ("interactive", "normal", "background")
+DEFAULT_PRIORITY = "normal"
+
+current_priority: ContextVar[str] = ContextVar("current_priority", default=DEFAULT_PRIORITY)
+
+
+def normalize_priority(priority: Optional[str]) -> str:
+    if priority is None:
+        return DEFAULT_PRIORITY
+    normalized = str(priority).strip().lower()
+    if normalized not in PRIORITY_LANES:
+        raise ValueError(
+            f"Unknown priority '{priority}'. Expected one of: {', '.join(PRIORITY_LANES)}"
+        )
+    return normalized
+
+
+class _Gcra:
+    """Generic cell rate algorithm state for a ``rate`` per ``period`` limit.
+
+    Equivalent to a token bucket holding ``rate`` tokens that refills over
+    ``period``, but stored as a single theoretical arrival time so checking
+    and consuming are constant time.
+    """
+
+    __slots__ = ("interval", "tolerance", "tat")
+
+    def __init__(self, rate: float, period: float, *, burst: bool = True):
+        rate = max(rate, 1)
+        self.interval = period / rate
+        self.tolerance = period - self.interval if burst else 0.0
+        self.tat = 0.0
+
+    def ready_at(self) -> float:
+        return self.tat - self.tolerance
+
+    def consume(self, now: float) -> None:
+        self.tat = max(self.tat, now) + self.interval
+
+
+class _RecentCounter:
+    """Admissions in the trailing window, kept in one-second slots for stats."""
+
+    __slots__ = ("window", "counts", "stamps")
+
+    def __init__(self, window: int = 60):
+        self.window = window
+        self.counts = [0] * window
+        self.stamps = [-1] * window
+
+    def add(self, now: float) -> None:
+        second = int(now)
+        slot = second % self.window
+        if self.stamps[slot] != second:
+            self.stamps[slot] = second
+            self.counts[slot] = 0
+        self.counts[slot] += 1
+
+    def count(self, now: float) -> int:
+        second = int(now)
+        return sum(
+            count
+            for count, stamp in zip(self.counts, self.stamps)
+            if 0 <= second - stamp < self.window
+        )
 
 
 class RateLimiter:
+    ACTION_TYPES = ("message", "action")
+
     def __init__(self, config: Optional[RateLimitConfig] = None):
         self.config = config or self._load_from_env()
 
-        self._message_timestamps: list = []
-        self._action_timestamps: list = []
         self._cooldown_until: float = 0
-        self._lock = asyncio.Lock()
-
-        self._last_action_time: float = 0
         self._min_action_interval: float = 1.0
+        self._build_buckets()
+        self.routes = RouteBucketRegistry()
+
+        # Per action type, one FIFO per priority lane of (future, enqueued_at).
+        self._waiters: Dict[str, Dict[str, Deque[Tuple[asyncio.Future, float]]]] = {
+            action_type: {lane: deque() for lane in PRIORITY_LANES}
+            for action_type in self.ACTION_TYPES
+        }
+        self._lane_waits: Dict[str, Dict[str, float]] = {
+            lane: {"admitted": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for lane in PRIORITY_LANES
+        }
+        self._dispatchers: Dict[str, Optional[asyncio.Task]] = {
+            action_type: None for action_type in self.ACTION_TYPES
+        }
+
+    def _build_buckets(self) -> None:
+        # Minute buckets trigger the cooldown when exhausted; the short
+        # buckets only pace admissions, as the per-second/interval checks did.
+        self._minute_buckets = {
+            "message": _Gcra(self.config.messages_per_minute, 60),
+            "action": _Gcra(self.config.actions_per_minute, 60),
+        }
+        self._pacing_buckets = {
+            "message": _Gcra(self.config.messages_per_second, 1),
+            "action": _Gcra(1, self._min_action_interval, burst=False),
+        }
+        self._recent = {
+            action_type: _RecentCounter(60) for action_type in self.ACTION_TYPES
+        }
 
     @classmethod
     def _load_from_env(cls) -> RateLimitConfig:
@@ -36,102 +137,169 @@ class RateLimiter:
             messages_per_second=int(os.getenv("RATE_LIMIT_MESSAGES_PER_SECOND", "1")),
             actions_per_minute=int(os.getenv("RATE_LIMIT_ACTIONS_PER_MINUTE", "5")),
             cooldown_on_limit=int(os.getenv("RATE_LIMIT_COOLDOWN", "60")),
+            priority_aging=float(os.getenv("RATE_LIMIT_PRIORITY_AGING", "10")),
         )
 
     def is_enabled(self) -> bool:
         return self.config.enabled
 
     def get_cooldown_remaining(self) -> int:
-        remaining = self._cooldown_until - time.time()
+        remaining = self._cooldown_until - time.monotonic()
         return max(0, int(remaining))
 
-    async def wait_if_needed(self, action_type: str = "message"):
-        if not self.is_enabled():
+    async def wait_if_needed(
+        self,
+        action_type: str = "message",
+        route: Optional[RouteSpec] = None,
+        priority: Optional[str] = None,
+    ):
+        if not self.is_enabled() or action_type not in self._waiters:
+            return
+
+        lane = normalize_priority(priority or current_priority.get())
+
+        if route is not None:
+            # Wait out an exhausted Discord bucket before joining the shared
+            # queue, so one busy route does not hold up unrelated calls.
+            await self.routes.acquire(*route)
+
+        lanes = self._waiters[action_type]
+        now = time.monotonic()
+        if not any(lanes.values()) and self._admission_delay(action_type, now) <= 0:
+            self._admit(action_type, now)
+            self._record_wait(lane, 0.0)
             return
 
-        async with self._lock:
-            while True:
-                now = time.time()
-
-                if now < self._cooldown_until:
-                    await asyncio.sleep(self._cooldown_until - now)
-                    continue
-
-                if action_type == "message":
-                    self._clean_timestamps(self._message_timestamps, 60)
-
-                    msg_in_minute = len(self._message_timestamps)
-                    msg_in_second = sum(
-                        1 for timestamp in self._message_timestamps if now - timestamp < 1
-                    )
-
-                    if msg_in_minute >= self.config.messages_per_minute:
-                        self._trigger_cooldown(
-                            f"Message rate limit reached ({self.config.messages_per_minute}/min)"
-                        )
-                        continue
-
-                    if msg_in_second >= self.config.messages_per_second:
-                        sleep_time = max(
-                            0.0,
-                            1.0 - (now - self._message_timestamps[-1]),
-                        )
-                        if sleep_time:
-                            await asyncio.sleep(sleep_time)
-                        continue
-
-                    self._message_timestamps.append(time.time())
-                    return
-
-                if action_type == "action":
-                    self._clean_timestamps(self._action_timestamps, 60)
-                    action_in_minute = len(self._action_timestamps)
-
-                    if action_in_minute >= self.config.actions_per_minute:
-                        self._trigger_cooldown(
-                            f"Action rate limit reached ({self.config.actions_per_minute}/min)"
-                        )
-                        continue
-
-                    time_since_last = now - self._last_action_time
-                    if time_since_last < self._min_action_interval:
-                        await asyncio.sleep(self._min_action_interval - time_since_last)
-                        continue
-
-                    now = time.time()
-                    self._action_timestamps.append(now)
-                    self._last_action_time = now
-                    return
+        # Queue behind earlier callers; a single dispatcher per action type
+        # admits waiters by lane and sleeps on their behalf, so no lock is
+        # held while waiting.
+        waiter = asyncio.get_running_loop().create_future()
+        lanes[lane].append((waiter, now))
+        dispatcher = self._dispatchers[action_type]
+        if dispatcher is None or dispatcher.done():
+            self._dispatchers[action_type] = asyncio.create_task(
+                self._dispatch(action_type)
+            )
+        await waiter
+
+    def _next_lane(self, action_type: str, now: float) -> Optional[str]:
+        """Pick the lane whose head is admitted next.
+
+        Each lane ranks by its position in ``PRIORITY_LANES``; every
+        ``priority_aging`` seconds a head has waited lifts it one lane, so
+        background work is delayed by interactive bursts but never starved.
+        Ties go to the earlier arrival.
+        """
+        best_lane = None
+        best_key = None
+        aging = self.config.priority_aging
+        for rank, lane in enumerate(PRIORITY_LANES):
+            queue = self._waiters[action_type][lane]
+            while queue and queue[0][0].done():
+                # Cancelled while queued.
+                queue.popleft()
+            if not queue:
+                continue
+            enqueued_at = queue[0][1]
+            score = rank - (now - enqueued_at) / aging if aging > 0 else rank
+            key = (score, enqueued_at)
+            if best_key is None or key < best_key:
+                best_lane, best_key = lane, key
+        return best_lane
 
+    async def _dispatch(self, action_type: str) -> None:
+        lanes = self._waiters[action_type]
+        while True:
+            now = time.monotonic()
+            lane = self._next_lane(action_type, now)
+            if lane is None:
                 return
 
-    def _clean_timestamps(self, timestamps: list, window: int):
-        now = time.time()
-        timestamps[:] = [t for t in timestamps if now - t < window]
+            delay = self._admission_delay(action_type, now)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            waiter, enqueued_at = lanes[lane].popleft()
+            self._admit(action_type, now)
+            self._record_wait(lane, now - enqueued_at)
+            waiter.set_result(None)
+
+    def _admission_delay(self, action_type: str, now: float) -> float:
+        if now < self._cooldown_until:
+            return self._cooldown_until - now
+
+        if self._minute_buckets[action_type].ready_at() > now:
+            if action_type == "message":
+                reason = f"Message rate limit reached ({self.config.messages_per_minute}/min)"
+            else:
+                reason = f"Action rate limit reached ({self.config.actions_per_minute}/min)"
+            self._trigger_cooldown(reason, now)
+            return self._cooldown_until - now
+
+        return max(0.0, self._pacing_buckets[action_type].ready_at() - now)
+
+    def _admit(self, action_type: str, now: float) -> None:
+        self._minute_buckets[action_type].consume(now)
+        self._pacing_buckets[action_type].consume(now)
+        self._recent[action_type].add(now)
+
+    def _record_wait(self, lane: str, waited: float) -> None:
+        stats = self._lane_waits[lane]
+        stats["admitted"] += 1
+        stats["total_wait"] += waited
+        stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def _lane_stats(self, now: float) -> Dict[str, Dict[str, Any]]:
+        lanes = {}
+        for lane in PRIORITY_LANES:
+            queued = [
+                entry
+                for action_type in self.ACTION_TYPES
+                for entry in self._waiters[action_type][lane]
+                if not entry[0].done()
+            ]
+            waits = self._lane_waits[lane]
+            admitted = int(waits["admitted"])
+            lanes[lane] = {
+                "queued": len(queued),
+                "oldest_wait": round(max((now - entry[1] for entry in queued), default=0.0), 3),
+                "admitted": admitted,
+                "avg_wait": round(waits["total_wait"] / admitted, 3) if admitted else 0.0,
+                "max_wait": round(waits["max_wait"], 3),
+            }
+        return lanes
+
+    def _queued(self, action_type: str) -> int:
+        return sum(len(queue) for queue in self._waiters[action_type].values())
 
-    def _trigger_cooldown(self, reason: str):
-        self._cooldown_until = time.time() + self.config.cooldown_on_limit
+    def _trigger_cooldown(self, reason: str, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        self._cooldown_until = now + self.config.cooldown_on_limit
         log_to_stderr(
             f"[RATE_LIMIT] Cooldown triggered: {reason}. Cooldown for {self.config.cooldown_on_limit}s"
         )
 
     def reset(self):
-        self._message_timestamps.clear()
-        self._action_timestamps.clear()
+        self._build_buckets()
         self._cooldown_until = 0
 
     def get_stats(self) -> Dict[str, Any]:
-        self._clean_timestamps(self._message_timestamps, 60)
-        self._clean_timestamps(self._action_timestamps, 60)
+        now = time.monotonic()
         return {
             "enabled": self.is_enabled(),
             "cooldown_remaining": self.get_cooldown_remaining(),
-            "messages_last_minute": len(self._message_timestamps),
-            "actions_last_minute": len(self._action_timestamps),
+            "messages_last_minute": self._recent["message"].count(now),
+            "actions_last_minute": self._recent["action"].count(now),
+            "queued_messages": self._queued("message"),
+            "queued_actions": self._queued("action"),
+            "lanes": self._lane_stats(now),
+            "route_buckets": self.routes.get_stats(),
             "config": {
                 "messages_per_minute": self.config.messages_per_minute,
                 "messages_per_second": self.config.messages_per_second,
                 "actions_per_minute": self.config.actions_per_minute,
+                "priority_aging": self.config.priority_aging,
             },
         }
 
@@ -0,0 +1,106 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+
+# What a tool needs before it can run: nothing (local tools), a logged-in
+# HTTP session (REST calls and ``client.user``), or the gateway READY cache.
+READINESS_LEVELS = ("none", "rest", "gateway")
+DEFAULT_READINESS = "gateway"
+DEFAULT_READY_TIMEOUT = 30.0
+
+
+class NotReady(Exception):
+    """The Discord connection did not reach the level a tool needs."""
+
+
+def normalize_readiness(level: Optional[str]) -> str:
+    value = (level or DEFAULT_READINESS).strip().lower()
+    if value not in READINESS_LEVELS:
+        raise ValueError(
+            f"Unknown readiness level '{level}'. Expected one of: {', '.join(READINESS_LEVELS)}"
+        )
+    return value
+
+
+def default_ready_timeout() -> float:
+    try:
+        return max(0.0, float(os.getenv("TOOL_READY_TIMEOUT", str(DEFAULT_READY_TIMEOUT))))
+    except ValueError:
+        return DEFAULT_READY_TIMEOUT
+
+
+class Readiness:
+    """Tracks how far the Discord client has come since ``start()``.
+
+    Nothing is gated until :meth:`begin` is called, so processes that never
+    start a client (tests, daemon thin clients) run tools immediately.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.error: Optional[str] = None
+        self._reached: set[str] = set()
+        self._waiters: list[tuple[str, asyncio.Future]] = []
+
+    def begin(self) -> None:
+        self.active = True
+        self.error = None
+        self._reached.clear()
+
+    def is_ready(self, level: str) -> bool:
+        return not self.active or level == "none" or level in self._reached
+
+    def mark(self, level: str) -> None:
+        """Record that ``level`` (and every level below it) is reached."""
+        rank = READINESS_LEVELS.index(level)
+        self._reached.update(READINESS_LEVELS[1 : rank + 1])
+        self._wake()
+
+    def fail(self, error: str) -> None:
+        """The client stopped before becoming ready; waiters give up now."""
+        self.error = error
+        self._wake()
+
+    def _wake(self) -> None:
+        pending = []
+        for level, future in self._waiters:
+            if future.done():
+                continue
+            if self.is_ready(level):
+                future.set_result(None)
+            elif self.error is not None:
+                future.set_exception(NotReady(f"Discord login failed: {self.error}"))
+            else:
+                pending.append((level, future))
+        self._waiters = pending
+
+    async def wait(self, level: str, timeout: Optional[float] = None) -> float:
+        """Wait until ``level`` is reached; returns the seconds spent waiting."""
+        if self.is_ready(level):
+            return 0.0
+        if self.error is not None:
+            raise NotReady(f"Discord login failed: {self.error}")
+
+        timeout = default_ready_timeout() if timeout is None else timeout
+        started = time.monotonic()
+        waiter = (level, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            raise NotReady(
+                f"Discord connection is not ready yet (waited {timeout:g}s for {level}). "
+                "Please try again in a few seconds."
+            ) from None
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        waited = time.monotonic() - started
+        log_to_stderr(f"[READY] Waited {waited:.2f}s for {level}")
+        return waited
+
+
+readiness = Readiness()
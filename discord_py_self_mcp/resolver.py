@@ -0,0 +1,209 @@
+import asyncio
+import os
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+DEFAULT_CHANNEL_TTL = 300.0
+DEFAULT_USER_TTL = 600.0
+DEFAULT_MEMBER_TTL = 300.0
+DEFAULT_MESSAGE_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 2000
+
+
+@dataclass
+class ResolverConfig:
+    enabled: bool = True
+    channel_ttl: float = DEFAULT_CHANNEL_TTL
+    user_ttl: float = DEFAULT_USER_TTL
+    member_ttl: float = DEFAULT_MEMBER_TTL
+    message_ttl: float = DEFAULT_MESSAGE_TTL
+    max_entries: int = DEFAULT_MAX_ENTRIES
+
+
+class TTLCache:
+    """Bounded LRU of fetched objects with a time-to-live and single-flight fetches."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        # A fetch already in flight may return the old state; don't store it.
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark it retrieved so an unshared failure is not logged by asyncio.
+            future.exception()
+            raise
+        else:
+            if value is not None and self._inflight.get(key) is future:
+                self.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class Resolver:
+    """Channel, user, member and message lookups shared by every tool.
+
+    The client's gateway cache is checked first; objects that had to be
+    fetched over REST are kept for a TTL, concurrent lookups of the same id
+    share one request, and gateway update/delete events evict entries.
+    """
+
+    def __init__(self, client, config: Optional[ResolverConfig] = None):
+        self.client = client
+        self.config = config or self._load_from_env()
+        max_entries = self.config.max_entries
+        self._channels = TTLCache(self.config.channel_ttl, max_entries)
+        self._users = TTLCache(self.config.user_ttl, max_entries)
+        self._members = TTLCache(self.config.member_ttl, max_entries)
+        self._messages = TTLCache(self.config.message_ttl, max_entries)
+
+    @classmethod
+    def _load_from_env(cls) -> ResolverConfig:
+        return ResolverConfig(
+            enabled=os.getenv("RESOLVER_CACHE_ENABLED", "true").lower() == "true",
+            channel_ttl=float(os.getenv("RESOLVER_CHANNEL_TTL", str(DEFAULT_CHANNEL_TTL))),
+            user_ttl=float(os.getenv("RESOLVER_USER_TTL", str(DEFAULT_USER_TTL))),
+            member_ttl=float(os.getenv("RESOLVER_MEMBER_TTL", str(DEFAULT_MEMBER_TTL))),
+            message_ttl=float(os.getenv("RESOLVER_MESSAGE_TTL", str(DEFAULT_MESSAGE_TTL))),
+            max_entries=int(os.getenv("RESOLVER_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))),
+        )
+
+    async def _resolve(self, cache: TTLCache, key: Hashable, fetch) -> Any:
+        if not self.config.enabled:
+            return await fetch()
+        return await cache.get_or_fetch(key, fetch)
+
+    async def channel(self, channel_id: int):
+        channel_id = int(channel_id)
+        channel = self.client.get_channel(channel_id)
+        if channel is not None:
+            return channel
+        return await self._resolve(
+            self._channels, channel_id, lambda: self.client.fetch_channel(channel_id)
+        )
+
+    async def user(self, user_id: int):
+        user_id = int(user_id)
+        user = self.client.get_user(user_id)
+        if user is not None:
+            return user
+        return await self._resolve(self._users, user_id, lambda: self.client.fetch_user(user_id))
+
+    async def member(self, guild, user_id: int):
+        user_id = int(user_id)
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+        # Lets the client load the whole member list for the next lookups.
+        schedule_chunk = getattr(self.client, "schedule_chunk", None)
+        if schedule_chunk is not None:
+            schedule_chunk(guild)
+        return await self._resolve(
+            self._members, (guild.id, user_id), lambda: guild.fetch_member(user_id)
+        )
+
+    async def message(self, channel, message_id: int):
+        message_id = int(message_id)
+        # Messages seen on the gateway are kept current by discord.py itself.
+        # Its lookup is by id alone, so a message from another channel is
+        # left to fetch_message, which reports it as not found.
+        state = getattr(self.client, "_connection", None)
+        cached = state._get_message(message_id) if state is not None else None
+        if cached is not None and cached.channel.id == channel.id:
+            return cached
+        return await self._resolve(
+            self._messages, (channel.id, message_id), lambda: channel.fetch_message(message_id)
+        )
+
+    def invalidate_channel(self, channel_id: int) -> None:
+        self._channels.pop(int(channel_id))
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._users.pop(int(user_id))
+
+    def invalidate_member(self, guild_id: int, user_id: int) -> None:
+        self._members.pop((int(guild_id), int(user_id)))
+
+    def invalidate_message(self, channel_id: int, message_id: int) -> None:
+        self._messages.pop((int(channel_id), int(message_id)))
+
+    def clear(self) -> None:
+        for cache in (self._channels, self._users, self._members, self._messages):
+            cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.config.enabled,
+            "channels": self._channels.get_stats(),
+            "users": self._users.get_stats(),
+            "members": self._members.get_stats(),
+            "messages": self._messages.get_stats(),
+        }
+
+
+# One resolver per client object, so tests that swap in a fake client get
+# a fresh cache instead of objects resolved through another client.
+_resolvers: "weakref.WeakKeyDictionary[Any, Resolver]" = weakref.WeakKeyDictionary()
+
+
+def get_resolver(client) -> Resolver:
+    resolver = _resolvers.get(client)
+    if resolver is None:
+        resolver = _resolvers[client] = Resolver(client)
+    return resolver
@@ -0,0 +1,187 @@
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
+from discord_py_self_mcp.logging_utils import log_to_stderr
+from discord_py_self_mcp.metrics import add_http_time
+
+# Resources whose id is a Discord "major parameter": limits are tracked per id.
+_MAJOR_RESOURCES = {
+    "channels": "channel_id",
+    "guilds": "guild_id",
+    "webhooks": "webhook_id",
+}
+_API_PREFIX = re.compile(r"^/api(?:/v\d+)?")
+
+RouteSpec = Tuple[str, str]
+
+
+class RouteKey(NamedTuple):
+    method: str
+    template: str
+    major: str
+
+
+@dataclass
+class RouteBucket:
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+    window: float = 0.0
+
+
+def parse_route(method: str, path: str) -> RouteKey:
+    """Normalize a concrete API path into a route template and major id.
+
+    ``/api/v9/channels/123/messages/456`` becomes
+    ``("GET", "/channels/{channel_id}/messages/{id}", "123")`` so that the
+    URLs seen by the HTTP client and the routes named by tools agree.
+    """
+    path = _API_PREFIX.sub("", URL(path).path)
+    segments = [segment for segment in path.split("/") if segment]
+    template = []
+    major = ""
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else ""
+        if index == 1 and previous in _MAJOR_RESOURCES:
+            major = segment
+            template.append("{" + _MAJOR_RESOURCES[previous] + "}")
+        elif index == 2 and segments[0] == "webhooks":
+            template.append("{webhook_token}")
+        elif previous == "reactions":
+            template.append("{emoji}")
+        elif segment.isdigit():
+            template.append("{id}")
+        else:
+            template.append(segment)
+    return RouteKey(method.upper(), "/" + "/".join(template), major)
+
+
+def _header_float(headers, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RouteBucketRegistry:
+    """Per-route rate limit state learned from ``X-RateLimit-*`` headers.
+
+    Discord groups routes into buckets (``X-RateLimit-Bucket``) that are
+    tracked separately per major parameter, so an exhausted reaction bucket
+    in one channel says nothing about sends in another.
+    """
+
+    def __init__(self):
+        self._hashes: Dict[Tuple[str, str], str] = {}
+        self._buckets: Dict[Tuple[str, str], RouteBucket] = {}
+        self._global_until: float = 0.0
+
+    def _bucket_id(self, key: RouteKey) -> Tuple[str, str]:
+        bucket_hash = self._hashes.get((key.method, key.template))
+        return (bucket_hash or f"{key.method} {key.template}", key.major)
+
+    def get_bucket(self, method: str, path: str) -> Optional[RouteBucket]:
+        return self._buckets.get(self._bucket_id(parse_route(method, path)))
+
+    def observe(self, method: str, url: str, status: int, headers) -> None:
+        key = parse_route(method, str(url))
+        now = time.monotonic()
+
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash:
+            self._hashes[(key.method, key.template)] = bucket_hash
+
+        if status == 429:
+            retry_after = _header_float(headers, "Retry-After") or 1.0
+            if headers.get("X-RateLimit-Global", "").lower() == "true":
+                self._global_until = max(self._global_until, now + retry_after)
+                log_to_stderr(f"[RATE_LIMIT] Discord global limit hit, pausing {retry_after}s")
+                return
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset_after = _header_float(headers, "X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+
+        bucket = self._buckets.setdefault(self._bucket_id(key), RouteBucket())
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        if limit is not None:
+            bucket.limit = int(limit)
+        bucket.remaining = int(remaining)
+        bucket.reset_at = now + reset_after
+        bucket.window = max(bucket.window, reset_after)
+        if status == 429:
+            bucket.remaining = 0
+            bucket.reset_at = now + (_header_float(headers, "Retry-After") or reset_after)
+
+    async def acquire(self, method: str, path: str) -> None:
+        """Wait until the route's learned bucket has capacity, then reserve it."""
+        bucket_id = self._bucket_id(parse_route(method, path))
+        while True:
+            now = time.monotonic()
+            if self._global_until > now:
+                await asyncio.sleep(self._global_until - now)
+                continue
+
+            bucket = self._buckets.get(bucket_id)
+            if bucket is None or bucket.remaining is None:
+                return
+
+            if bucket.reset_at <= now and bucket.remaining <= 0:
+                # The window elapsed without a fresher response; assume it
+                # refilled until the next response says otherwise.
+                bucket.remaining = bucket.limit or 1
+                bucket.reset_at = now + bucket.window
+
+            if bucket.remaining <= 0:
+                await asyncio.sleep(bucket.reset_at - now)
+                continue
+
+            bucket.remaining -= 1
+            return
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp hooks that feed every HTTP response into the registry.
+
+        They also charge each request's duration to the tool call making it.
+        """
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            context.started = time.monotonic()
+
+        async def on_request_end(session, context, params):
+            add_http_time(time.monotonic() - context.started)
+            self.observe(
+                params.method, str(params.url), params.response.status, params.response.headers
+            )
+
+        async def on_request_exception(session, context, params):
+            add_http_time(time.monotonic() - context.started)
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def get_stats(self) -> Dict[str, int]:
+        now = time.monotonic()
+        return {
+            "tracked": len(self._buckets),
+            "exhausted": sum(
+                1
+                for bucket in self._buckets.values()
+                if bucket.remaining is not None
+                and bucket.remaining <= 0
+                and bucket.reset_at > now
+            ),
+        }
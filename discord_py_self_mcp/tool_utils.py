@@ -1,6 +1,10 @@
+import time
+
 import discord
 
 from .bot import rate_limiter
+from .metrics import add_rate_limit_wait
+from .route_limits import RouteSpec
 
 DISCORD_MESSAGE_LIMIT = 2000
 DEFAULT_HISTORY_LIMIT = 50
@@ -11,9 +15,32 @@ NON_MESSAGEABLE_TEXT = (
 )
 
 
-async def apply_rate_limit(action_type: str) -> None:
+async def apply_rate_limit(action_type: str, route: RouteSpec | None = None) -> None:
+    """Wait for the global caps of ``action_type``.
+
+    ``route`` is the ``(method, path)`` of the Discord request about to be
+    made; when given, the call first waits for that route's learned bucket.
+    """
+    if rate_limiter and rate_limiter.is_enabled():
+        started = time.monotonic()
+        try:
+            await rate_limiter.wait_if_needed(action_type, route=route)
+        finally:
+            add_rate_limit_wait(time.monotonic() - started)
+
+
+async def wait_for_route(route: RouteSpec) -> None:
+    """Wait only for Discord's own bucket of ``route``, not the global caps.
+
+    Used between the pages of one tool call, which already paid its global
+    action once.
+    """
     if rate_limiter and rate_limiter.is_enabled():
-        await rate_limiter.wait_if_needed(action_type)
+        started = time.monotonic()
+        try:
+            await rate_limiter.routes.acquire(*route)
+        finally:
+            add_rate_limit_wait(time.monotonic() - started)
 
 
 def format_user_display(user: discord.abc.User) -> str:
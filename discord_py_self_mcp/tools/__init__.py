@@ -1,15 +1,6 @@
 from .registry import registry as registry
-from . import messages as messages
-from . import guilds as guilds
-from . import channels as channels
-from . import dms as dms
-from . import relationships as relationships
-from . import voice as voice
-from . import presence as presence
-from . import interactions as interactions
-from . import threads as threads
-from . import reactions as reactions
-from . import members as members
-from . import invites as invites
-from . import profile as profile
-from . import discrawl as discrawl
+from .catalog import load_catalog
+
+# Tool modules import discord.py and are only loaded when one of their tools
+# is first called; until then the static catalog describes them.
+registry.load_catalog(load_catalog())
@@ -0,0 +1,113 @@
+import asyncio
+
+from mcp.types import TextContent
+
+from ..rate_limiter import PRIORITY_LANES, current_priority
+from .registry import is_error_result, registry
+
+DEFAULT_BATCH_CONCURRENCY = 4
+MAX_BATCH_CONCURRENCY = 16
+MAX_BATCH_CALLS = 100
+
+
+@registry.register(
+    name="batch",
+    needs="none",
+    description=(
+        "Run several tool calls in one request. Calls run with bounded concurrency and "
+        "still pass through the rate limiter; results come back in the order given"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "maxItems": MAX_BATCH_CALLS,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "arguments": {"type": "object"},
+                    },
+                    "required": ["name"],
+                },
+            },
+            "concurrency": {
+                "type": "integer",
+                "default": DEFAULT_BATCH_CONCURRENCY,
+                "description": f"Calls in flight at once (1-{MAX_BATCH_CONCURRENCY})",
+            },
+            "stop_on_error": {
+                "type": "boolean",
+                "default": False,
+                "description": "Skip calls that have not started once one fails",
+            },
+            "priority": {
+                "type": "string",
+                "enum": list(PRIORITY_LANES),
+                "description": "Rate-limit lane for every call (default: the batch's own lane)",
+            },
+        },
+        "required": ["calls"],
+    },
+)
+async def batch(arguments: dict):
+    try:
+        calls = arguments.get("calls") or []
+        if not isinstance(calls, list) or not calls:
+            return [
+                TextContent(type="text", text="Error running batch: calls must be a non-empty list")
+            ]
+        if len(calls) > MAX_BATCH_CALLS:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error running batch: at most {MAX_BATCH_CALLS} calls per batch",
+                )
+            ]
+
+        try:
+            concurrency = int(arguments.get("concurrency", DEFAULT_BATCH_CONCURRENCY))
+        except (TypeError, ValueError):
+            concurrency = DEFAULT_BATCH_CONCURRENCY
+        concurrency = max(1, min(concurrency, MAX_BATCH_CONCURRENCY))
+        stop_on_error = bool(arguments.get("stop_on_error"))
+        # Without an explicit lane, calls queue in the lane the batch itself runs in.
+        priority = arguments.get("priority") or current_priority.get()
+
+        semaphore = asyncio.Semaphore(concurrency)
+        failed = asyncio.Event()
+
+        async def run(call):
+            name = call.get("name") if isinstance(call, dict) else None
+            if not name:
+                result = [TextContent(type="text", text="Error: each call needs a name")]
+            elif name == "batch":
+                result = [TextContent(type="text", text="Error: batches cannot be nested")]
+            else:
+                async with semaphore:
+                    if stop_on_error and failed.is_set():
+                        return "skipped", []
+                    try:
+                        result = await registry.call_tool(
+                            name, call.get("arguments") or {}, priority=priority
+                        )
+                    except Exception as exc:
+                        result = [TextContent(type="text", text=f"Error: {exc}")]
+            if is_error_result(result):
+                failed.set()
+                return "error", result
+            return "ok", result
+
+        outcomes = await asyncio.gather(*(run(call) for call in calls))
+
+        content = []
+        for index, (call, (status, result)) in enumerate(zip(calls, outcomes), start=1):
+            name = call.get("name") if isinstance(call, dict) else None
+            content.append(
+                TextContent(type="text", text=f"[{index}/{len(calls)}] {name}: {status}")
+            )
+            content.extend(result)
+        return content
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error running batch: {str(e)}")]
@@ -0,0 +1,55 @@
+"""
+Static tool catalog, so the MCP server can list tools without importing them.
+
+Regenerate after changing a tool's name, description, schema or priority:
+
+    python -m discord_py_self_mcp.tools.catalog
+"""
+
+import importlib
+import json
+from pathlib import Path
+
+CATALOG_PATH = Path(__file__).with_name("catalog.json")
+
+TOOL_MODULES = (
+    "messages",
+    "history",
+    "guilds",
+    "channels",
+    "dms",
+    "relationships",
+    "voice",
+    "presence",
+    "interactions",
+    "threads",
+    "reactions",
+    "members",
+    "invites",
+    "profile",
+    "discrawl",
+    "server",
+    "batch",
+)
+
+
+def load_catalog() -> list[dict]:
+    return json.loads(CATALOG_PATH.read_text(encoding="utf-8"))
+
+
+def build_catalog() -> list[dict]:
+    from .registry import registry
+
+    for module in TOOL_MODULES:
+        importlib.import_module(f"{__package__}.{module}")
+    return registry.describe()
+
+
+def main() -> None:
+    entries = build_catalog()
+    CATALOG_PATH.write_text(json.dumps(entries, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {len(entries)} tools to {CATALOG_PATH}")
+
+
+if __name__ == "__main__":
+    main()
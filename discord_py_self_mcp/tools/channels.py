@@ -2,6 +2,7 @@ from mcp.types import TextContent
 
 from ..bot import client
 from ..tool_utils import apply_rate_limit
+from .embed import OUTPUT_PROPERTY, output_mode, render_structured
 from .registry import registry
 
 @registry.register(
@@ -76,7 +77,8 @@ async def delete_channel(arguments: dict):
     input_schema={
         "type": "object",
         "properties": {
-            "guild_id": {"type": "string"}
+            "guild_id": {"type": "string"},
+            **OUTPUT_PROPERTY,
         },
         "required": ["guild_id"]
     }
@@ -84,10 +86,24 @@ async def delete_channel(arguments: dict):
 async def list_channels(arguments: dict):
     try:
         guild_id = int(arguments["guild_id"])
+        mode = output_mode(arguments)
         guild = client.get_guild(guild_id)
         if not guild:
             return [TextContent(type="text", text="Guild not found")]
         
+        if mode != "text":
+            channels = [
+                {
+                    "id": channel.id,
+                    "name": channel.name,
+                    "type": channel.type.name,
+                    "category_id": channel.category_id,
+                    "position": channel.position,
+                }
+                for channel in guild.channels
+            ]
+            return [TextContent(type="text", text=render_structured(mode, "channels", channels))]
+
         channels = []
         for channel in guild.channels:
             channels.append(f"{channel.name} ({channel.id}) - {channel.type.name}")
@@ -1,15 +1,36 @@
 import asyncio
+import codecs
+import json
 import os
+import re
 import shutil
+import time
+from collections import deque
 from pathlib import Path
 
 from mcp.types import TextContent, ImageContent, EmbeddedResource
 
+from ..discrawl_archive import get_discrawl_archive
+from ..discrawl_pool import SyncJob, get_discrawl_pool
+from ..progress import report_progress
 from .registry import registry
 
 
 DEFAULT_TIMEOUT_SECONDS = 180
 MAX_OUTPUT_CHARS = 12000
+DEFAULT_MAX_ROWS = 50
+MAX_ROWS = 500
+DEFAULT_MAX_OUTPUT_TOKENS = 3000
+MAX_OUTPUT_TOKENS = 20000
+CHARS_PER_TOKEN = 4
+READ_CHUNK_BYTES = 64 * 1024
+JSON_FLAG = "--json"
+# Keys discrawl may wrap a result list in.
+ROW_LIST_KEYS = ("results", "messages", "mentions", "rows", "items")
+# Seconds between progress notifications while a sync runs.
+SYNC_PROGRESS_INTERVAL = 1.0
+# discrawl logs long JSON lines; the default 64 KiB line limit is too small.
+LINE_LIMIT_BYTES = 1024 * 1024
 DEFAULT_DISCRAWL_BINARY = "discrawl"
 DEFAULT_DISCRAWL_FORK_URL = "https://github.com/Microck/discrawl-self"
 
@@ -55,7 +76,234 @@ def _resolve_discrawl_binary(arguments: dict) -> str:
 def _truncate_output(value: str) -> str:
     if len(value) <= MAX_OUTPUT_CHARS:
         return value
-    return value[:MAX_OUTPUT_CHARS] + "\n... output truncated ..."
+    # Cut at a line boundary so no row is left half-printed.
+    cut = value.rfind("\n", 0, MAX_OUTPUT_CHARS)
+    return value[: cut if cut > 0 else MAX_OUTPUT_CHARS] + "\n... output truncated ..."
+
+
+class RowStream:
+    """Incremental decoder for discrawl ``--json`` output.
+
+    Accepts NDJSON (one object per line), a single JSON array, or objects
+    wrapping their rows in a list (``{"results": [...]}``). Rows are returned
+    as soon as they are complete; output that is not JSON at all is kept as
+    text so the caller can fall back to printing it.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._bytes = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self.mode = None  # "array", "lines" or "text"
+        self.text = ""
+
+    def feed(self, data: bytes, final: bool = False) -> list:
+        self._buffer += self._bytes.decode(data, final=final)
+        rows: list = []
+        while True:
+            if self.mode is None:
+                stripped = self._buffer.lstrip()
+                if not stripped:
+                    break
+                self.mode = {"[": "array", "{": "lines"}.get(stripped[0], "text")
+                self._buffer = stripped[1:] if self.mode == "array" else stripped
+            if self.mode == "text":
+                self.text += self._buffer
+                self._buffer = ""
+                break
+            remaining = self._buffer.lstrip()
+            if self.mode == "array":
+                remaining = remaining.lstrip(",").lstrip()
+                if remaining.startswith("]"):
+                    self._buffer = ""
+                    break
+            if not remaining:
+                self._buffer = ""
+                break
+            try:
+                value, end = self._decoder.raw_decode(remaining)
+            except json.JSONDecodeError:
+                # Incomplete value; wait for more bytes. Garbage stays
+                # buffered and is reported as text once the stream ends.
+                self._buffer = remaining
+                if final:
+                    self.text += remaining
+                    self._buffer = ""
+                break
+            self._buffer = remaining[end:]
+            rows.extend(_unwrap_rows(value))
+        return rows
+
+
+def _unwrap_rows(value) -> list:
+    if isinstance(value, dict):
+        for key in ROW_LIST_KEYS:
+            if isinstance(value.get(key), list):
+                return value[key]
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class RowPage:
+    """One page of rows, bounded by a row count and a token budget."""
+
+    def __init__(self, offset: int, max_rows: int, max_tokens: int):
+        self.offset = offset
+        self.max_rows = max_rows
+        self.max_tokens = max_tokens
+        self.lines: list[str] = []
+        self.tokens = 0
+        self.has_more = False
+
+    def add(self, row) -> bool:
+        """Add a row; False once the page is full and the row did not fit."""
+        line = json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+        cost = _estimate_tokens(line)
+        if len(self.lines) >= self.max_rows or (
+            self.lines and self.tokens + cost > self.max_tokens
+        ):
+            self.has_more = True
+            return False
+        self.lines.append(line)
+        self.tokens += cost
+        return True
+
+    def render(self, header: list[str]) -> list[str]:
+        parts = list(header)
+        end = self.offset + len(self.lines)
+        if self.lines:
+            parts.append(
+                f"rows {self.offset}-{end - 1} ({len(self.lines)} rows):\n"
+                + "\n".join(self.lines)
+            )
+        else:
+            parts.append(f"No rows at offset {self.offset}")
+        if self.has_more:
+            parts.append(f"next_offset: {end} (pass offset={end} for more rows)")
+        else:
+            parts.append("End of results")
+        return parts
+
+
+class OutputTail:
+    """The last lines of a process's output, capped at ``MAX_OUTPUT_CHARS``."""
+
+    def __init__(self, max_chars: int = MAX_OUTPUT_CHARS):
+        self.max_chars = max_chars
+        self._lines: deque = deque()
+        self._chars = 0
+        self.dropped = 0
+
+    def add(self, line: str) -> None:
+        line = line[: self.max_chars]
+        self._lines.append(line)
+        self._chars += len(line) + 1
+        while self._chars > self.max_chars:
+            self._chars -= len(self._lines.popleft()) + 1
+            self.dropped += 1
+
+    def render(self) -> str:
+        text = "\n".join(self._lines)
+        if self.dropped:
+            text = f"... {self.dropped} earlier lines omitted ...\n" + text
+        return text
+
+
+_CHANNEL_COUNT_RE = re.compile(
+    r"(\d+)\s*/\s*(\d+)\s+channels?|channels?\D{0,3}(\d+)\s*/\s*(\d+)", re.I
+)
+_CHANNEL_DONE_RE = re.compile(
+    r"\bchannel\b.*\b(done|synced|complete|completed|finished)\b", re.I
+)
+_MESSAGE_COUNT_RE = re.compile(
+    r"(\d[\d,]*)\s+(?:new\s+)?messages?\b|\bmessages?(?:_synced|_ingested)?\s*[=:]\s*(\d+)",
+    re.I,
+)
+_JSON_CHANNELS_DONE = ("channels_done", "channels_synced", "done_channels")
+_JSON_CHANNELS_TOTAL = ("channels_total", "total_channels", "channels")
+_JSON_MESSAGES = ("messages", "messages_synced", "messages_ingested", "total_messages")
+
+
+class SyncProgress:
+    """Channel and message counts scraped from discrawl sync output.
+
+    discrawl has no machine-readable progress stream, so this reads its log
+    lines: plain text such as ``12/40 channels`` and ``channel #x done (52
+    messages)``, or JSON log records with count fields.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.channels_done = 0
+        self.channels_total = None
+        self.messages = 0
+
+    def update(self, line: str) -> bool:
+        """Fold one output line in; True if any count changed."""
+        before = (self.channels_done, self.channels_total, self.messages)
+        record = None
+        if line.startswith("{"):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+        if isinstance(record, dict):
+            self._update_from_record(record)
+        else:
+            self._update_from_text(line)
+        return (self.channels_done, self.channels_total, self.messages) != before
+
+    def _update_from_record(self, record: dict) -> None:
+        def number(keys):
+            for key in keys:
+                if isinstance(record.get(key), int):
+                    return record[key]
+            return None
+
+        done, total, messages = (
+            number(_JSON_CHANNELS_DONE),
+            number(_JSON_CHANNELS_TOTAL),
+            number(_JSON_MESSAGES),
+        )
+        if done is not None:
+            self.channels_done = max(self.channels_done, done)
+        if total is not None:
+            self.channels_total = total
+        if messages is not None:
+            self.messages = max(self.messages, messages)
+
+    def _update_from_text(self, line: str) -> None:
+        counts = _CHANNEL_COUNT_RE.search(line)
+        channel_done = _CHANNEL_DONE_RE.search(line)
+        if counts:
+            done, total = [int(value) for value in counts.groups() if value is not None]
+            self.channels_done = max(self.channels_done, done)
+            self.channels_total = total
+        elif channel_done:
+            self.channels_done += 1
+        messages = _MESSAGE_COUNT_RE.search(line)
+        if messages:
+            count = int((messages.group(1) or messages.group(2)).replace(",", ""))
+            if channel_done and not counts:
+                # A per-channel line: its count adds to the total so far.
+                self.messages += count
+            else:
+                self.messages = max(self.messages, count)
+
+    def summary(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        channels = str(self.channels_done)
+        if self.channels_total:
+            channels += f"/{self.channels_total}"
+        return (
+            f"{channels} channels, {self.messages} messages, "
+            f"{self.messages / elapsed:.0f} msg/s"
+        )
 
 
 def _binary_exists(binary: str) -> bool:
@@ -66,9 +314,8 @@ def _binary_exists(binary: str) -> bool:
     return Path(binary).expanduser().exists()
 
 
-async def _run_discrawl(
-    arguments: dict,
-) -> Response:
+def _prepare_command(arguments: dict) -> tuple[list[str], int] | Response:
+    """Validate tool arguments into ``(argv, timeout)``, or an error response."""
     command = str(arguments.get("command", "")).strip()
     if not command:
         return _text("Missing required field: command")
@@ -106,33 +353,59 @@ async def _run_discrawl(
         cmd.extend(["--config", config_path])
     cmd.append(command)
     cmd.extend(args)
+    return cmd, timeout_seconds
 
-    process = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+
+def _timed_out(cmd: list[str], timeout_seconds: int) -> Response:
+    return _text(
+        (
+            f"discrawl command timed out after {timeout_seconds}s\n"
+            f"command={' '.join(cmd)}"
+        )
     )
 
-    try:
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(), timeout=timeout_seconds
+
+async def _run_discrawl(
+    arguments: dict,
+) -> Response:
+    response, _ok = await _run_discrawl_checked(arguments)
+    return response
+
+
+async def _run_discrawl_checked(arguments: dict) -> tuple[Response, bool]:
+    """Run discrawl and report whether it exited cleanly."""
+    prepared = _prepare_command(arguments)
+    if not isinstance(prepared, tuple):
+        return prepared, False
+    cmd, timeout_seconds = prepared
+
+    async with get_discrawl_pool().worker():
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-    except asyncio.TimeoutError:
-        process.kill()
-        await process.wait()
-        return _text(
-            (
-                f"discrawl command timed out after {timeout_seconds}s\n"
-                f"command={' '.join(cmd)}"
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=timeout_seconds
             )
-        )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return _timed_out(cmd, timeout_seconds), False
+
+    response = _format_text_result(cmd, process.returncode, stdout, stderr)
+    return response, process.returncode == 0
+
 
+def _format_text_result(cmd: list[str], exit_code, stdout: bytes, stderr: bytes) -> Response:
     stdout_text = _truncate_output(stdout.decode("utf-8", errors="replace").strip())
     stderr_text = _truncate_output(stderr.decode("utf-8", errors="replace").strip())
 
     parts = [
         f"command={' '.join(cmd)}",
-        f"exit_code={process.returncode}",
+        f"exit_code={exit_code}",
     ]
     if stdout_text:
         parts.append("stdout:\n" + stdout_text)
@@ -145,8 +418,273 @@ async def _run_discrawl(
     return _text("\n\n".join(parts))
 
 
+_JSON_UNSUPPORTED: Response = []
+
+
+def _page_options(arguments: dict) -> tuple[int, int, int]:
+    def bounded(key: str, default: int, low: int, high: int) -> int:
+        try:
+            value = int(arguments.get(key, default))
+        except (TypeError, ValueError):
+            value = default
+        return max(low, min(value, high))
+
+    return (
+        bounded("offset", 0, 0, 10**9),
+        bounded("max_rows", DEFAULT_MAX_ROWS, 1, MAX_ROWS),
+        bounded("max_output_tokens", DEFAULT_MAX_OUTPUT_TOKENS, 100, MAX_OUTPUT_TOKENS),
+    )
+
+
+async def _run_discrawl_rows(
+    arguments: dict, offset: int, max_rows: int, max_tokens: int
+) -> tuple[Response, bool]:
+    """Run discrawl with ``--json`` and return one page of rows.
+
+    Rows are parsed while discrawl is still writing them; once the page is
+    full (or the token budget is spent) the process is stopped instead of
+    reading the rest of the result set.
+    """
+    prepared = _prepare_command(arguments)
+    if not isinstance(prepared, tuple):
+        return prepared, False
+    cmd, timeout_seconds = prepared
+
+    async with get_discrawl_pool().worker():
+        return await _read_rows(cmd, timeout_seconds, offset, max_rows, max_tokens)
+
+
+async def _read_rows(
+    cmd: list[str], timeout_seconds: int, offset: int, max_rows: int, max_tokens: int
+) -> tuple[Response, bool]:
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stderr_task = asyncio.create_task(process.stderr.read())
+    stream = RowStream()
+    page = RowPage(offset, max_rows, max_tokens)
+    seen = 0
+    timed_out = False
+
+    async def read_rows() -> None:
+        nonlocal seen
+        while True:
+            chunk = await process.stdout.read(READ_CHUNK_BYTES)
+            for row in stream.feed(chunk, final=not chunk):
+                seen += 1
+                if seen > offset and not page.add(row):
+                    return
+            if not chunk:
+                return
+
+    try:
+        await asyncio.wait_for(read_rows(), timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        if not page.lines:
+            process.kill()
+            await process.wait()
+            stderr_task.cancel()
+            return _timed_out(cmd, timeout_seconds), False
+        # Keep what arrived; the caller can continue from the last offset.
+        timed_out = True
+        page.has_more = True
+
+    stopped_early = page.has_more
+    if stopped_early and process.returncode is None:
+        process.kill()
+    await process.wait()
+    stderr = await stderr_task
+
+    if stream.mode is None and process.returncode and b"json" in stderr.lower():
+        # Older discrawl builds without structured output.
+        return _JSON_UNSUPPORTED, False
+    if stream.mode in (None, "text") and not page.lines:
+        # discrawl printed plain text (or nothing); show it like run_discrawl.
+        response = _format_text_result(
+            cmd, process.returncode, stream.text.encode("utf-8"), stderr
+        )
+        return response, process.returncode == 0
+
+    exit_code = "stopped after page" if stopped_early else process.returncode
+    parts = page.render([f"command={' '.join(cmd)}", f"exit_code={exit_code}"])
+    stderr_text = _truncate_output(stderr.decode("utf-8", errors="replace").strip())
+    if stderr_text and not stopped_early:
+        parts.append("stderr:\n" + stderr_text)
+    # A page cut short by the timeout is not cached.
+    ok = (stopped_early or process.returncode == 0) and not timed_out
+    return _text("\n\n".join(parts)), ok
+
+
+async def _query_archive(
+    arguments: dict, command: str, offset: int, max_rows: int, max_tokens: int
+) -> Response | None:
+    """Answer from discrawl's SQLite archive; None if it has to run discrawl."""
+    count = max_rows + 1
+    if arguments.get("limit") is not None:
+        try:
+            count = min(count, int(arguments["limit"]) - offset)
+        except (TypeError, ValueError):
+            pass
+    result = await get_discrawl_archive().query(command, arguments, offset, count)
+    if result is None:
+        return None
+    path, rows = result
+    page = RowPage(offset, max_rows, max_tokens)
+    for row in rows:
+        if not page.add(row):
+            break
+    return _text("\n\n".join(page.render([f"source=sqlite {path}"])))
+
+
+async def _run_sync(arguments: dict, job: SyncJob | None = None) -> Response:
+    """Run discrawl sync, reading its output line by line as it goes.
+
+    Counts parsed from the output are sent as progress notifications (and
+    kept on ``job`` for background runs). On timeout the process is killed
+    and the output read so far is returned with the progress reached.
+    """
+    prepared = _prepare_command(arguments)
+    if not isinstance(prepared, tuple):
+        if job is not None:
+            job.status = "failed"
+        return prepared
+    cmd, timeout_seconds = prepared
+    progress = SyncProgress()
+    tail = OutputTail()
+    if job is not None:
+        job.output = tail
+    last_report = 0.0
+
+    async def on_line(line: str) -> None:
+        nonlocal last_report
+        tail.add(line)
+        if not progress.update(line):
+            return
+        summary = progress.summary()
+        if job is not None:
+            job.progress = summary
+        now = time.monotonic()
+        if now - last_report >= SYNC_PROGRESS_INTERVAL:
+            last_report = now
+            await report_progress(
+                progress.channels_done or progress.messages,
+                progress.channels_total if progress.channels_done else None,
+                summary,
+            )
+
+    async with get_discrawl_pool().worker():
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            # Merged: discrawl logs its progress on stderr.
+            stderr=asyncio.subprocess.STDOUT,
+            limit=LINE_LIMIT_BYTES,
+        )
+
+        async def pump() -> None:
+            async for raw in process.stdout:
+                await on_line(raw.decode("utf-8", errors="replace").rstrip())
+            await process.wait()
+
+        timed_out = False
+        try:
+            await asyncio.wait_for(pump(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            timed_out = True
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    parts = [f"command={' '.join(cmd)}"]
+    if timed_out:
+        parts.append(f"discrawl command timed out after {timeout_seconds}s; partial output below")
+        status = "timed_out"
+    else:
+        parts.append(f"exit_code={process.returncode}")
+        status = "succeeded" if process.returncode == 0 else "failed"
+    if progress.channels_done or progress.messages:
+        parts.append(f"progress: {progress.summary()}")
+    output = tail.render()
+    parts.append("output:\n" + output if output else "No output")
+    if job is not None:
+        job.status = status
+        job.progress = progress.summary() if progress.channels_done or progress.messages else None
+    return _text("\n\n".join(parts))
+
+
+def _cache_key(payload: dict, **extra) -> str:
+    """Normalize a discrawl invocation into a cache key; the timeout is ignored."""
+    key = {name: value for name, value in payload.items() if name != "timeout_seconds"}
+    try:
+        key["binary"] = _resolve_discrawl_binary(payload)
+    except ValueError:
+        pass
+    if key.get("config_path") is not None:
+        key["config_path"] = str(key["config_path"]).strip()
+    key.update(extra)
+    return json.dumps(key, sort_keys=True)
+
+
+async def _run_discrawl_query(arguments: dict, command: str, args: list[str]) -> Response:
+    """Shared path of the search/messages/mentions tools."""
+    pool = get_discrawl_pool()
+    if arguments.get("raw_output") is True:
+        payload = _base_discrawl_arguments(arguments, command, args)
+        return await pool.query(
+            _cache_key(payload, raw_output=True),
+            lambda: _run_discrawl_checked(payload),
+        )
+
+    offset, max_rows, max_tokens = _page_options(arguments)
+    direct = await _query_archive(arguments, command, offset, max_rows, max_tokens)
+    if direct is not None:
+        return direct
+
+    # One row past the page tells us whether there is more.
+    wanted = offset + max_rows + 1
+    paged_args = [arg for arg in args if arg != "--all"]
+    if "--limit" in paged_args:
+        index = paged_args.index("--limit") + 1
+        try:
+            paged_args[index] = str(min(int(paged_args[index]), wanted))
+        except ValueError:
+            pass
+        flags = [JSON_FLAG]
+    else:
+        # Flags go before positional arguments such as the search query.
+        flags = [JSON_FLAG, "--limit", str(wanted)]
+    payload = _base_discrawl_arguments(arguments, command, [*flags, *paged_args])
+
+    async def run() -> tuple[Response, bool]:
+        result, ok = await _run_discrawl_rows(payload, offset, max_rows, max_tokens)
+        if result is _JSON_UNSUPPORTED:
+            # Text output can't be paged; run the caller's original arguments.
+            if offset > 0:
+                return (
+                    _text(
+                        "Error: offset needs a discrawl build with --json; this build "
+                        "only prints text, which can't be paged. Retry without offset "
+                        "or with raw_output=true"
+                    ),
+                    False,
+                )
+            return await _run_discrawl_checked(
+                _base_discrawl_arguments(arguments, command, args)
+            )
+        return result, ok
+
+    return await pool.query(
+        _cache_key(payload, offset=offset, max_rows=max_rows, max_output_tokens=max_tokens),
+        run,
+    )
+
+
 @registry.register(
     name="run_discrawl",
+    needs="none",
     description="Run a discrawl CLI command with options",
     input_schema={
         "type": "object",
@@ -200,6 +738,7 @@ def _append_value(args: list[str], flag: str, value: object) -> None:
 
 @registry.register(
     name="discrawl_doctor",
+    needs="none",
     description="Run discrawl doctor",
     input_schema={
         "type": "object",
@@ -226,6 +765,7 @@ async def discrawl_doctor(arguments: dict) -> Response:
 
 @registry.register(
     name="discrawl_status",
+    needs="none",
     description="Run discrawl status",
     input_schema={
         "type": "object",
@@ -252,6 +792,7 @@ async def discrawl_status(arguments: dict) -> Response:
 
 @registry.register(
     name="discrawl_sync",
+    needs="none",
     description="Run discrawl sync with typed options",
     input_schema={
         "type": "object",
@@ -284,6 +825,10 @@ async def discrawl_status(arguments: dict) -> Response:
                 "type": "boolean",
                 "description": "enable embedding job enqueue during sync",
             },
+            "background": {
+                "type": "boolean",
+                "description": "return a job id at once and run the sync in the background",
+            },
             "config_path": {
                 "type": "string",
                 "description": "optional --config path for discrawl",
@@ -318,12 +863,69 @@ async def discrawl_sync(arguments: dict) -> Response:
     if arguments.get("concurrency") is not None:
         _append_value(args, "--concurrency", arguments["concurrency"])
 
-    return await _run_discrawl(_base_discrawl_arguments(arguments, "sync", args))
+    payload = _base_discrawl_arguments(arguments, "sync", args)
+    pool = get_discrawl_pool()
+    key = _cache_key(payload)
+    if arguments.get("background") is True:
+        job = pool.start_job(key, lambda job: _run_sync(payload, job))
+        return _text(
+            f"discrawl sync job {job.id} is running. "
+            "Poll it with discrawl_sync_status using this job_id."
+        )
+    # Same-argument syncs share one run; the query cache is cleared afterwards.
+    return await pool.sync(key, lambda: _run_sync(payload))
+
+
+def _format_job(job: SyncJob, with_output: bool) -> str:
+    started = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(job.started_at))
+    lines = [f"job {job.id}: {job.status} (started {started}, {job.elapsed:.0f}s)"]
+    if job.progress:
+        lines.append(f"progress: {job.progress}")
+    if not with_output:
+        return "\n".join(lines)
+    if job.status == "running":
+        output = job.output.render() if job.output is not None else ""
+        lines.append("output so far:\n" + (output or "No output yet"))
+    elif job.result:
+        result = job.result
+        lines.append(result[0].text if isinstance(result, list) else str(result))
+    return "\n".join(lines)
+
+
+@registry.register(
+    name="discrawl_sync_status",
+    needs="none",
+    description="Show the progress and output of background discrawl sync jobs",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "job_id": {
+                "type": "string",
+                "description": (
+                    "job id returned by discrawl_sync with background=true; omit to list jobs"
+                ),
+            },
+        },
+    },
+)
+async def discrawl_sync_status(arguments: dict) -> Response:
+    pool = get_discrawl_pool()
+    job_id = str(arguments.get("job_id") or "").strip()
+    if not job_id:
+        jobs = pool.jobs()
+        if not jobs:
+            return _text("No discrawl sync jobs")
+        return _text("\n".join(_format_job(job, with_output=False) for job in jobs))
+    job = pool.get_job(job_id)
+    if job is None:
+        return _text(f"Unknown discrawl sync job: {job_id}")
+    return _text(_format_job(job, with_output=True))
 
 
 @registry.register(
     name="discrawl_search",
-    description="Run discrawl search with typed options",
+    needs="none",
+    description="Run discrawl search with typed options; returns JSON rows a page at a time",
     input_schema={
         "type": "object",
         "properties": {
@@ -351,6 +953,25 @@ async def discrawl_sync(arguments: dict) -> Response:
                 "type": "boolean",
                 "description": "include rows with no searchable content",
             },
+            "offset": {
+                "type": "integer",
+                "description": "rows to skip; pass next_offset from the previous page",
+                "default": 0,
+            },
+            "max_rows": {
+                "type": "integer",
+                "description": "max rows returned per page (1-500)",
+                "default": 50,
+            },
+            "max_output_tokens": {
+                "type": "integer",
+                "description": "approximate token budget for the rows on one page",
+                "default": 3000,
+            },
+            "raw_output": {
+                "type": "boolean",
+                "description": "return discrawl's plain text output instead of JSON rows",
+            },
             "config_path": {
                 "type": "string",
                 "description": "optional --config path for discrawl",
@@ -386,12 +1007,13 @@ async def discrawl_search(arguments: dict) -> Response:
         args.append("--include-empty")
     args.append(query)
 
-    return await _run_discrawl(_base_discrawl_arguments(arguments, "search", args))
+    return await _run_discrawl_query(arguments, "search", args)
 
 
 @registry.register(
     name="discrawl_messages",
-    description="Run discrawl messages with typed options",
+    needs="none",
+    description="Run discrawl messages with typed options; returns JSON rows a page at a time",
     input_schema={
         "type": "object",
         "properties": {
@@ -427,6 +1049,25 @@ async def discrawl_search(arguments: dict) -> Response:
                 "type": "boolean",
                 "description": "include rows with no displayable content",
             },
+            "offset": {
+                "type": "integer",
+                "description": "rows to skip; pass next_offset from the previous page",
+                "default": 0,
+            },
+            "max_rows": {
+                "type": "integer",
+                "description": "max rows returned per page (1-500)",
+                "default": 50,
+            },
+            "max_output_tokens": {
+                "type": "integer",
+                "description": "approximate token budget for the rows on one page",
+                "default": 3000,
+            },
+            "raw_output": {
+                "type": "boolean",
+                "description": "return discrawl's plain text output instead of JSON rows",
+            },
             "config_path": {
                 "type": "string",
                 "description": "optional --config path for discrawl",
@@ -462,12 +1103,13 @@ async def discrawl_messages(arguments: dict) -> Response:
     if arguments.get("include_empty") is True:
         args.append("--include-empty")
 
-    return await _run_discrawl(_base_discrawl_arguments(arguments, "messages", args))
+    return await _run_discrawl_query(arguments, "messages", args)
 
 
 @registry.register(
     name="discrawl_mentions",
-    description="Run discrawl mentions with typed options",
+    needs="none",
+    description="Run discrawl mentions with typed options; returns JSON rows a page at a time",
     input_schema={
         "type": "object",
         "properties": {
@@ -499,6 +1141,25 @@ async def discrawl_messages(arguments: dict) -> Response:
                 "type": "integer",
                 "description": "max number of rows",
             },
+            "offset": {
+                "type": "integer",
+                "description": "rows to skip; pass next_offset from the previous page",
+                "default": 0,
+            },
+            "max_rows": {
+                "type": "integer",
+                "description": "max rows returned per page (1-500)",
+                "default": 50,
+            },
+            "max_output_tokens": {
+                "type": "integer",
+                "description": "approximate token budget for the rows on one page",
+                "default": 3000,
+            },
+            "raw_output": {
+                "type": "boolean",
+                "description": "return discrawl's plain text output instead of JSON rows",
+            },
             "config_path": {
                 "type": "string",
                 "description": "optional --config path for discrawl",
@@ -540,4 +1201,4 @@ async def discrawl_mentions(arguments: dict) -> Response:
     if arguments.get("limit") is not None:
         _append_value(args, "--limit", arguments["limit"])
 
-    return await _run_discrawl(_base_discrawl_arguments(arguments, "mentions", args))
+    return await _run_discrawl_query(arguments, "mentions", args)
@@ -3,6 +3,7 @@ from mcp.types import TextContent
 
 from ..bot import client
 from ..tool_utils import format_user_display
+from .embed import OUTPUT_PROPERTY, output_mode, render_structured, serialize_user
 from .registry import registry
 
 
@@ -37,6 +38,7 @@ def _recipient_label(user) -> str:
                 "type": "string",
                 "description": "Case-insensitive filter: only return DMs whose recipient name/handle contains this.",
             },
+            **OUTPUT_PROPERTY,
         },
     },
 )
@@ -44,9 +46,10 @@ async def list_dm_channels(arguments: dict):
     try:
         include_groups = arguments.get("include_groups", True)
         name_contains = (arguments.get("name_contains") or "").strip().lower()
+        mode = output_mode(arguments)
 
         private_channels = list(getattr(client, "private_channels", []) or [])
-        if not private_channels:
+        if not private_channels and mode == "text":
             return [
                 TextContent(
                     type="text",
@@ -55,6 +58,7 @@ async def list_dm_channels(arguments: dict):
             ]
 
         lines = []
+        serialized = []
         for channel in private_channels:
             is_group = _is_group(channel)
             if is_group and not include_groups:
@@ -79,11 +83,24 @@ async def list_dm_channels(arguments: dict):
                     f"{getattr(recipient, 'name', '') or ''}"
                 ).lower()
                 label = f"[dm] {who}"
+                recipients = [recipient] if recipient is not None else []
+                name = None
 
             if name_contains and name_contains not in searchable:
                 continue
 
             lines.append(f"{channel.id} - {label}")
+            serialized.append(
+                {
+                    "id": channel.id,
+                    "type": "group" if is_group else "dm",
+                    "name": name,
+                    "recipients": [serialize_user(u) for u in recipients],
+                }
+            )
+
+        if mode != "text":
+            return [TextContent(type="text", text=render_structured(mode, "channels", serialized))]
 
         if not lines:
             scope = "DM channels" if include_groups else "1:1 DM channels"
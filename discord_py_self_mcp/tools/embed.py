@@ -1,5 +1,67 @@
+import json
+import os
+import re
+from collections import Counter
+
 import discord
 
+MESSAGE_FORMATS = ("full", "compact")
+OUTPUT_MODES = ("text", "json", "ndjson")
+CHARS_PER_TOKEN = 4
+DEFAULT_COMPACT_OUTPUT_TOKENS = 4000
+# Longest embed description or field value kept in compact output.
+COMPACT_TEXT_LIMIT = 200
+# Shortest part of a message kept when it alone is over the output budget.
+MIN_TRUNCATED_CHARS = 40
+
+_CDN_URL_RE = re.compile(
+    r"https?://(?:cdn\.discordapp\.com|media\.discordapp\.net)/([a-z-]+)/(?:\d+/)?(\d+)\S*"
+)
+_CDN_KINDS = {
+    "attachments": "att",
+    "ephemeral-attachments": "att",
+    "emojis": "emoji",
+    "stickers": "sticker",
+    "avatars": "avatar",
+}
+
+# Schema properties shared by the tools that list messages.
+LISTING_FORMAT_PROPERTIES = {
+    "format": {
+        "type": "string",
+        "enum": list(MESSAGE_FORMATS),
+        "default": "full",
+        "description": (
+            "compact groups consecutive messages by author, shortens CDN links to ids, "
+            "dedupes repeated embeds and fits the output budget"
+        ),
+    },
+    "max_output_tokens": {
+        "type": "integer",
+        "description": (
+            "Output budget in estimated tokens; older messages past it are summarized "
+            f"(compact default: COMPACT_OUTPUT_TOKENS or {DEFAULT_COMPACT_OUTPUT_TOKENS})"
+        ),
+    },
+    "max_output_chars": {
+        "type": "integer",
+        "description": "Output budget in characters; overrides max_output_tokens",
+    },
+}
+
+# Schema property for the read tools that can return JSON instead of text.
+OUTPUT_PROPERTY = {
+    "output": {
+        "type": "string",
+        "enum": list(OUTPUT_MODES),
+        "default": "text",
+        "description": (
+            "json returns one JSON document, ndjson one JSON object per line; "
+            "both skip text formatting"
+        ),
+    },
+}
+
 
 def get_message_text(message: discord.Message) -> str:
     """Prefer clean content when available so mentions are readable."""
@@ -135,3 +197,222 @@ def serialize_message(message: discord.Message) -> dict:
             serialize_attachment(attachment) for attachment in message.attachments
         ],
     }
+
+
+def serialize_user(user: discord.abc.User) -> dict:
+    return {
+        "id": user.id,
+        "name": user.name,
+        "global_name": getattr(user, "global_name", None),
+        "bot": getattr(user, "bot", False),
+    }
+
+
+def output_mode(arguments: dict) -> str:
+    mode = arguments.get("output") or "text"
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Invalid output '{mode}'. Expected one of: {', '.join(OUTPUT_MODES)}")
+    return mode
+
+
+def to_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def render_structured(mode: str, key: str, items: list) -> str:
+    """``{key: items}`` for json, one object per line for ndjson."""
+    if mode == "ndjson":
+        return "\n".join(to_json(item) for item in items)
+    return to_json({key: items})
+
+
+def shorten_cdn_urls(text: str) -> str:
+    """Replace Discord CDN links with short ids, e.g. ``att:1234``."""
+    return _CDN_URL_RE.sub(
+        lambda match: f"{_CDN_KINDS.get(match.group(1), match.group(1))}:{match.group(2)}",
+        text,
+    )
+
+
+def _clip(text: str, limit: int = COMPACT_TEXT_LIMIT) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def format_embed_compact(embed: discord.Embed) -> str:
+    if not isinstance(embed, discord.Embed):
+        return ""
+    parts = []
+    if embed.title:
+        parts.append(embed.title)
+    elif embed.author and embed.author.name:
+        parts.append(embed.author.name)
+    if embed.description:
+        parts.append(_clip(embed.description))
+    for field in embed.fields:
+        parts.append(f"{field.name}: {_clip(str(field.value), COMPACT_TEXT_LIMIT // 2)}")
+    if not parts and embed.image and embed.image.url:
+        parts.append(embed.image.url)
+    if embed.footer and embed.footer.text:
+        parts.append(_clip(embed.footer.text, COMPACT_TEXT_LIMIT // 2))
+    return shorten_cdn_urls(" | ".join(parts))
+
+
+def format_attachment_compact(attachment: discord.Attachment) -> str:
+    size = f" {attachment.size}B" if attachment.size is not None else ""
+    return f"[{attachment.filename} att:{attachment.id}{size}]"
+
+
+class CompactFormatter:
+    """Renders messages of one listing compactly, in display order.
+
+    The author is printed once per run of consecutive messages, and an
+    embed identical to one shown earlier is replaced by a reference to that
+    message. Link previews of URLs already in the text are dropped.
+    """
+
+    def __init__(self):
+        self._author = None
+        self._embeds: dict[str, int] = {}
+
+    def format(self, message) -> str:
+        if isinstance(message, str):
+            # Pre-rendered line (e.g. from the message store).
+            self._author = None
+            return message
+        author = message.author.name if message.author else "Unknown"
+        lines = []
+        if author != self._author:
+            lines.append(f"{author}:")
+            self._author = author
+
+        content = get_message_text(message)
+        parts = []
+        lines_of_text = [line.strip() for line in content.splitlines() if line.strip()]
+        if lines_of_text:
+            parts.append(shorten_cdn_urls(" / ".join(lines_of_text)))
+        for embed in message.embeds:
+            if embed.url and embed.url in content:
+                continue
+            text = format_embed_compact(embed)
+            if not text:
+                continue
+            first_seen = self._embeds.get(text)
+            if first_seen is not None:
+                parts.append(f"[embed as in {first_seen}]")
+            else:
+                self._embeds[text] = message.id
+                parts.append(f"[embed: {text}]")
+        for attachment in message.attachments:
+            parts.append(format_attachment_compact(attachment))
+        if not parts:
+            parts.append("[no content]")
+
+        header = f"  {message.id}"
+        reply_to_id = get_reply_to_message_id(message)
+        if reply_to_id is not None:
+            header += f" re {reply_to_id}"
+        lines.append(f"{header}: " + " ".join(parts))
+        return "\n".join(lines)
+
+
+def output_budget(arguments: dict) -> int | None:
+    """Character budget from a listing tool's arguments, or None for no limit."""
+    if arguments.get("max_output_chars"):
+        return max(1, int(arguments["max_output_chars"]))
+    if arguments.get("max_output_tokens"):
+        return max(1, int(arguments["max_output_tokens"])) * CHARS_PER_TOKEN
+    if arguments.get("format") == "compact":
+        tokens = int(os.getenv("COMPACT_OUTPUT_TOKENS", str(DEFAULT_COMPACT_OUTPUT_TOKENS)))
+        return tokens * CHARS_PER_TOKEN
+    return None
+
+
+def _render(items: list, compact: bool) -> str:
+    if compact:
+        formatter = CompactFormatter()
+        return "\n".join(formatter.format(item) for item in items)
+    return "\n".join(
+        item if isinstance(item, str) else format_message_line(item) for item in items
+    )
+
+
+def _elided_summary(items: list, where: str, budget: int) -> str:
+    messages = [item for item in items if not isinstance(item, str)]
+    summary = f"[{len(items)} {where} messages elided to fit {budget} chars"
+    if messages:
+        ids = sorted(message.id for message in messages)
+        dates = sorted(message.created_at.date().isoformat() for message in messages)
+        authors = Counter(
+            message.author.name if message.author else "Unknown" for message in messages
+        )
+        top = ", ".join(f"{name} ({count})" for name, count in authors.most_common(3))
+        if len(authors) > 3:
+            top += f", {len(authors) - 3} more"
+        date_range = dates[0] if dates[0] == dates[-1] else f"{dates[0]} to {dates[-1]}"
+        summary += f": ids {ids[0]}-{ids[-1]}, {date_range}, from {top}"
+    return summary + "]"
+
+
+def render_message_listing(
+    items: list, arguments: dict, keep: str = "end"
+) -> tuple[str, list]:
+    """Render messages (or pre-rendered lines) in display order for a read tool.
+
+    ``arguments`` selects the format and budget. When the output is over
+    budget, messages are dropped from the start (``keep="end"``, i.e. the
+    newest are kept in an oldest-first listing) or from the end, and a line
+    summarizing what was dropped takes their place. At least one message is
+    kept, truncated if it alone is over budget. Returns the text and the
+    items that made it in.
+    """
+    compact = arguments.get("format") == "compact"
+    budget = output_budget(arguments)
+    text = _render(items, compact)
+    if budget is None or len(text) <= budget:
+        return text, items
+
+    def assemble(count: int) -> str:
+        if keep == "end":
+            cut = len(items) - count
+            parts = [
+                _elided_summary(items[:cut], "earlier", budget),
+                _render(items[cut:], compact),
+            ]
+        else:
+            parts = [
+                _render(items[:count], compact),
+                _elided_summary(items[count:], "later", budget),
+            ]
+        return "\n".join(part for part in parts if part)
+
+    # Largest number of messages that still fits next to the summary.
+    low, high = 0, len(items) - 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if len(assemble(middle)) <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    if low == 0:
+        # Keep one message, cut to fit, so a read from a cursor always moves on.
+        return _truncated_one(items, compact, keep, budget)
+    kept = items[len(items) - low :] if keep == "end" else items[:low]
+    return assemble(low), kept
+
+
+def _truncated_one(items: list, compact: bool, keep: str, budget: int) -> tuple[str, list]:
+    marker = " [truncated]"
+    if keep == "end":
+        kept, rest, where = items[-1:], items[:-1], "earlier"
+    else:
+        kept, rest, where = items[:1], items[1:], "later"
+    summary = _elided_summary(rest, where, budget) if rest else ""
+    room = budget - len(marker) - (len(summary) + 1 if summary else 0)
+    if summary and room < MIN_TRUNCATED_CHARS:
+        summary = f"[{len(rest)} {where} messages elided]"
+        room = budget - len(marker) - len(summary) - 1
+    # The id at the start of the line matters more than staying under a tiny budget.
+    body = _render(kept, compact)[: max(MIN_TRUNCATED_CHARS, room)] + marker
+    parts = [summary, body] if keep == "end" else [body, summary]
+    return "\n".join(part for part in parts if part), kept
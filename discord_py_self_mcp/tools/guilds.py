@@ -2,6 +2,7 @@ from mcp.types import TextContent
 
 from ..bot import client
 from ..tool_utils import NOT_READY_TEXT, format_user_display
+from .embed import OUTPUT_PROPERTY, output_mode, render_structured, serialize_user, to_json
 from .registry import registry
 
 @registry.register(
@@ -9,29 +10,48 @@ from .registry import registry
     description="List all guilds the user is in",
     input_schema={
         "type": "object",
-        "properties": {},
+        "properties": {**OUTPUT_PROPERTY},
     }
 )
 async def list_guilds(arguments: dict):
     if not client.is_ready():
         return [TextContent(type="text", text=NOT_READY_TEXT)]
-    
+
+    try:
+        mode = output_mode(arguments)
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Error listing guilds: {e}")]
+    if mode != "text":
+        guilds = [
+            {"id": g.id, "name": g.name, "member_count": g.member_count} for g in client.guilds
+        ]
+        return [TextContent(type="text", text=render_structured(mode, "guilds", guilds))]
+
     guilds = [f"{g.name} ({g.id})" for g in client.guilds]
     return [TextContent(type="text", text="\n".join(guilds))]
 
 @registry.register(
     name="get_user_info",
+    needs="rest",
     description="Get information about the current user",
     input_schema={
         "type": "object",
-        "properties": {},
+        "properties": {**OUTPUT_PROPERTY},
     }
 )
 async def get_user_info(arguments: dict):
-    if not client.is_ready():
+    user = client.user
+    if user is None:
         return [TextContent(type="text", text=NOT_READY_TEXT)]
 
-    user = client.user
+    try:
+        mode = output_mode(arguments)
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Error getting user info: {e}")]
+    if mode != "text":
+        # A single object reads the same either way.
+        return [TextContent(type="text", text=to_json(serialize_user(user)))]
+
     return [
         TextContent(
             type="text", text=f"User: {format_user_display(user)} ({user.id})"
@@ -0,0 +1,194 @@
+import discord
+from mcp.types import TextContent
+
+from ..bot import client
+from ..cursors import (
+    HISTORY_DIRECTIONS,
+    InvalidCursor,
+    decode_continuation,
+    encode_continuation,
+)
+from ..progress import report_progress
+from ..resolver import get_resolver
+from ..tool_utils import NON_MESSAGEABLE_TEXT, apply_rate_limit, wait_for_route
+from .embed import (
+    LISTING_FORMAT_PROPERTIES,
+    OUTPUT_PROPERTY,
+    CompactFormatter,
+    format_message_line,
+    output_mode,
+    serialize_message,
+    to_json,
+)
+from .registry import registry
+
+HISTORY_PAGE_SIZE = 100
+DEFAULT_HISTORY_MESSAGES = 1000
+MAX_HISTORY_MESSAGES = 50000
+DEFAULT_OUTPUT_BYTES = 256 * 1024
+MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+
+def _clamp(value, default: int, maximum: int) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = default
+    return max(1, min(number, maximum))
+
+
+@registry.register(
+    name="read_message_history",
+    needs="rest",
+    description=(
+        "Page through a channel's full history, beyond read_messages' limit. Returns a "
+        "continuation token to resume from; output is capped by max_output_bytes"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "channel_id": {"type": "string"},
+            "direction": {
+                "type": "string",
+                "enum": list(HISTORY_DIRECTIONS),
+                "default": "backward",
+                "description": (
+                    "backward walks from newest to oldest, forward from oldest to newest"
+                ),
+            },
+            "before": {
+                "type": "string",
+                "description": "Start backward from this message ID (default: the newest)",
+            },
+            "after": {
+                "type": "string",
+                "description": "Start forward after this message ID (default: the first)",
+            },
+            "continuation": {
+                "type": "string",
+                "description": "Token from an earlier call; resumes where it stopped",
+            },
+            "max_messages": {
+                "type": "integer",
+                "default": DEFAULT_HISTORY_MESSAGES,
+                "description": f"Messages to read in this call (max {MAX_HISTORY_MESSAGES})",
+            },
+            "max_output_bytes": {
+                "type": "integer",
+                "default": DEFAULT_OUTPUT_BYTES,
+                "description": (
+                    f"Stop before the returned text exceeds this (max {MAX_OUTPUT_BYTES})"
+                ),
+            },
+            # The budget here is max_output_bytes, with a continuation token.
+            "format": LISTING_FORMAT_PROPERTIES["format"],
+            **OUTPUT_PROPERTY,
+        },
+        "required": ["channel_id"],
+    },
+    priority="background",
+)
+async def read_message_history(arguments: dict):
+    try:
+        channel_id = int(arguments["channel_id"])
+        max_messages = _clamp(
+            arguments.get("max_messages"), DEFAULT_HISTORY_MESSAGES, MAX_HISTORY_MESSAGES
+        )
+        max_output_bytes = _clamp(
+            arguments.get("max_output_bytes"), DEFAULT_OUTPUT_BYTES, MAX_OUTPUT_BYTES
+        )
+        mode = output_mode(arguments)
+
+        if arguments.get("continuation"):
+            try:
+                direction, anchor = decode_continuation(arguments["continuation"], channel_id)
+            except InvalidCursor as exc:
+                return [TextContent(type="text", text=f"Error reading history: {exc}")]
+        else:
+            direction = arguments.get("direction", "backward")
+            if direction not in HISTORY_DIRECTIONS:
+                return [
+                    TextContent(
+                        type="text",
+                        text=(
+                            f"Invalid direction '{direction}'. Expected one of: "
+                            f"{', '.join(HISTORY_DIRECTIONS)}"
+                        ),
+                    )
+                ]
+            start = arguments.get("before" if direction == "backward" else "after")
+            anchor = int(start) if start else None
+
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
+        if not isinstance(channel, discord.abc.Messageable):
+            return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
+
+        route = ("GET", f"/channels/{channel_id}/messages")
+        await apply_rate_limit("action", route=route)
+
+        compact = None
+        if mode == "text" and arguments.get("format") == "compact":
+            compact = CompactFormatter()
+        lines: list[str] = []
+        read = 0
+        output_bytes = 0
+        reached_end = False
+        budget_hit = False
+        while read < max_messages and not budget_hit:
+            page_limit = min(HISTORY_PAGE_SIZE, max_messages - read)
+            if read:
+                await wait_for_route(route)
+            if direction == "backward":
+                before = discord.Object(id=anchor) if anchor else None
+                pages = channel.history(limit=page_limit, before=before)
+            else:
+                after = discord.Object(id=anchor or 0)
+                pages = channel.history(limit=page_limit, after=after, oldest_first=True)
+
+            page_count = 0
+            async for message in pages:
+                if mode != "text":
+                    line = to_json(serialize_message(message))
+                elif compact:
+                    line = compact.format(message)
+                else:
+                    line = format_message_line(message)
+                size = len(line.encode("utf-8")) + 1
+                if output_bytes and output_bytes + size > max_output_bytes:
+                    budget_hit = True
+                    break
+                lines.append(line)
+                output_bytes += size
+                page_count += 1
+                read += 1
+                anchor = message.id
+
+            if not budget_hit and page_count < page_limit:
+                reached_end = True
+                break
+            await report_progress(read, max_messages, f"Read {read} messages")
+
+        order = "newest first" if direction == "backward" else "oldest first"
+        status = f"Read {read} messages ({direction}, {order})"
+        if reached_end or anchor is None:
+            status += "\nEnd of channel history reached"
+        else:
+            if budget_hit:
+                status += f"\nStopped at max_output_bytes={max_output_bytes}"
+            status += f"\ncontinuation: {encode_continuation(channel_id, direction, anchor)}"
+
+        content = []
+        if mode == "json":
+            # The lines are already serialized; join them into one document.
+            content.append(TextContent(type="text", text='{"messages":[' + ",".join(lines) + "]}"))
+        elif lines:
+            content.append(TextContent(type="text", text="\n".join(lines)))
+        content.append(TextContent(type="text", text=status))
+        return content
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error reading history: {str(e)}")]
@@ -3,6 +3,7 @@ import inspect
 from mcp.types import TextContent
 from .registry import registry
 from ..bot import client
+from ..resolver import get_resolver
 from ..tool_utils import NON_MESSAGEABLE_TEXT, apply_rate_limit
 
 
@@ -113,12 +114,10 @@ async def send_slash_command(arguments: dict):
         if not isinstance(options, dict):
             return [TextContent(type="text", text="options must be an object")]
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except Exception:
-                channel = None
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except Exception:
+            channel = None
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
 
@@ -294,19 +293,17 @@ async def click_button(arguments: dict):
         message_id = int(arguments["message_id"])
         custom_id = arguments.get("custom_id")
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
 
-        message = await channel.fetch_message(message_id)
+        message = await get_resolver(client).message(channel, message_id)
         if not message:
             return [TextContent(type="text", text="Message not found")]
 
@@ -374,18 +371,16 @@ async def select_menu(arguments: dict):
         if not isinstance(values, list):
             return [TextContent(type="text", text="values must be a list")]
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
-        message = await channel.fetch_message(message_id)
+        message = await get_resolver(client).message(channel, message_id)
 
         for row_idx, action_row in enumerate(message.components or []):
             for col_idx, component in enumerate(action_row.children):
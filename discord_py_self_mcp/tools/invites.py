@@ -1,11 +1,14 @@
 from mcp.types import TextContent
+from .embed import OUTPUT_PROPERTY, output_mode, render_structured
 from .registry import registry
 from ..bot import client
+from ..resolver import get_resolver
 from ..tool_utils import apply_rate_limit
 
 
 @registry.register(
     name="create_invite",
+    needs="rest",
     description="Create an invite for a channel",
     input_schema={
         "type": "object",
@@ -28,9 +31,7 @@ async def create_invite(arguments: dict):
         max_uses = arguments.get("max_uses", 0)
         temporary = arguments.get("temporary", False)
 
-        channel = client.get_channel(channel_id) or await client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(client).channel(channel_id)
 
         await apply_rate_limit("action")
         invite = await channel.create_invite(
@@ -49,18 +50,31 @@ async def create_invite(arguments: dict):
     description="List invites for a guild",
     input_schema={
         "type": "object",
-        "properties": {"guild_id": {"type": "string"}},
+        "properties": {"guild_id": {"type": "string"}, **OUTPUT_PROPERTY},
         "required": ["guild_id"],
     },
 )
 async def list_invites(arguments: dict):
     try:
         guild_id = int(arguments["guild_id"])
+        mode = output_mode(arguments)
         guild = client.get_guild(guild_id)
         if not guild:
             return [TextContent(type="text", text="Guild not found")]
 
         invites = await guild.invites()
+        if mode != "text":
+            serialized = [
+                {
+                    "code": i.code,
+                    "uses": i.uses,
+                    "max_uses": i.max_uses,
+                    "channel_id": i.channel.id if i.channel else None,
+                    "expires_at": i.expires_at.isoformat() if i.expires_at else None,
+                }
+                for i in invites
+            ]
+            return [TextContent(type="text", text=render_structured(mode, "invites", serialized))]
         invite_list = [f"{i.code} (Uses: {i.uses})" for i in invites]
 
         if not invite_list:
@@ -73,6 +87,7 @@ async def list_invites(arguments: dict):
 
 @registry.register(
     name="delete_invite",
+    needs="rest",
     description="Delete an invite",
     input_schema={
         "type": "object",
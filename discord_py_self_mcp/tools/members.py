@@ -2,6 +2,7 @@ import discord
 from mcp.types import TextContent
 from .registry import registry
 from ..bot import client
+from ..resolver import get_resolver
 from ..tool_utils import apply_rate_limit
 
 @registry.register(
@@ -27,7 +28,7 @@ async def kick_member(arguments: dict):
         if not guild:
             return [TextContent(type="text", text="Guild not found")]
             
-        member = guild.get_member(user_id) or await guild.fetch_member(user_id)
+        member = await get_resolver(client).member(guild, user_id)
         if not member:
             return [TextContent(type="text", text="Member not found")]
 
@@ -125,7 +126,7 @@ async def add_role(arguments: dict):
         if not guild:
             return [TextContent(type="text", text="Guild not found")]
 
-        member = guild.get_member(user_id) or await guild.fetch_member(user_id)
+        member = await get_resolver(client).member(guild, user_id)
         if not member:
             return [TextContent(type="text", text="Member not found")]
 
@@ -163,7 +164,7 @@ async def remove_role(arguments: dict):
         if not guild:
             return [TextContent(type="text", text="Guild not found")]
 
-        member = guild.get_member(user_id) or await guild.fetch_member(user_id)
+        member = await get_resolver(client).member(guild, user_id)
         if not member:
             return [TextContent(type="text", text="Member not found")]
 
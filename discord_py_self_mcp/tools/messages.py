@@ -1,11 +1,29 @@
 import base64
 
 import discord
-from mcp.types import BlobResourceContents, EmbeddedResource, ImageContent, TextContent
+from mcp.types import (
+    BlobResourceContents,
+    EmbeddedResource,
+    ImageContent,
+    ResourceLink,
+    TextContent,
+)
 
-from ..bot import client
+from ..attachment_cache import AttachmentTooLarge, get_attachment_cache
+from ..cursors import InvalidCursor, decode_cursor, encode_cursor, get_cursor_store
+from ..bot import client, message_store
+from ..resolver import get_resolver
 from .registry import registry
-from .embed import build_search_text, format_attachment, format_message_line
+from .embed import (
+    LISTING_FORMAT_PROPERTIES,
+    OUTPUT_PROPERTY,
+    build_search_text,
+    format_attachment,
+    output_mode,
+    render_message_listing,
+    render_structured,
+    serialize_message,
+)
 from ..tool_utils import (
     NON_MESSAGEABLE_TEXT,
     apply_rate_limit,
@@ -15,10 +33,12 @@ from ..tool_utils import (
 )
 
 MAX_ATTACHMENT_BYTES_DEFAULT = 10 * 1024 * 1024
+ATTACHMENT_RETURN_MODES = ("auto", "inline", "path", "resource_link")
 
 
 @registry.register(
     name="send_message",
+    needs="rest",
     description="Send a message to a channel",
     input_schema={
         "type": "object",
@@ -32,6 +52,7 @@ MAX_ATTACHMENT_BYTES_DEFAULT = 10 * 1024 * 1024
         },
         "required": ["channel_id", "content"],
     },
+    priority="interactive",
 )
 async def send_message(arguments: dict):
     try:
@@ -41,14 +62,12 @@ async def send_message(arguments: dict):
         content_error = validate_message_content(content)
         if content_error:
             return [TextContent(type="text", text=content_error)]
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
@@ -57,7 +76,7 @@ async def send_message(arguments: dict):
 
         send_kwargs = build_reply_kwargs(reply_to_message_id, channel_id)
 
-        await apply_rate_limit("message")
+        await apply_rate_limit("message", route=("POST", f"/channels/{channel_id}/messages"))
         message = await channel.send(content, **send_kwargs)
         return [
             TextContent(
@@ -71,12 +90,32 @@ async def send_message(arguments: dict):
 
 @registry.register(
     name="read_messages",
-    description="Read messages from a channel",
+    needs="rest",
+    description=(
+        "Read messages from a channel. Each read returns a cursor; pass it back to "
+        "get only messages sent after it"
+    ),
     input_schema={
         "type": "object",
         "properties": {
             "channel_id": {"type": "string"},
             "limit": {"type": "integer", "default": 50},
+            "cursor": {
+                "type": "string",
+                "description": (
+                    "next_cursor from an earlier read; only newer messages are returned"
+                ),
+            },
+            "since_last_read": {
+                "type": "boolean",
+                "default": False,
+                "description": (
+                    "Continue from the newest message the server returned for this "
+                    "channel last time, without passing a cursor"
+                ),
+            },
+            **LISTING_FORMAT_PROPERTIES,
+            **OUTPUT_PROPERTY,
         },
         "required": ["channel_id"],
     },
@@ -85,32 +124,83 @@ async def read_messages(arguments: dict):
     try:
         channel_id = int(arguments["channel_id"])
         limit = normalize_history_limit(arguments.get("limit"))
-        channel = client.get_channel(channel_id)
-        if not channel:
+        mode = output_mode(arguments)
+        cursors = get_cursor_store()
+        after_id = None
+        if arguments.get("cursor"):
             try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+                after_id = decode_cursor(arguments["cursor"], channel_id)
+            except InvalidCursor as exc:
+                return [TextContent(type="text", text=f"Error reading messages: {exc}")]
+        elif arguments.get("since_last_read"):
+            after_id = cursors.get(channel_id)
+
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
 
-        await apply_rate_limit("action")
-        messages = []
-        async for msg in channel.history(limit=limit):
-            messages.append(format_message_line(msg))
+        await apply_rate_limit("action", route=("GET", f"/channels/{channel_id}/messages"))
+        fetched = []
+        if after_id is None:
+            async for msg in channel.history(limit=limit):
+                fetched.append(msg)
+            fetched.reverse()
+        else:
+            # Oldest first, so a full page leaves no gap before the next read.
+            async for msg in channel.history(
+                limit=limit, after=discord.Object(id=after_id), oldest_first=True
+            ):
+                fetched.append(msg)
+
+        # Reading forward from a cursor keeps the oldest messages when over
+        # budget, and the cursor only moves past what was returned.
+        if mode == "text":
+            text, shown = render_message_listing(
+                fetched, arguments, keep="end" if after_id is None else "start"
+            )
+        else:
+            shown = fetched
+            text = render_structured(mode, "messages", [serialize_message(msg) for msg in fetched])
+        newest_id = max((msg.id for msg in shown), default=after_id or 0)
+        cursors.advance(channel_id, newest_id)
+        next_cursor = f"next_cursor: {encode_cursor(channel_id, newest_id)}"
+        if after_id is not None and not fetched and mode == "text":
+            return [TextContent(type="text", text=f"No new messages\n{next_cursor}")]
+        if after_id is not None and (len(fetched) == limit or len(shown) < len(fetched)):
+            next_cursor += " (more messages may follow; read again with this cursor)"
 
-        return [TextContent(type="text", text="\n".join(reversed(messages)))]
+        return [
+            TextContent(type="text", text=text),
+            TextContent(type="text", text=next_cursor),
+        ]
     except Exception as e:
         return [TextContent(type="text", text=f"Error reading messages: {str(e)}")]
 
 
+def _render_search(hits: list, mode: str, arguments: dict) -> str:
+    """Render search hits, newest first: messages, or records from the message store."""
+    if mode != "text":
+        return render_structured(
+            mode,
+            "messages",
+            [hit if isinstance(hit, dict) else serialize_message(hit) for hit in hits],
+        )
+    items = [hit["line"] if isinstance(hit, dict) else hit for hit in hits[::-1]]
+    text, _ = render_message_listing(items, arguments)
+    return text
+
+
 @registry.register(
     name="search_messages",
+    needs="rest",
     description="Search for messages in a channel",
     input_schema={
         "type": "object",
@@ -118,9 +208,14 @@ async def read_messages(arguments: dict):
             "channel_id": {"type": "string"},
             "query": {
                 "type": "string",
-                "description": "Text to search for (simple containment)",
+                "description": (
+                    "Text to search for (simple containment). Answered from the local "
+                    "message index when MESSAGE_STORE_ENABLED=true"
+                ),
             },
             "limit": {"type": "integer", "default": 50},
+            **LISTING_FORMAT_PROPERTIES,
+            **OUTPUT_PROPERTY,
         },
         "required": ["channel_id", "query"],
     },
@@ -130,34 +225,76 @@ async def search_messages(arguments: dict):
         channel_id = int(arguments["channel_id"])
         query = arguments["query"].lower()
         limit = normalize_history_limit(arguments.get("limit"))
+        mode = output_mode(arguments)
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
 
-        await apply_rate_limit("action")
+        store = message_store if message_store and message_store.is_enabled() else None
         messages = []
+        covered_from = store.live_since(channel_id) if store else None
+        if covered_from is not None:
+            # Everything at or after covered_from was ingested from the gateway.
+            messages.extend(
+                store.search_records(channel_id, query, limit, min_id=covered_from)
+            )
+            if len(messages) >= limit:
+                return [TextContent(type="text", text=_render_search(messages, mode, arguments))]
+
+        await apply_rate_limit("action", route=("GET", f"/channels/{channel_id}/messages"))
+        history_kwargs = {"limit": min(limit * 2, limit + 100)}
+        if covered_from is not None:
+            history_kwargs["before"] = discord.Object(id=covered_from)
+
+        scanned = []
+        bridged = None
+        bridged_at = None
         # Basic filtering using history since standard search API is not always reliable in selfbots without indexing
-        async for msg in channel.history(limit=min(limit * 2, limit + 100)):
+        async for msg in channel.history(**history_kwargs):
+            if store:
+                bridged = store.find_range(channel_id, msg.id)
+                if bridged:
+                    bridged_at = msg.id
+                    break
+                scanned.append(msg)
+
             # Search in content, embeds, and attachment metadata
             search_text = build_search_text(msg)
 
             if query in search_text:
-                messages.append(format_message_line(msg))
+                messages.append(msg)
                 if len(messages) >= limit:
                     break
 
-        if not messages:
+        if store:
+            store.add_history(
+                channel_id,
+                scanned,
+                before_id=covered_from,
+                bridge_range_id=bridged[0] if bridged else None,
+            )
+            if bridged and len(messages) < limit:
+                # The scan reached a range indexed in an earlier session.
+                messages.extend(
+                    store.search_records(
+                        channel_id,
+                        query,
+                        limit - len(messages),
+                        min_id=bridged[1],
+                        max_id=bridged_at,
+                    )
+                )
+
+        if not messages and mode == "text":
             return [
                 TextContent(
                     type="text",
@@ -168,13 +305,14 @@ async def search_messages(arguments: dict):
                 )
             ]
 
-        return [TextContent(type="text", text="\n".join(reversed(messages)))]
+        return [TextContent(type="text", text=_render_search(messages, mode, arguments))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error searching messages: {str(e)}")]
 
 
 @registry.register(
     name="edit_message",
+    needs="rest",
     description="Edit a message sent by the user",
     input_schema={
         "type": "object",
@@ -185,6 +323,7 @@ async def search_messages(arguments: dict):
         },
         "required": ["channel_id", "message_id", "content"],
     },
+    priority="interactive",
 )
 async def edit_message(arguments: dict):
     try:
@@ -195,28 +334,29 @@ async def edit_message(arguments: dict):
         if content_error:
             return [TextContent(type="text", text=content_error)]
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
-        message = await channel.fetch_message(message_id)
+        message = await get_resolver(client).message(channel, message_id)
 
         if message.author.id != client.user.id:
             return [
                 TextContent(type="text", text="Cannot edit messages from other users")
             ]
 
-        await apply_rate_limit("message")
+        await apply_rate_limit(
+            "message", route=("PATCH", f"/channels/{channel_id}/messages/{message_id}")
+        )
         await message.edit(content=content)
+        get_resolver(client).invalidate_message(channel_id, message_id)
         return [TextContent(type="text", text=f"Edited message {message_id}")]
     except Exception as e:
         return [TextContent(type="text", text=f"Error editing message: {str(e)}")]
@@ -224,6 +364,7 @@ async def edit_message(arguments: dict):
 
 @registry.register(
     name="delete_message",
+    needs="rest",
     description="Delete a message",
     input_schema={
         "type": "object",
@@ -239,28 +380,29 @@ async def delete_message(arguments: dict):
         channel_id = int(arguments["channel_id"])
         message_id = int(arguments["message_id"])
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
-        message = await channel.fetch_message(message_id)
+        message = await get_resolver(client).message(channel, message_id)
 
         if message.author.id != client.user.id:
             return [
                 TextContent(type="text", text="Cannot delete messages from other users")
             ]
 
-        await apply_rate_limit("action")
+        await apply_rate_limit(
+            "action", route=("DELETE", f"/channels/{channel_id}/messages/{message_id}")
+        )
         await message.delete()
+        get_resolver(client).invalidate_message(channel_id, message_id)
         return [TextContent(type="text", text=f"Deleted message {message_id}")]
     except Exception as e:
         return [TextContent(type="text", text=f"Error deleting message: {str(e)}")]
@@ -268,6 +410,7 @@ async def delete_message(arguments: dict):
 
 @registry.register(
     name="get_message_attachments",
+    needs="rest",
     description=(
         "Get attachment metadata for a message and optionally download attachment "
         "content as MCP image/resource outputs"
@@ -291,6 +434,16 @@ async def delete_message(arguments: dict):
                 "default": MAX_ATTACHMENT_BYTES_DEFAULT,
                 "description": "Skip downloads above this size",
             },
+            "return_mode": {
+                "type": "string",
+                "enum": list(ATTACHMENT_RETURN_MODES),
+                "default": "auto",
+                "description": (
+                    "How downloads are returned: inline base64, a local file path, "
+                    "or a resource link to the cached file. auto inlines small files "
+                    "and links large ones"
+                ),
+            },
         },
         "required": ["channel_id", "message_id"],
     },
@@ -302,22 +455,31 @@ async def get_message_attachments(arguments: dict):
         attachment_index = arguments.get("attachment_index")
         download_content = arguments.get("download_content", True)
         max_bytes = int(arguments.get("max_bytes", MAX_ATTACHMENT_BYTES_DEFAULT))
+        return_mode = arguments.get("return_mode", "auto")
+        if return_mode not in ATTACHMENT_RETURN_MODES:
+            return [
+                TextContent(
+                    type="text",
+                    text=(
+                        f"Invalid return_mode '{return_mode}'. Expected one of: "
+                        f"{', '.join(ATTACHMENT_RETURN_MODES)}"
+                    ),
+                )
+            ]
 
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
 
         if not channel:
             return [TextContent(type="text", text="Channel not found")]
         if not isinstance(channel, discord.abc.Messageable):
             return [TextContent(type="text", text=NON_MESSAGEABLE_TEXT)]
 
-        message = await channel.fetch_message(message_id)
+        message = await get_resolver(client).message(channel, message_id)
         attachments = list(message.attachments)
         if not attachments:
             return [TextContent(type="text", text="Message has no attachments")]
@@ -350,6 +512,7 @@ async def get_message_attachments(arguments: dict):
         if not download_content:
             return response
 
+        cache = get_attachment_cache()
         for index, attachment in indexed_attachments:
             if attachment.size is not None and attachment.size > max_bytes:
                 response.append(
@@ -363,25 +526,23 @@ async def get_message_attachments(arguments: dict):
                 )
                 continue
 
-            blob = await attachment.read()
-            encoded = base64.b64encode(blob).decode("ascii")
-            mime_type = attachment.content_type or "application/octet-stream"
-
-            if mime_type.startswith("image/"):
-                response.append(
-                    ImageContent(type="image", data=encoded, mimeType=mime_type)
-                )
-            else:
+            try:
+                cached = await cache.fetch(attachment, max_bytes)
+            except AttachmentTooLarge:
                 response.append(
-                    EmbeddedResource(
-                        type="resource",
-                        resource=BlobResourceContents(
-                            uri=attachment.url,
-                            mimeType=mime_type,
-                            blob=encoded,
+                    TextContent(
+                        type="text",
+                        text=(
+                            f"Skipped attachment {index} ({attachment.filename}) because "
+                            f"it exceeds max_bytes={max_bytes}"
                         ),
                     )
                 )
+                continue
+            mode = return_mode
+            if mode == "auto":
+                mode = "inline" if cached.size <= cache.config.inline_max_bytes else "resource_link"
+            response.append(_attachment_output(attachment, index, cached, mode))
 
         return response
     except discord.NotFound:
@@ -392,3 +553,36 @@ async def get_message_attachments(arguments: dict):
         return [
             TextContent(type="text", text=f"Error getting message attachments: {str(e)}")
         ]
+
+
+def _attachment_output(attachment, index: int, cached, mode: str):
+    mime_type = attachment.content_type or "application/octet-stream"
+    if mode == "path":
+        return TextContent(
+            type="text",
+            text=(
+                f"Attachment {index} ({attachment.filename}) saved to {cached.path} "
+                f"size={cached.size} sha256={cached.sha256} content_type={mime_type}"
+            ),
+        )
+    if mode == "resource_link":
+        return ResourceLink(
+            type="resource_link",
+            uri=cached.path.resolve().as_uri(),
+            name=attachment.filename,
+            mimeType=mime_type,
+            size=cached.size,
+            description=f"Attachment {index} of the message, cached locally",
+        )
+
+    encoded = base64.b64encode(cached.path.read_bytes()).decode("ascii")
+    if mime_type.startswith("image/"):
+        return ImageContent(type="image", data=encoded, mimeType=mime_type)
+    return EmbeddedResource(
+        type="resource",
+        resource=BlobResourceContents(
+            uri=attachment.url,
+            mimeType=mime_type,
+            blob=encoded,
+        ),
+    )
@@ -6,6 +6,7 @@ from .registry import registry
 
 @registry.register(
     name="edit_profile",
+    needs="rest",
     description="Edit user profile fields supported by this server (bio and accent color)",
     input_schema={
         "type": "object",
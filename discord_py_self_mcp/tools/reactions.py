@@ -1,11 +1,13 @@
 from mcp.types import TextContent
 
 from ..bot import client
+from ..resolver import get_resolver
 from ..tool_utils import apply_rate_limit
 from .registry import registry
 
 @registry.register(
     name="add_reaction",
+    needs="rest",
     description="Add a reaction to a message",
     input_schema={
         "type": "object",
@@ -23,10 +25,13 @@ async def add_reaction(arguments: dict):
         message_id = int(arguments["message_id"])
         emoji = arguments["emoji"]
         
-        channel = client.get_channel(channel_id) or await client.fetch_channel(channel_id)
-        message = await channel.fetch_message(message_id)
+        channel = await get_resolver(client).channel(channel_id)
+        message = await get_resolver(client).message(channel, message_id)
 
-        await apply_rate_limit("action")
+        await apply_rate_limit(
+            "action",
+            route=("PUT", f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"),
+        )
         await message.add_reaction(emoji)
         return [TextContent(type="text", text=f"Added reaction {emoji} to message {message_id}")]
     except Exception as e:
@@ -34,6 +39,7 @@ async def add_reaction(arguments: dict):
 
 @registry.register(
     name="remove_reaction",
+    needs="rest",
     description="Remove a reaction from a message",
     input_schema={
         "type": "object",
@@ -53,16 +59,28 @@ async def remove_reaction(arguments: dict):
         emoji = arguments["emoji"]
         user_id = arguments.get("user_id")
         
-        channel = client.get_channel(channel_id) or await client.fetch_channel(channel_id)
-        message = await channel.fetch_message(message_id)
+        channel = await get_resolver(client).channel(channel_id)
+        message = await get_resolver(client).message(channel, message_id)
 
         if user_id:
-            user = await client.fetch_user(int(user_id))
-            await apply_rate_limit("action")
+            user = await get_resolver(client).user(int(user_id))
+            await apply_rate_limit(
+                "action",
+                route=(
+                    "DELETE",
+                    f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user.id}",
+                ),
+            )
             await message.remove_reaction(emoji, user)
             return [TextContent(type="text", text=f"Removed reaction {emoji} from {user.name}")]
         else:
-            await apply_rate_limit("action")
+            await apply_rate_limit(
+                "action",
+                route=(
+                    "DELETE",
+                    f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me",
+                ),
+            )
             await message.remove_reaction(emoji, client.user)
             return [TextContent(type="text", text=f"Removed own reaction {emoji}")]
     except Exception as e:
@@ -1,14 +1,59 @@
+import importlib
+import time
 from typing import Callable, Awaitable
-from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource, ResourceLink
+
+from discord_py_self_mcp.rate_limiter import (
+    DEFAULT_PRIORITY,
+    current_priority,
+    normalize_priority,
+)
+from discord_py_self_mcp.metrics import CallTiming, ServerMetrics, current_call
+from discord_py_self_mcp.readiness import (
+    DEFAULT_READINESS,
+    NotReady,
+    normalize_readiness,
+    readiness,
+)
+
+ToolHandler = Callable[
+    [dict], Awaitable[list[TextContent | ImageContent | EmbeddedResource | ResourceLink]]
+]
+
+def is_error_result(result: list) -> bool:
+    # Tools report failures as a text block starting with "Error".
+    return bool(result) and isinstance(result[0], TextContent) and result[0].text.startswith("Error")
+
+
+def _result_bytes(result: list) -> int:
+    return sum(len(item.model_dump_json(by_alias=True, exclude_none=True)) for item in result)
 
-ToolHandler = Callable[[dict], Awaitable[list[TextContent | ImageContent | EmbeddedResource]]]
 
 class ToolRegistry:
     def __init__(self):
         self.tools: dict[str, Tool] = {}
         self.handlers: dict[str, ToolHandler] = {}
+        self.priorities: dict[str, str] = {}
+        self.modules: dict[str, str] = {}
+        self.needs: dict[str, str] = {}
+        self.metrics = ServerMetrics()
+
+    def register(
+        self,
+        name: str,
+        description: str,
+        input_schema: dict,
+        priority: str = DEFAULT_PRIORITY,
+        needs: str = DEFAULT_READINESS,
+    ):
+        """Register a tool handler.
+
+        ``needs`` is how far the Discord client must be connected before the
+        handler runs: ``gateway`` (READY cache), ``rest`` (logged in) or ``none``.
+        """
+        priority = normalize_priority(priority)
+        needs = normalize_readiness(needs)
 
-    def register(self, name: str, description: str, input_schema: dict):
         def decorator(func: ToolHandler):
             self.tools[name] = Tool(
                 name=name,
@@ -16,19 +61,102 @@ class ToolRegistry:
                 inputSchema=input_schema
             )
             self.handlers[name] = func
+            self.priorities[name] = priority
+            self.needs[name] = needs
+            self.modules[name] = func.__module__
             return func
         return decorator
 
+    def load_catalog(self, entries: list[dict]) -> None:
+        """Declare tools from static metadata without importing their modules.
+
+        A tool's module is imported on its first call, and its decorators
+        then replace the catalog entry with the real registration.
+        """
+        for entry in entries:
+            name = entry["name"]
+            if name in self.handlers:
+                continue
+            self.tools[name] = Tool(
+                name=name,
+                description=entry["description"],
+                inputSchema=entry["inputSchema"],
+            )
+            self.priorities[name] = normalize_priority(entry.get("priority"))
+            self.needs[name] = normalize_readiness(entry.get("needs"))
+            self.modules[name] = entry["module"]
+
+    def describe(self) -> list[dict]:
+        """Catalog entries for every tool whose implementation is loaded."""
+        return [
+            {
+                "name": name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+                "priority": self.priorities[name],
+                "needs": self.needs[name],
+                "module": self.modules[name],
+            }
+            for name, tool in self.tools.items()
+            if name in self.handlers
+        ]
+
     def get_tool_definitions(self) -> list[Tool]:
         return list(self.tools.values())
 
-    async def call_tool(self, name: str, arguments: dict) -> list[TextContent | ImageContent | EmbeddedResource]:
+    def _resolve_handler(self, name: str) -> ToolHandler | None:
         handler = self.handlers.get(name)
+        if handler is None and name in self.modules:
+            importlib.import_module(self.modules[name])
+            handler = self.handlers.get(name)
+        return handler
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict,
+        *,
+        priority: str | None = None,
+        ready_timeout: float | None = None,
+    ) -> list[TextContent | ImageContent | EmbeddedResource | ResourceLink]:
+        """Run a tool handler with its rate-limit lane set for the call.
+
+        ``priority`` overrides the lane the tool was registered with. Tools
+        that need the gateway or a login first wait for it, for at most
+        ``ready_timeout`` seconds (``TOOL_READY_TIMEOUT`` by default).
+        """
+        handler = self._resolve_handler(name)
         if not handler:
-            available_tools = ", ".join(sorted(self.handlers))
+            available_tools = ", ".join(sorted(self.tools))
             raise ValueError(
                 f"Unknown tool '{name}'. Available tools: {available_tools}"
             )
-        return await handler(arguments)
+        started = time.monotonic()
+        try:
+            ready_wait = await readiness.wait(self.needs[name], ready_timeout)
+        except NotReady as exc:
+            waited = time.monotonic() - started
+            self.metrics.record_call(name, elapsed=waited, error=True, ready_wait=waited)
+            return [TextContent(type="text", text=str(exc))]
+
+        lane = normalize_priority(priority) if priority else self.priorities[name]
+        timing = CallTiming()
+        priority_token = current_priority.set(lane)
+        timing_token = current_call.set(timing)
+        result = None
+        try:
+            result = await handler(arguments)
+            return result
+        finally:
+            current_call.reset(timing_token)
+            current_priority.reset(priority_token)
+            self.metrics.record_call(
+                name,
+                elapsed=time.monotonic() - started,
+                error=result is None or is_error_result(result),
+                ready_wait=ready_wait,
+                timing=timing,
+                response_bytes=_result_bytes(result or []),
+            )
 
 registry = ToolRegistry()
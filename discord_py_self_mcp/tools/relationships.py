@@ -1,7 +1,9 @@
 from mcp.types import TextContent
 
 from ..bot import client
+from ..resolver import get_resolver
 from ..tool_utils import apply_rate_limit, format_user_display
+from .embed import OUTPUT_PROPERTY, output_mode, render_structured, serialize_user
 from .registry import registry
 
 @registry.register(
@@ -9,12 +11,16 @@ from .registry import registry
     description="List all friends",
     input_schema={
         "type": "object",
-        "properties": {}
+        "properties": {**OUTPUT_PROPERTY}
     }
 )
 async def list_friends(arguments: dict):
     try:
+        mode = output_mode(arguments)
         friends = client.friends
+        if mode != "text":
+            serialized = [serialize_user(f) for f in friends or []]
+            return [TextContent(type="text", text=render_structured(mode, "friends", serialized))]
         if not friends:
              return [TextContent(type="text", text="Your friends list is empty.")]
 
@@ -67,6 +73,7 @@ async def send_friend_request(arguments: dict):
 
 @registry.register(
     name="add_friend",
+    needs="rest",
     description="Add a friend by User ID",
     input_schema={
         "type": "object",
@@ -79,7 +86,7 @@ async def send_friend_request(arguments: dict):
 async def add_friend(arguments: dict):
     try:
         user_id = int(arguments["user_id"])
-        user = await client.fetch_user(user_id)
+        user = await get_resolver(client).user(user_id)
         await apply_rate_limit("action")
         await user.send_friend_request()
         return [TextContent(type="text", text=f"Sent friend request to {format_user_display(user)}")]
@@ -88,6 +95,7 @@ async def add_friend(arguments: dict):
 
 @registry.register(
     name="remove_friend",
+    needs="rest",
     description="Remove a friend",
     input_schema={
         "type": "object",
@@ -100,7 +108,7 @@ async def add_friend(arguments: dict):
 async def remove_friend(arguments: dict):
     try:
         user_id = int(arguments["user_id"])
-        user = client.get_user(user_id) or await client.fetch_user(user_id)
+        user = await get_resolver(client).user(user_id)
         await apply_rate_limit("action")
         await user.remove_friend()
         return [TextContent(type="text", text=f"Removed friend {format_user_display(user)}")]
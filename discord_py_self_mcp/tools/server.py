@@ -0,0 +1,74 @@
+import json
+
+from mcp.types import TextContent
+
+from ..bot import client, gateway_cache, rate_limiter
+from ..discrawl_archive import get_discrawl_archive
+from ..discrawl_pool import get_discrawl_pool
+from ..event_bus import get_event_bus
+from ..resolver import get_resolver
+from .registry import registry
+
+
+@registry.register(
+    name="get_server_metrics",
+    needs="none",
+    description=(
+        "Report per-tool call counts, error counts, p50/p95/p99 latency, time spent "
+        "waiting for rate limits and Discord HTTP, and bytes returned"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "tool": {"type": "string", "description": "Only report this tool"},
+            "format": {
+                "type": "string",
+                "enum": ["json", "prometheus"],
+                "default": "json",
+            },
+        },
+    },
+)
+async def get_server_metrics(arguments: dict):
+    try:
+        if arguments.get("format") == "prometheus":
+            return [TextContent(type="text", text=registry.metrics.render_prometheus())]
+
+        report = registry.metrics.snapshot(arguments.get("tool"))
+        if rate_limiter is not None:
+            report["rate_limit"] = rate_limiter.get_stats()
+        report["resolver"] = get_resolver(client).get_stats()
+        report["subscriptions"] = get_event_bus().get_stats()
+        report["discrawl"] = get_discrawl_pool().get_stats()
+        report["discrawl"]["archive"] = get_discrawl_archive().get_stats()
+        return [TextContent(type="text", text=json.dumps(report, indent=2))]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error reading metrics: {str(e)}")]
+
+
+@registry.register(
+    name="get_cache_report",
+    needs="none",
+    description=(
+        "Report gateway cache sizes per guild (cached members, channels, threads, roles, "
+        "emojis, messages), the cache settings in effect and the process RSS"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "guild_id": {"type": "string", "description": "Only report this guild"},
+            "limit": {
+                "type": "integer",
+                "default": 25,
+                "description": "Guilds to list, largest member caches first",
+            },
+        },
+    },
+)
+async def get_cache_report(arguments: dict):
+    try:
+        guild_id = int(arguments["guild_id"]) if arguments.get("guild_id") else None
+        report = gateway_cache.report(client, guild_id, int(arguments.get("limit", 25)))
+        return [TextContent(type="text", text=json.dumps(report, indent=2))]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error reading cache report: {str(e)}")]
@@ -2,12 +2,21 @@ import discord
 from mcp.types import TextContent
 
 from ..bot import client
+from ..resolver import get_resolver
 from ..tool_utils import apply_rate_limit, validate_message_content
 from .registry import registry
-from .embed import format_message_line
+from .embed import (
+    LISTING_FORMAT_PROPERTIES,
+    OUTPUT_PROPERTY,
+    output_mode,
+    render_message_listing,
+    render_structured,
+    serialize_message,
+)
 
 @registry.register(
     name="create_thread",
+    needs="rest",
     description="Create a new thread",
     input_schema={
         "type": "object",
@@ -30,7 +39,7 @@ async def create_thread(arguments: dict):
         message_id = arguments.get("message_id")
         content = arguments.get("content")
         
-        channel = client.get_channel(channel_id) or await client.fetch_channel(channel_id)
+        channel = await get_resolver(client).channel(channel_id)
 
         if isinstance(channel, discord.ForumChannel):
             thread_content = content or name or "New thread"
@@ -48,7 +57,7 @@ async def create_thread(arguments: dict):
 
         message = None
         if message_id:
-            message = await channel.fetch_message(int(message_id))
+            message = await get_resolver(client).message(channel, int(message_id))
         else:
             return [
                 TextContent(
@@ -68,6 +77,7 @@ async def create_thread(arguments: dict):
 
 @registry.register(
     name="archive_thread",
+    needs="rest",
     description="Archive or unarchive a thread",
     input_schema={
         "type": "object",
@@ -83,7 +93,7 @@ async def archive_thread(arguments: dict):
         thread_id = int(arguments["thread_id"])
         archived = arguments["archived"]
         
-        thread = client.get_channel(thread_id) or await client.fetch_channel(thread_id)
+        thread = await get_resolver(client).channel(thread_id)
         if not isinstance(thread, discord.Thread):
             return [TextContent(type="text", text="Channel is not a thread")]
             
@@ -95,12 +105,15 @@ async def archive_thread(arguments: dict):
 
 @registry.register(
     name="read_thread_messages",
+    needs="rest",
     description="Read messages from a thread",
     input_schema={
         "type": "object",
         "properties": {
             "thread_id": {"type": "string"},
-            "limit": {"type": "integer", "default": 50}
+            "limit": {"type": "integer", "default": 50},
+            **LISTING_FORMAT_PROPERTIES,
+            **OUTPUT_PROPERTY,
         },
         "required": ["thread_id"]
     }
@@ -109,15 +122,14 @@ async def read_thread_messages(arguments: dict):
     try:
         thread_id = int(arguments["thread_id"])
         limit = arguments.get("limit", 50)
+        mode = output_mode(arguments)
         
-        thread = client.get_channel(thread_id)
-        if not thread:
-            try:
-                thread = await client.fetch_channel(thread_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Thread not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to thread")]
+        try:
+            thread = await get_resolver(client).channel(thread_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Thread not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to thread")]
         
         if not thread:
             return [TextContent(type="text", text="Thread not found")]
@@ -126,12 +138,16 @@ async def read_thread_messages(arguments: dict):
         
         messages = []
         async for msg in thread.history(limit=limit):
-            messages.append(format_message_line(msg))
+            messages.append(msg)
         
+        if mode != "text":
+            serialized = [serialize_message(msg) for msg in messages[::-1]]
+            return [TextContent(type="text", text=render_structured(mode, "messages", serialized))]
         if not messages:
             return [TextContent(type="text", text="No messages found in thread")]
         
-        return [TextContent(type="text", text="\n".join(reversed(messages)))]
+        text, _ = render_message_listing(messages[::-1], arguments)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         return [TextContent(type="text", text=f"Error reading thread messages: {str(e)}")]
 
@@ -141,7 +157,8 @@ async def read_thread_messages(arguments: dict):
     input_schema={
         "type": "object",
         "properties": {
-            "channel_id": {"type": "string"}
+            "channel_id": {"type": "string"},
+            **OUTPUT_PROPERTY,
         },
         "required": ["channel_id"]
     }
@@ -149,19 +166,25 @@ async def read_thread_messages(arguments: dict):
 async def list_active_threads(arguments: dict):
     try:
         channel_id = int(arguments["channel_id"])
+        mode = output_mode(arguments)
         
-        channel = client.get_channel(channel_id)
-        if not channel:
-            try:
-                channel = await client.fetch_channel(channel_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Channel not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to channel")]
+        try:
+            channel = await get_resolver(client).channel(channel_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Channel not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to channel")]
         
         if not hasattr(channel, 'threads'):
             return [TextContent(type="text", text=f"Channel type {type(channel).__name__} does not support threads")]
         
+        if mode != "text":
+            serialized = [
+                {"id": thread.id, "name": thread.name, "archived": thread.archived}
+                for thread in channel.threads
+            ]
+            return [TextContent(type="text", text=render_structured(mode, "threads", serialized))]
+
         threads = []
         for thread in channel.threads:
             threads.append(f"{thread.name} (ID: {thread.id}, Archived: {thread.archived})")
@@ -175,6 +198,7 @@ async def list_active_threads(arguments: dict):
 
 @registry.register(
     name="send_thread_message",
+    needs="rest",
     description="Send a message to a thread",
     input_schema={
         "type": "object",
@@ -183,7 +207,8 @@ async def list_active_threads(arguments: dict):
             "content": {"type": "string"}
         },
         "required": ["thread_id", "content"]
-    }
+    },
+    priority="interactive"
 )
 async def send_thread_message(arguments: dict):
     try:
@@ -193,19 +218,17 @@ async def send_thread_message(arguments: dict):
         if content_error:
             return [TextContent(type="text", text=content_error)]
         
-        thread = client.get_channel(thread_id)
-        if not thread:
-            try:
-                thread = await client.fetch_channel(thread_id)
-            except discord.NotFound:
-                return [TextContent(type="text", text="Thread not found")]
-            except discord.Forbidden:
-                return [TextContent(type="text", text="Access denied to thread")]
+        try:
+            thread = await get_resolver(client).channel(thread_id)
+        except discord.NotFound:
+            return [TextContent(type="text", text="Thread not found")]
+        except discord.Forbidden:
+            return [TextContent(type="text", text="Access denied to thread")]
         
         if not isinstance(thread, discord.Thread):
             return [TextContent(type="text", text=f"Channel {thread_id} is not a thread")]
         
-        await apply_rate_limit("message")
+        await apply_rate_limit("message", route=("POST", f"/channels/{thread_id}/messages"))
         message = await thread.send(content)
         return [TextContent(type="text", text=f"Message sent to thread (message_id={message.id})")]
     except Exception as e:
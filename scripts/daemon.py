@@ -6,7 +6,6 @@ Auto-restart on code change: Enabled
 
 import asyncio
 import base64
-import hashlib
 import json
 import os
 import secrets
@@ -45,7 +44,24 @@ from discord_py_self_mcp.cli_runtime import (
     chmod_private,
     ensure_runtime_dir,
 )
+from discord_py_self_mcp.attachment_cache import AttachmentTooLarge, get_attachment_cache
+from discord_py_self_mcp.bot import client as bot_client, rate_limiter
+from discord_py_self_mcp.code_watcher import PACKAGE_DIR, CodeWatcher, project_module_files
+from discord_py_self_mcp.daemon_protocol import (
+    LEGACY_PREFIX,
+    MAX_FRAME_BYTES,
+    PROTOCOL_VERSION,
+    ProtocolError,
+    encode_frame,
+    read_frame,
+)
+from discord_py_self_mcp.event_bus import EventFilter, get_event_bus
+from discord_py_self_mcp.hot_reload import reload_class, reload_modules, split_changes
 from discord_py_self_mcp.logging_utils import log_to_stderr
+from discord_py_self_mcp.metrics import metrics_port, start_metrics_server
+from discord_py_self_mcp.progress import current_progress
+from discord_py_self_mcp.resolver import get_resolver
+from discord_py_self_mcp.tools import registry
 from discord_py_self_mcp.tool_utils import (
     NON_MESSAGEABLE_TEXT,
     build_reply_kwargs,
@@ -54,8 +70,27 @@ from discord_py_self_mcp.tool_utils import (
 from discord_py_self_mcp.tools.embed import serialize_attachment, serialize_message
 
 DAEMON_SCRIPT = SCRIPT_DIR / "daemon.py"
-CHECK_INTERVAL = 2
+TOOLS_DIR = PACKAGE_DIR / "tools"
+# Methods that own the gateway session and client sockets. An edit to any of
+# them needs a full restart; other DiscordDaemon methods are hot-reloaded.
+CONNECTION_METHODS = (
+    "__init__",
+    "monitor_code_changes",
+    "_on_code_change",
+    "restart_daemon",
+    "connect",
+    "handle_client",
+    "_is_authorized",
+    "_handle_legacy_client",
+    "_handle_framed_client",
+    "_serve_frame",
+    "start_server",
+    "run",
+)
+CHECK_INTERVAL = 2  # mtime polling interval where inotify is unavailable
 MAX_ATTACHMENT_BYTES_DEFAULT = 10 * 1024 * 1024
+THREAD_CONCURRENCY_DEFAULT = 4
+THREAD_CONCURRENCY_MAX = 16
 
 
 def _safe_unlink(path: Path) -> None:
@@ -79,6 +114,16 @@ def _load_or_create_auth_token() -> str:
     return token
 
 
+def _thread_concurrency(value=None) -> int:
+    if value is None:
+        value = os.getenv("DAEMON_THREAD_CONCURRENCY", THREAD_CONCURRENCY_DEFAULT)
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        workers = THREAD_CONCURRENCY_DEFAULT
+    return max(1, min(workers, THREAD_CONCURRENCY_MAX))
+
+
 def _get_token_or_exit() -> str:
     token = os.getenv("DISCORD_TOKEN")
     if token:
@@ -90,12 +135,13 @@ def _get_token_or_exit() -> str:
 
 class DiscordDaemon:
     def __init__(self):
-        self.client = discord.Client()
+        # The MCP tools resolve everything through this client, so sharing it
+        # lets MCP thin clients and dcli use one gateway session and cache.
+        self.client = bot_client
         self._connected = asyncio.Event()
         self._shutdown = asyncio.Event()
         self.server = None
         self.responses = {}
-        self.last_code_hash = None
         self.code_check_task = None
         self.auth_token = _load_or_create_auth_token()
 
@@ -138,25 +184,46 @@ class DiscordDaemon:
             return None
         return discord.Object(id=discord.utils.time_snowflake(after_dt))
 
-    def get_code_hash(self):
-        """Calculate a stable hash of daemon.py to detect changes."""
-        if not DAEMON_SCRIPT.exists():
-            return None
-        with open(DAEMON_SCRIPT, "rb") as handle:
-            return hashlib.sha256(handle.read()).hexdigest()
-
     async def monitor_code_changes(self):
-        """Monitor daemon.py for changes and auto-restart."""
-        self.last_code_hash = self.get_code_hash()
-        while not self._shutdown.is_set():
-            await asyncio.sleep(CHECK_INTERVAL)
-            current_hash = self.get_code_hash()
-            if current_hash != self.last_code_hash:
+        """Restart the daemon when it or any project module it imported is edited."""
+        watcher = CodeWatcher(
+            project_module_files([DAEMON_SCRIPT, *TOOLS_DIR.glob("*.py")]),
+            self._on_code_change,
+            poll_interval=CHECK_INTERVAL,
+        )
+        log_to_stderr(
+            f"[{datetime.now()}] Watching {len(watcher.files)} source files ({watcher.backend})"
+        )
+        await watcher.run()
+
+    async def _on_code_change(self, changed):
+        names = ", ".join(sorted(path.name for path in changed))
+        modules, others = split_changes(changed)
+        script_changed = DAEMON_SCRIPT in others
+        if [path for path in others if path != DAEMON_SCRIPT]:
+            log_to_stderr(
+                f"[{datetime.now()}] Code change detected in {names}. Restarting daemon..."
+            )
+            await self.restart_daemon()
+            return
+
+        # Tool and handler code is swapped in place; the gateway session stays up.
+        try:
+            if modules:
+                reload_modules(modules, extra_modules=[type(self).__module__])
+            if script_changed and not reload_class(self, DAEMON_SCRIPT, CONNECTION_METHODS):
                 log_to_stderr(
-                    f"[{datetime.now()}] Code change detected. Restarting daemon..."
+                    f"[{datetime.now()}] Connection code changed in {names}. Restarting daemon..."
                 )
                 await self.restart_daemon()
                 return
+        except Exception as exc:
+            # Most often a half-saved file; the previous code keeps serving.
+            log_to_stderr(
+                f"[{datetime.now()}] Reload of {names} failed: {type(exc).__name__}: {exc}"
+            )
+            return
+        log_to_stderr(f"[{datetime.now()}] Reloaded {names}")
 
     async def restart_daemon(self):
         """Restart the daemon process."""
@@ -179,24 +246,40 @@ class DiscordDaemon:
         """Connect to Discord and wait for the initial ready signal."""
         token = _get_token_or_exit()
 
-        @self.client.event
-        async def on_ready():
-            log_to_stderr(f"[{datetime.now()}] Connected as {self.client.user}")
-            self._connected.set()
-
-        @self.client.event
-        async def on_disconnect():
-            log_to_stderr(f"[{datetime.now()}] Disconnected from Discord")
-
         asyncio.create_task(self.client.start(token))
-        await asyncio.wait_for(self._connected.wait(), timeout=30)
+        await asyncio.wait_for(self.client.wait_until_ready(), timeout=30)
+        log_to_stderr(f"[{datetime.now()}] Connected as {self.client.user}")
+        self._connected.set()
+
+    async def handle_command(self, command_data, emit=None):
+        """Execute a command and return a JSON-serializable result.
 
-    async def handle_command(self, command_data):
-        """Execute a command and return a JSON-serializable result."""
+        ``emit`` is set for streaming requests; commands that support it send
+        partial results through it before returning.
+        """
         cmd = command_data.get("command")
         args = command_data.get("args", {})
 
         try:
+            if cmd == "ping":
+                return {"ok": True, "ready": self.client.is_ready()}
+            if cmd == "call_tool":
+                return await self._call_tool(
+                    args.get("name"),
+                    args.get("arguments") or {},
+                    args.get("priority"),
+                    args.get("ready_timeout"),
+                    emit,
+                )
+            if cmd == "subscribe":
+                return await self._subscribe(
+                    args.get("channel_ids") or [],
+                    args.get("guild_ids") or [],
+                    args.get("dms", False),
+                    args.get("max_buffer"),
+                    args.get("max_events"),
+                    emit,
+                )
             if cmd == "list_guilds":
                 return self._list_guilds()
             if cmd == "list_channels":
@@ -218,6 +301,7 @@ class DiscordDaemon:
                     args.get("attachment_index"),
                     args.get("download_content", False),
                     args.get("max_bytes", MAX_ATTACHMENT_BYTES_DEFAULT),
+                    args.get("return_mode", "inline"),
                 )
             if cmd == "list_threads":
                 return await self._list_threads(
@@ -238,6 +322,8 @@ class DiscordDaemon:
                     args.get("guild_id"),
                     args.get("within_hours", 4),
                     args.get("limit_per_thread", 30),
+                    args.get("concurrency"),
+                    on_thread=emit,
                 )
             if cmd == "delete_message":
                 return await self._delete_message(
@@ -270,6 +356,58 @@ class DiscordDaemon:
         except Exception as exc:
             return {"error": str(exc)}
 
+    async def _call_tool(self, name, arguments, priority=None, ready_timeout=None, emit=None):
+        on_progress = None
+        if emit is not None:
+
+            async def on_progress(progress, total, message):
+                await emit({"progress": progress, "total": total, "message": message})
+
+        token = current_progress.set(on_progress)
+        try:
+            content = await registry.call_tool(
+                name, arguments, priority=priority, ready_timeout=ready_timeout
+            )
+        finally:
+            current_progress.reset(token)
+        return {
+            "content": [
+                item.model_dump(mode="json", by_alias=True, exclude_none=True)
+                for item in content
+            ]
+        }
+
+    async def _subscribe(
+        self, channel_ids, guild_ids, dms=False, max_buffer=None, max_events=None, emit=None
+    ):
+        """Stream message create/edit/delete events until the client disconnects.
+
+        Events are buffered per subscriber (``max_buffer``); a client that
+        reads too slowly loses the oldest ones and gets an ``overflow`` event
+        saying how many.
+        """
+        if emit is None:
+            return {"error": "subscribe needs a streaming request"}
+        event_filter = EventFilter(
+            channel_ids=frozenset(int(channel_id) for channel_id in channel_ids),
+            guild_ids=frozenset(int(guild_id) for guild_id in guild_ids),
+            dms=bool(dms),
+        )
+        if event_filter.is_empty():
+            return {"error": "Subscribe to at least one channel, guild or DMs"}
+
+        bus = get_event_bus()
+        subscription = bus.subscribe(event_filter, max_buffer)
+        try:
+            await emit({"type": "subscribed", "max_buffer": subscription.max_buffer})
+            while max_events is None or subscription.delivered < int(max_events):
+                # emit waits for the socket to drain, so a slow reader fills
+                # its own buffer instead of holding up the gateway.
+                await emit(await subscription.get())
+        finally:
+            bus.unsubscribe(subscription)
+        return {"delivered": subscription.delivered, "dropped": subscription.dropped}
+
     def _list_guilds(self):
         guilds = []
         for guild in self.client.guilds:
@@ -300,9 +438,7 @@ class DiscordDaemon:
         return {"channels": channels}
 
     async def _read_messages(self, channel_id, limit, after=None):
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
         if not isinstance(channel, discord.abc.Messageable):
@@ -324,9 +460,7 @@ class DiscordDaemon:
         if content_error:
             return {"error": content_error}
 
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
         if not isinstance(channel, discord.abc.Messageable):
@@ -343,17 +477,16 @@ class DiscordDaemon:
         attachment_index=None,
         download_content=False,
         max_bytes=MAX_ATTACHMENT_BYTES_DEFAULT,
+        return_mode="inline",
     ):
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
         if not isinstance(channel, discord.abc.Messageable):
             return {"error": NON_MESSAGEABLE_TEXT}
 
         try:
-            message = await channel.fetch_message(message_id)
+            message = await get_resolver(self.client).message(channel, message_id)
         except discord.NotFound:
             return {"error": "Message not found"}
         except discord.Forbidden:
@@ -387,6 +520,7 @@ class DiscordDaemon:
             return result
 
         max_bytes = int(max_bytes)
+        cache = get_attachment_cache()
         downloads = []
         skipped = []
         for index, attachment in indexed_attachments:
@@ -400,16 +534,34 @@ class DiscordDaemon:
                 )
                 continue
 
-            blob = await attachment.read()
-            downloads.append(
-                {
-                    "index": index,
-                    "filename": attachment.filename,
-                    "content_type": attachment.content_type
-                    or "application/octet-stream",
-                    "content_base64": base64.b64encode(blob).decode("ascii"),
-                }
-            )
+            try:
+                cached = await cache.fetch(attachment, max_bytes)
+            except AttachmentTooLarge:
+                skipped.append(
+                    {
+                        "index": index,
+                        "filename": attachment.filename,
+                        "reason": f"download exceeded max_bytes={max_bytes}",
+                    }
+                )
+                continue
+
+            download = {
+                "index": index,
+                "filename": attachment.filename,
+                "content_type": attachment.content_type or "application/octet-stream",
+                "size": cached.size,
+                "sha256": cached.sha256,
+            }
+            if return_mode == "path":
+                # Clients on this host copy the cached file instead of
+                # receiving it base64-encoded over the socket.
+                download["path"] = str(cached.path)
+            else:
+                download["content_base64"] = base64.b64encode(
+                    cached.path.read_bytes()
+                ).decode("ascii")
+            downloads.append(download)
 
         if downloads:
             result["downloads"] = downloads
@@ -418,9 +570,7 @@ class DiscordDaemon:
         return result
 
     async def _list_threads(self, channel_id, archived=False):
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
 
@@ -442,9 +592,7 @@ class DiscordDaemon:
         return {"threads": threads}
 
     async def _read_thread(self, thread_id, limit, after=None):
-        thread = self.client.get_channel(thread_id) or await self.client.fetch_channel(
-            thread_id
-        )
+        thread = await get_resolver(self.client).channel(thread_id)
         if not thread or not isinstance(thread, discord.Thread):
             return {"error": "Thread not found"}
 
@@ -501,7 +649,14 @@ class DiscordDaemon:
         threads.sort(key=lambda item: item["last_message_at"], reverse=True)
         return {"threads": threads}
 
-    async def _read_recent_threads(self, guild_id, within_hours=4, limit_per_thread=30):
+    async def _read_recent_threads(
+        self,
+        guild_id,
+        within_hours=4,
+        limit_per_thread=30,
+        concurrency=None,
+        on_thread=None,
+    ):
         guild = self.client.get_guild(guild_id)
         if not guild:
             return {"error": "Guild not found"}
@@ -510,16 +665,21 @@ class DiscordDaemon:
         history_after = self._history_after_object(cutoff_time)
         result = {"threads": [], "total_messages": 0}
 
-        for thread in guild.threads:
-            last_message_time = None
-            if thread.last_message:
-                last_message_time = thread.last_message.created_at
-
-            if last_message_time and last_message_time >= cutoff_time:
-                messages = []
-                kwargs = {"limit": limit_per_thread}
-                if history_after:
-                    kwargs["after"] = history_after
+        active_threads = [
+            thread
+            for thread in guild.threads
+            if thread.last_message and thread.last_message.created_at >= cutoff_time
+        ]
+        semaphore = asyncio.Semaphore(_thread_concurrency(concurrency))
+
+        async def read_thread(thread):
+            messages = []
+            kwargs = {"limit": limit_per_thread}
+            if history_after:
+                kwargs["after"] = history_after
+            async with semaphore:
+                if rate_limiter and rate_limiter.is_enabled():
+                    await rate_limiter.routes.acquire("GET", f"/channels/{thread.id}/messages")
                 async for msg in thread.history(**kwargs):
                     messages.append(
                         {
@@ -529,19 +689,33 @@ class DiscordDaemon:
                             "created_at": msg.created_at.isoformat(),
                         }
                     )
-                messages.reverse()
+            messages.reverse()
+            if not messages:
+                return None
+
+            entry = {
+                "id": thread.id,
+                "name": thread.name,
+                "parent": thread.parent.name if thread.parent else "Unknown",
+                "messages": messages,
+                "message_count": len(messages),
+            }
+            if on_thread:
+                await on_thread({"thread": entry})
+            return entry
 
-                if messages:
-                    result["threads"].append(
-                        {
-                            "id": thread.id,
-                            "name": thread.name,
-                            "parent": thread.parent.name if thread.parent else "Unknown",
-                            "messages": messages,
-                            "message_count": len(messages),
-                        }
-                    )
-                    result["total_messages"] += len(messages)
+        tasks = [asyncio.create_task(read_thread(thread)) for thread in active_threads]
+        try:
+            entries = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for entry in entries:
+            if entry:
+                result["threads"].append(entry)
+                result["total_messages"] += entry["message_count"]
 
         result["threads"].sort(
             key=lambda item: item["messages"][-1]["created_at"]
@@ -559,9 +733,7 @@ class DiscordDaemon:
         return {"name": user.name, "id": user.id, "bot": user.bot}
 
     async def _create_thread(self, channel_id, name, message_id, content=None):
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
 
@@ -586,7 +758,7 @@ class DiscordDaemon:
                 return {
                     "error": "message_id is required when creating a thread from a text channel"
                 }
-            message = await channel.fetch_message(message_id)
+            message = await get_resolver(self.client).message(channel, message_id)
             if not message:
                 return {"error": "Message not found"}
             thread = await message.create_thread(name=name or f"Thread-{message_id}")
@@ -599,19 +771,18 @@ class DiscordDaemon:
         return {"error": "Channel must be a text channel or forum channel"}
 
     async def _delete_message(self, channel_id, message_id):
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
         if not isinstance(channel, discord.abc.Messageable):
             return {"error": NON_MESSAGEABLE_TEXT}
 
         try:
-            message = await channel.fetch_message(message_id)
+            message = await get_resolver(self.client).message(channel, message_id)
             if message.author.id != self.client.user.id:
                 return {"error": "Cannot delete messages from other users"}
             await message.delete()
+            get_resolver(self.client).invalidate_message(channel.id, message_id)
             return {"success": True, "message_id": message_id}
         except discord.NotFound:
             return {"error": "Message not found"}
@@ -619,14 +790,12 @@ class DiscordDaemon:
             return {"error": "No permission to delete this message"}
 
     async def _pin_message(self, channel_id, message_id):
-        channel = self.client.get_channel(channel_id) or await self.client.fetch_channel(
-            channel_id
-        )
+        channel = await get_resolver(self.client).channel(channel_id)
         if not channel:
             return {"error": "Channel not found"}
 
         try:
-            message = await channel.fetch_message(message_id)
+            message = await get_resolver(self.client).message(channel, message_id)
             await message.pin()
             return {"success": True, "message_id": message_id}
         except discord.NotFound:
@@ -653,9 +822,7 @@ class DiscordDaemon:
         }
 
     async def _archive_thread(self, thread_id, unarchive=False):
-        thread = self.client.get_channel(thread_id) or await self.client.fetch_channel(
-            thread_id
-        )
+        thread = await get_resolver(self.client).channel(thread_id)
         if not thread or not isinstance(thread, discord.Thread):
             return {"error": "Thread not found"}
 
@@ -691,25 +858,111 @@ class DiscordDaemon:
     async def handle_client(self, reader, writer):
         """Handle incoming client connections."""
         try:
-            data = await reader.read(65536)
-            if not data:
+            first = await reader.read(1)
+            if not first:
                 return
+            if first == LEGACY_PREFIX:
+                await self._handle_legacy_client(first, reader, writer)
+            else:
+                await self._handle_framed_client(first, reader, writer)
+        except Exception as exc:
+            log_to_stderr(f"[{datetime.now()}] Client connection error: {exc}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _is_authorized(self, payload):
+        return compare_digest(str(payload.pop("auth", "")), self.auth_token)
 
-            command_data = json.loads(data.decode())
-            provided_auth = str(command_data.pop("auth", ""))
-            if not compare_digest(provided_auth, self.auth_token):
+    async def _handle_legacy_client(self, first, reader, writer):
+        """One bare JSON request terminated by EOF, one response, then close."""
+        try:
+            chunks = [first]
+            size = len(first)
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_FRAME_BYTES:
+                    raise ProtocolError(f"Request exceeds {MAX_FRAME_BYTES} bytes")
+                chunks.append(chunk)
+            command_data = json.loads(b"".join(chunks).decode())
+            if not self._is_authorized(command_data):
                 response = {"error": "Unauthorized daemon request"}
             else:
                 response = await self.handle_command(command_data)
-
-            writer.write(json.dumps(response).encode())
-            await writer.drain()
         except Exception as exc:
-            writer.write(json.dumps({"error": str(exc)}).encode())
+            response = {"error": str(exc)}
+
+        writer.write(json.dumps(response).encode())
+        await writer.drain()
+
+    async def _handle_framed_client(self, first, reader, writer):
+        """Persistent connection: handshake, then pipelined request frames."""
+        hello = await read_frame(reader, first)
+        error = None
+        if not hello or hello.get("type") != "hello" or not self._is_authorized(hello):
+            error = "Unauthorized daemon request"
+        elif hello.get("version") != PROTOCOL_VERSION:
+            error = f"Unsupported protocol version {hello.get('version')}"
+        if error:
+            writer.write(
+                encode_frame(
+                    {"type": "hello", "ok": False, "error": error, "version": PROTOCOL_VERSION}
+                )
+            )
             await writer.drain()
+            return
+
+        writer.write(encode_frame({"type": "hello", "ok": True, "version": PROTOCOL_VERSION}))
+        await writer.drain()
+
+        write_lock = asyncio.Lock()
+        in_flight = set()
+        subscriptions = set()
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                is_subscription = frame.get("command") == "subscribe"
+                task = asyncio.create_task(self._serve_frame(frame, writer, write_lock))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                if is_subscription:
+                    subscriptions.add(task)
+                    task.add_done_callback(subscriptions.discard)
+            # Subscriptions run until the client goes away, which is now.
+            for task in subscriptions:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
         finally:
-            writer.close()
-            await writer.wait_closed()
+            for task in in_flight:
+                task.cancel()
+
+    async def _serve_frame(self, frame, writer, write_lock):
+        request_id = frame.pop("id", None)
+        emit = None
+        if frame.pop("stream", False):
+
+            async def emit(event):
+                async with write_lock:
+                    writer.write(encode_frame({"id": request_id, "event": event}))
+                    await writer.drain()
+
+        response = await self.handle_command(frame, emit=emit)
+        try:
+            payload = encode_frame({"id": request_id, "result": response})
+        except ProtocolError as exc:
+            payload = encode_frame({"id": request_id, "result": {"error": str(exc)}})
+        async with write_lock:
+            writer.write(payload)
+            await writer.drain()
 
     async def start_server(self):
         """Start the private Unix socket server."""
@@ -723,6 +976,10 @@ class DiscordDaemon:
         chmod_private(SOCKET_PATH)
         log_to_stderr(f"[{datetime.now()}] Daemon server started on {SOCKET_PATH}")
 
+        port = metrics_port()
+        if port is not None:
+            await start_metrics_server(registry.metrics, port)
+
         async with self.server:
             self.code_check_task = asyncio.create_task(self.monitor_code_changes())
             try:
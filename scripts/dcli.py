@@ -12,7 +12,7 @@ Commands:
   list-threads --channel ID [--archived]
   list-guild-threads --guild ID
   list-recent-threads --guild ID [--within HOURS]
-  read-recent-threads --guild ID [--within HOURS] [--limit-per-thread N]
+  read-recent-threads --guild ID [--within HOURS] [--limit-per-thread N] [--concurrency N] [--stream]
   read-thread --thread ID [--limit N] [--after TIME]
   delete-message --channel ID --message ID
   pin-message --channel ID --message ID
@@ -22,6 +22,7 @@ Commands:
   leave-thread --thread ID
   user-info [--user ID]
   create-thread --channel ID [--name NAME] [--message MSG_ID]
+  tail [CHANNEL_ID ...] [--guild ID] [--dms] [--buffer N]
 
 Time formats for --after:
   4h, 30m, 1d           - Relative time (hours, minutes, days)
@@ -30,8 +31,8 @@ Time formats for --after:
 """
 
 import base64
-import json
 import os
+import shutil
 import socket
 import subprocess
 import sys
@@ -44,6 +45,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from discord_py_self_mcp.cli_runtime import AUTH_FILE, PID_FILE, SOCKET_PATH
+from discord_py_self_mcp.daemon_protocol import encode_frame, hello_frame, recv_frame
 
 
 def read_pid() -> int | None:
@@ -92,8 +94,13 @@ def start_daemon():
     return True
 
 
-def send_request(command_data, timeout=30):
-    """Send request to daemon via the private Unix socket."""
+def send_request(command_data, timeout=30, on_event=None):
+    """Send request to daemon via the private Unix socket.
+
+    With ``on_event`` the daemon streams partial results, each passed to
+    ``on_event`` as it arrives, before the final result is returned.
+    ``timeout=None`` waits indefinitely, for streams that stay open.
+    """
     if not is_daemon_running():
         start_daemon()
 
@@ -111,20 +118,23 @@ def send_request(command_data, timeout=30):
         client.settimeout(timeout)
         client.connect(str(SOCKET_PATH))
 
-        request_payload = dict(command_data)
-        request_payload["auth"] = auth_token
-        client.sendall(json.dumps(request_payload).encode())
-        client.shutdown(socket.SHUT_WR)
-
-        response = b""
-        while True:
-            chunk = client.recv(65536)
-            if not chunk:
-                break
-            response += chunk
+        client.sendall(encode_frame(hello_frame(auth_token)))
+        hello = recv_frame(client)
+        if not hello.get("ok"):
+            client.close()
+            return {"error": hello.get("error", "Daemon rejected connection")}
+
+        request_frame = {"id": 1, **command_data}
+        if on_event:
+            request_frame["stream"] = True
+        client.sendall(encode_frame(request_frame))
+        response = recv_frame(client)
+        while "event" in response:
+            on_event(response["event"])
+            response = recv_frame(client)
 
         client.close()
-        return json.loads(response.decode())
+        return response.get("result") or {}
     except socket.timeout:
         print("Error: Request timed out")
         sys.exit(1)
@@ -209,6 +219,7 @@ def cmd_get_message_attachments(
         args["attachment_index"] = attachment_index
     if download:
         args["download_content"] = True
+        args["return_mode"] = "path"
     if max_bytes is not None:
         args["max_bytes"] = max_bytes
 
@@ -240,7 +251,10 @@ def cmd_get_message_attachments(
     for item in downloads:
         filename = item.get("filename") or f"attachment-{item.get('index', 'unknown')}"
         destination = output_path / f"attachment-{item.get('index', 'unknown')}-{filename}"
-        destination.write_bytes(base64.b64decode(item["content_base64"]))
+        if item.get("path"):
+            shutil.copyfile(item["path"], destination)
+        else:
+            destination.write_bytes(base64.b64decode(item["content_base64"]))
         print(f"  {destination}")
 
 
@@ -364,16 +378,32 @@ def cmd_list_recent_threads(guild_id, within_hours):
         print(f"    Last message: {last_at}, Messages: {thread.get('message_count', 'Unknown')}")
 
 
-def cmd_read_recent_threads(guild_id, within_hours, limit_per_thread):
+def print_thread_block(thread):
+    print(f"\nThread {thread['name']} (ID: {thread['id']}, Parent: #{thread['parent']})")
+    print("-" * 60)
+    format_messages(thread.get("messages", []), reverse=False)
+
+
+def cmd_read_recent_threads(
+    guild_id, within_hours, limit_per_thread, concurrency=None, stream=False
+):
+    args = {
+        "guild_id": guild_id,
+        "within_hours": within_hours,
+        "limit_per_thread": limit_per_thread,
+    }
+    if concurrency:
+        args["concurrency"] = concurrency
+
+    on_event = None
+    if stream:
+
+        def on_event(event):
+            if "thread" in event:
+                print_thread_block(event["thread"])
+
     result = send_request(
-        {
-            "command": "read_recent_threads",
-            "args": {
-                "guild_id": guild_id,
-                "within_hours": within_hours,
-                "limit_per_thread": limit_per_thread,
-            },
-        }
+        {"command": "read_recent_threads", "args": args}, on_event=on_event
     )
     if "error" in result:
         print(f"Error: {result['error']}")
@@ -381,15 +411,24 @@ def cmd_read_recent_threads(guild_id, within_hours, limit_per_thread):
 
     threads = result.get("threads", [])
     total = result.get("total_messages", 0)
+    if stream:
+        # Blocks were printed as they arrived; finish with the sorted index.
+        print("\n" + "=" * 60)
+        print(
+            f"Recent threads ({len(threads)}) with {total} messages in last {within_hours}h, "
+            "latest first:"
+        )
+        for thread in threads:
+            print(f"  {thread['name']} (ID: {thread['id']}, {thread['message_count']} messages)")
+        return
+
     print(
         f"Recent threads ({len(threads)}) with {total} messages in last {within_hours}h:"
     )
     print("=" * 60)
 
     for thread in threads:
-        print(f"\nThread {thread['name']} (ID: {thread['id']}, Parent: #{thread['parent']})")
-        print("-" * 60)
-        format_messages(thread.get("messages", []), reverse=False)
+        print_thread_block(thread)
 
     print("\n" + "=" * 60)
 
@@ -526,6 +565,46 @@ def cmd_create_thread(channel_id, name, message_id, content=None):
     print(f"  ID: {result.get('thread_id')}")
 
 
+def print_tail_event(event, show_channel=False):
+    prefix = f"#{event.get('channel_id')} " if show_channel else ""
+    kind = event.get("type")
+    if kind in ("message_create", "message_edit"):
+        message = dict(event.get("message") or {})
+        if kind == "message_edit":
+            message["content"] = f"[edited] {message.get('content') or ''}".rstrip()
+        if prefix:
+            message["author"] = prefix + message.get("author", "Unknown")
+        format_messages([message], reverse=False)
+    elif kind == "message_delete":
+        print(f"{prefix}[deleted] message_id={', '.join(event.get('message_ids', []))}")
+    elif kind == "overflow":
+        print(f"[!] fell behind, {event.get('dropped')} events dropped")
+    sys.stdout.flush()
+
+
+def cmd_tail(channel_ids, guild_ids=None, dms=False, max_buffer=None):
+    args = {"channel_ids": channel_ids, "guild_ids": guild_ids or [], "dms": dms}
+    if max_buffer:
+        args["max_buffer"] = max_buffer
+    show_channel = len(channel_ids) != 1 or bool(guild_ids) or dms
+
+    def on_event(event):
+        if event.get("type") == "subscribed":
+            print("Waiting for messages (Ctrl-C to stop)...")
+            sys.stdout.flush()
+            return
+        print_tail_event(event, show_channel)
+
+    try:
+        result = send_request(
+            {"command": "subscribe", "args": args}, timeout=None, on_event=on_event
+        )
+    except KeyboardInterrupt:
+        return
+    if "error" in result:
+        print(f"Error: {result['error']}")
+
+
 def cmd_daemon(action):
     daemon_script = SCRIPT_DIR / "daemon.py"
 
@@ -594,6 +673,8 @@ def main():
     recent_threads_parser.add_argument("--guild", "-g", required=True, type=int, help="Guild ID")
     recent_threads_parser.add_argument("--within", "-w", type=int, default=4, help="Only read threads active within this many hours (default: 4)")
     recent_threads_parser.add_argument("--limit-per-thread", "-p", type=int, default=30, help="Max messages per thread (default: 30)")
+    recent_threads_parser.add_argument("--concurrency", type=int, help="Threads read in parallel (default: DAEMON_THREAD_CONCURRENCY or 4)")
+    recent_threads_parser.add_argument("--stream", action="store_true", help="Print each thread as soon as it is read")
 
     read_thread_parser = subparsers.add_parser("read-thread", help="Read messages from a thread")
     read_thread_parser.add_argument("--thread", "-t", required=True, type=int, help="Thread ID")
@@ -630,6 +711,12 @@ def main():
     create_thread_parser.add_argument("--message", "-m", type=int, help="Message ID to create thread from")
     create_thread_parser.add_argument("--content", "-t", help="Content for forum thread (required for forum channels)")
 
+    tail_parser = subparsers.add_parser("tail", help="Print new, edited and deleted messages as they happen")
+    tail_parser.add_argument("channels", nargs="*", type=int, help="Channel IDs (threads included)")
+    tail_parser.add_argument("--guild", "-g", type=int, action="append", default=[], help="Guild ID (repeatable)")
+    tail_parser.add_argument("--dms", action="store_true", help="Include direct messages")
+    tail_parser.add_argument("--buffer", type=int, default=None, help="Events the daemon buffers if this client falls behind")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -662,7 +749,9 @@ def main():
     elif args.command == "list-recent-threads":
         cmd_list_recent_threads(args.guild, args.within)
     elif args.command == "read-recent-threads":
-        cmd_read_recent_threads(args.guild, args.within, args.limit_per_thread)
+        cmd_read_recent_threads(
+            args.guild, args.within, args.limit_per_thread, args.concurrency, args.stream
+        )
     elif args.command == "read-thread":
         cmd_read_thread(args.thread, args.limit, args.after)
     elif args.command == "delete-message":
@@ -681,6 +770,10 @@ def main():
         cmd_user_info(args.user)
     elif args.command == "create-thread":
         cmd_create_thread(args.channel, args.name, args.message, args.content)
+    elif args.command == "tail":
+        if not (args.channels or args.guild or args.dms):
+            tail_parser.error("give at least one channel ID, --guild or --dms")
+        cmd_tail(args.channels, args.guild, args.dms, args.buffer)
 
 
 if __name__ == "__main__":
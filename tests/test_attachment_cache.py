@@ -0,0 +1,121 @@
+import asyncio
+import os
+
+import aiohttp
+import pytest
+
+from discord_py_self_mcp.attachment_cache import (
+    AttachmentCache,
+    AttachmentCacheConfig,
+    AttachmentTooLarge,
+    _client_session,
+)
+
+
+class FakeAttachment:
+    def __init__(self, attachment_id, payload):
+        self.id = attachment_id
+        self.url = f"https://cdn.discordapp.com/{attachment_id}"
+        self.payload = payload
+
+
+class FakeCache(AttachmentCache):
+    def __init__(self, path, max_bytes=1024):
+        super().__init__(AttachmentCacheConfig(path=path, max_bytes=max_bytes))
+        self.payloads = {}
+        self.downloads = []
+
+    async def _iter_chunks(self, url, http=None):
+        self.downloads.append(url)
+        await asyncio.sleep(0)
+        payload = self.payloads[url]
+        for start in range(0, len(payload), 8):
+            yield payload[start : start + 8]
+
+    def add(self, attachment):
+        self.payloads[attachment.url] = attachment.payload
+        return attachment
+
+
+@pytest.mark.asyncio
+async def test_fetch_streams_to_content_addressed_file_and_reuses_it(tmp_path):
+    cache = FakeCache(tmp_path)
+    attachment = cache.add(FakeAttachment(1, b"hello attachment"))
+
+    first = await cache.fetch(attachment)
+    second = await cache.fetch(attachment)
+
+    assert first.path.name == f"1-{first.sha256}"
+    assert first.path.read_bytes() == b"hello attachment"
+    assert second.path == first.path
+    assert len(cache.downloads) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_download(tmp_path):
+    cache = FakeCache(tmp_path)
+    attachment = cache.add(FakeAttachment(1, b"x" * 100))
+
+    results = await asyncio.gather(*(cache.fetch(attachment) for _ in range(5)))
+
+    assert {result.path for result in results} == {results[0].path}
+    assert len(cache.downloads) == 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_stream_is_aborted_without_leaving_files(tmp_path):
+    cache = FakeCache(tmp_path)
+    attachment = cache.add(FakeAttachment(1, b"x" * 100))
+
+    with pytest.raises(AttachmentTooLarge):
+        await cache.fetch(attachment, max_bytes=50)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_keep_their_own_size_limit(tmp_path):
+    cache = FakeCache(tmp_path)
+    attachment = cache.add(FakeAttachment(1, b"x" * 100))
+
+    small, large = await asyncio.gather(
+        cache.fetch(attachment, max_bytes=50),
+        cache.fetch(attachment, max_bytes=500),
+        return_exceptions=True,
+    )
+
+    assert isinstance(small, AttachmentTooLarge)
+    assert large.size == 100
+
+
+@pytest.mark.asyncio
+async def test_downloads_use_the_discord_clients_session_and_proxy():
+    class FakeHTTPClient:
+        proxy = "http://proxy.local:3128"
+        proxy_auth = object()
+
+    http = FakeHTTPClient()
+    async with aiohttp.ClientSession() as session:
+        http._HTTPClient__session = session
+
+        used, options = _client_session(http)
+
+    assert used is session
+    assert options == {"proxy": http.proxy, "proxy_auth": http.proxy_auth}
+    assert _client_session(None) == (None, {})
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_files_are_evicted(tmp_path):
+    cache = FakeCache(tmp_path, max_bytes=250)
+    old = await cache.fetch(cache.add(FakeAttachment(1, b"a" * 100)))
+    recent = await cache.fetch(cache.add(FakeAttachment(2, b"b" * 100)))
+    os.utime(old.path, (1, 1))
+    os.utime(recent.path, (2, 2))
+    cache.lookup(1)  # a hit makes attachment 1 the most recently used
+
+    await cache.fetch(cache.add(FakeAttachment(3, b"c" * 100)))
+
+    assert cache.lookup(2) is None
+    assert cache.lookup(1) is not None
+    assert cache.lookup(3) is not None
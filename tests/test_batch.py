@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from mcp.types import TextContent
+
+from discord_py_self_mcp.rate_limiter import current_priority
+from discord_py_self_mcp.tools import batch as batch_module
+from discord_py_self_mcp.tools.registry import ToolRegistry
+
+
+@pytest.fixture
+def tool_registry(monkeypatch):
+    tool_registry = ToolRegistry()
+    state = {"in_flight": 0, "peak": 0, "started": []}
+
+    @tool_registry.register("sleep", "Sleep", {"type": "object"}, needs="none")
+    async def sleep(arguments):
+        state["started"].append(arguments["label"])
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(arguments.get("delay", 0))
+        state["in_flight"] -= 1
+        if arguments.get("fail"):
+            return [TextContent(type="text", text=f"Error sleeping: {arguments['label']}")]
+        return [TextContent(type="text", text=f"{arguments['label']}:{current_priority.get()}")]
+
+    monkeypatch.setattr(batch_module, "registry", tool_registry)
+    tool_registry.state = state
+    return tool_registry
+
+
+def _texts(result):
+    return [item.text for item in result]
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_results_in_order_with_bounded_concurrency(tool_registry):
+    calls = [
+        {"name": "sleep", "arguments": {"label": label, "delay": delay}}
+        for label, delay in (("a", 0.05), ("b", 0.0), ("c", 0.02), ("d", 0.0))
+    ]
+
+    result = await batch_module.batch({"calls": calls, "concurrency": 2, "priority": "background"})
+
+    assert _texts(result) == [
+        "[1/4] sleep: ok", "a:background",
+        "[2/4] sleep: ok", "b:background",
+        "[3/4] sleep: ok", "c:background",
+        "[4/4] sleep: ok", "d:background",
+    ]
+    assert tool_registry.state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_stop_on_error_skips_calls_not_yet_started(tool_registry):
+    calls = [
+        {"name": "sleep", "arguments": {"label": "a", "fail": True}},
+        {"name": "sleep", "arguments": {"label": "b"}},
+        {"name": "missing"},
+    ]
+
+    result = await batch_module.batch({"calls": calls, "concurrency": 1, "stop_on_error": True})
+
+    assert _texts(result) == [
+        "[1/3] sleep: error", "Error sleeping: a",
+        "[2/3] sleep: skipped",
+        "[3/3] missing: skipped",
+    ]
+    assert tool_registry.state["started"] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_unknown_and_nested_calls_per_item(tool_registry):
+    calls = [
+        {"name": "missing"},
+        {"name": "batch", "arguments": {}},
+        {"name": "sleep", "arguments": {"label": "x"}},
+    ]
+
+    result = await batch_module.batch({"calls": calls})
+
+    texts = _texts(result)
+    assert texts[0] == "[1/3] missing: error"
+    assert texts[1].startswith("Error: Unknown tool 'missing'")
+    assert texts[2:] == [
+        "[2/3] batch: error", "Error: batches cannot be nested",
+        "[3/3] sleep: ok", "x:normal",
+    ]
@@ -0,0 +1,137 @@
+import asyncio
+import os
+
+import pytest
+
+from discord_py_self_mcp import code_watcher
+from discord_py_self_mcp.code_watcher import CodeWatcher, project_module_files
+
+
+def _write(path, text):
+    # Rename over the original, the way most editors save.
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+async def _run_watcher(tmp_path, **kwargs):
+    files = [tmp_path / "a.py", tmp_path / "b.py"]
+    for path in files:
+        path.write_text("x = 1\n")
+    batches = []
+
+    async def on_change(changed):
+        batches.append({path.name for path in changed})
+
+    watcher = CodeWatcher(files, on_change, debounce=0.1, **kwargs)
+    task = asyncio.create_task(watcher.run())
+    await asyncio.sleep(0.05)
+    return watcher, task, files, batches
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(code_watcher._load_inotify() is None, reason="inotify unavailable")
+async def test_inotify_burst_of_saves_triggers_one_change(tmp_path):
+    watcher, task, (a, b), batches = await _run_watcher(tmp_path)
+    try:
+        assert watcher.backend == "inotify"
+        _write(a, "x = 2\n")
+        await asyncio.sleep(0.03)
+        _write(b, "x = 2\n")
+        await asyncio.sleep(0.03)
+        _write(a, "x = 3\n")
+        (tmp_path / "unrelated.txt").write_text("ignored")
+        await asyncio.sleep(0.4)
+    finally:
+        task.cancel()
+
+    assert batches == [{"a.py", "b.py"}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(code_watcher._load_inotify() is None, reason="inotify unavailable")
+async def test_inotify_ignores_saves_without_content_changes(tmp_path):
+    watcher, task, (a, _), batches = await _run_watcher(tmp_path)
+    try:
+        _write(a, "x = 1\n")
+        await asyncio.sleep(0.3)
+    finally:
+        task.cancel()
+
+    assert batches == []
+
+
+@pytest.mark.asyncio
+async def test_mtime_fallback_detects_changes(tmp_path):
+    watcher, task, (a, _), batches = await _run_watcher(
+        tmp_path, use_inotify=False, poll_interval=0.05
+    )
+    try:
+        assert watcher.backend == "poll"
+        _write(a, "x = 22\n")
+        await asyncio.sleep(0.4)
+    finally:
+        task.cancel()
+
+    assert batches == [{"a.py"}]
+
+
+class FailingInotify:
+    """libc stand-in whose inotify calls fail like they do when limits run out."""
+
+    def __init__(self, init_result=-1):
+        self.init_result = init_result
+
+    def inotify_init1(self, flags):
+        return self.init_result() if callable(self.init_result) else self.init_result
+
+    def inotify_add_watch(self, fd, path, mask):
+        return -1
+
+
+@pytest.mark.asyncio
+async def test_inotify_init_failure_falls_back_to_polling(tmp_path, monkeypatch):
+    monkeypatch.setattr(code_watcher, "_load_inotify", lambda: FailingInotify())
+    watcher, task, (a, _), batches = await _run_watcher(tmp_path, poll_interval=0.05)
+    try:
+        assert watcher.backend == "poll"
+        _write(a, "x = 22\n")
+        await asyncio.sleep(0.4)
+    finally:
+        task.cancel()
+
+    assert batches == [{"a.py"}]
+
+
+@pytest.mark.asyncio
+async def test_directories_that_cannot_be_watched_are_polled(tmp_path, monkeypatch):
+    pipes = []
+
+    def readable_fd():
+        read_fd, write_fd = os.pipe()
+        pipes.append(write_fd)
+        return read_fd
+
+    monkeypatch.setattr(code_watcher, "_load_inotify", lambda: FailingInotify(readable_fd))
+    watcher, task, (a, _), batches = await _run_watcher(tmp_path, poll_interval=0.05)
+    try:
+        assert watcher.backend == "inotify"
+        _write(a, "x = 22\n")
+        await asyncio.sleep(0.4)
+    finally:
+        task.cancel()
+        await asyncio.sleep(0)
+        for fd in pipes:
+            os.close(fd)
+
+    assert batches == [{"a.py"}]
+
+
+def test_project_module_files_includes_imported_modules(tmp_path):
+    extra = tmp_path / "daemon.py"
+
+    files = project_module_files([extra])
+
+    assert extra.resolve() in files
+    assert code_watcher.PACKAGE_DIR / "code_watcher.py" in files
+    assert all(path.suffix == ".py" for path in files)
@@ -1,5 +1,11 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
+from discord_py_self_mcp.attachment_cache import AttachmentCache, AttachmentCacheConfig
+from discord_py_self_mcp.daemon_protocol import encode_frame, hello_frame, read_frame
+from discord_py_self_mcp.event_bus import EventBus
 from scripts import daemon
 
 
@@ -42,7 +48,8 @@ class FakeMessageable:
 
 
 class FakeChannel(FakeMessageable):
-    def __init__(self, fetched_message):
+    def __init__(self, fetched_message, channel_id=1):
+        self.id = channel_id
         self._fetched_message = fetched_message
 
     async def fetch_message(self, message_id):
@@ -74,14 +81,25 @@ async def test_get_message_attachments_returns_metadata_without_download(monkeyp
     assert "downloads" not in result
 
 
+class FakeAttachmentCache(AttachmentCache):
+    def __init__(self, path, attachments):
+        super().__init__(AttachmentCacheConfig(path=path))
+        self._payloads = {attachment.url: attachment._payload for attachment in attachments}
+
+    async def _iter_chunks(self, url, http=None):
+        yield self._payloads[url]
+
+
 @pytest.mark.asyncio
-async def test_get_message_attachments_can_inline_download_payloads(monkeypatch):
+async def test_get_message_attachments_can_inline_download_payloads(monkeypatch, tmp_path):
     attachment = FakeAttachment(payload=b"binary-payload")
     fake_message = FakeMessage(message_id=456, attachments=[attachment])
     daemon_instance = daemon.DiscordDaemon.__new__(daemon.DiscordDaemon)
     daemon_instance.client = FakeClient(FakeChannel(fake_message))
 
     monkeypatch.setattr(daemon.discord.abc, "Messageable", FakeMessageable)
+    cache = FakeAttachmentCache(tmp_path, [attachment])
+    monkeypatch.setattr(daemon, "get_attachment_cache", lambda: cache)
 
     result = await daemon_instance._get_message_attachments(
         1, 456, download_content=True
@@ -90,3 +108,165 @@ async def test_get_message_attachments_can_inline_download_payloads(monkeypatch)
     assert result["downloads"][0]["filename"] == "photo.png"
     assert result["downloads"][0]["content_type"] == "image/png"
     assert result["downloads"][0]["content_base64"] == "YmluYXJ5LXBheWxvYWQ="
+
+    by_path = await daemon_instance._get_message_attachments(
+        1, 456, download_content=True, return_mode="path"
+    )
+
+    download = by_path["downloads"][0]
+    assert "content_base64" not in download
+    assert open(download["path"], "rb").read() == b"binary-payload"
+
+
+class FakeAuthorRef:
+    name = "tester"
+
+
+class FakeHistoryMessage:
+    def __init__(self, message_id, created_at):
+        self.id = message_id
+        self.author = FakeAuthorRef()
+        self.content = f"message {message_id}"
+        self.created_at = created_at
+
+
+class FakeParent:
+    name = "general"
+
+
+class FakeThread:
+    active = 0
+    max_active = 0
+
+    def __init__(self, thread_id, latest, delay):
+        self.id = thread_id
+        self.name = f"thread-{thread_id}"
+        self.parent = FakeParent()
+        self.last_message = FakeHistoryMessage(thread_id * 10, latest)
+        self._delay = delay
+
+    async def history(self, **kwargs):
+        FakeThread.active += 1
+        FakeThread.max_active = max(FakeThread.max_active, FakeThread.active)
+        try:
+            await asyncio.sleep(self._delay)
+            yield self.last_message
+        finally:
+            FakeThread.active -= 1
+
+
+class FakeGuild:
+    def __init__(self, threads):
+        self.threads = threads
+
+
+class FakeGuildClient:
+    def __init__(self, guild):
+        self._guild = guild
+
+    def get_guild(self, guild_id):
+        return self._guild
+
+
+@pytest.mark.asyncio
+async def test_read_recent_threads_fans_out_with_bounded_concurrency(monkeypatch):
+    now = datetime.now(timezone.utc)
+    threads = [
+        FakeThread(1, now - timedelta(minutes=30), delay=0.05),
+        FakeThread(2, now - timedelta(minutes=5), delay=0.01),
+        FakeThread(3, now - timedelta(minutes=10), delay=0.03),
+        FakeThread(4, now - timedelta(hours=9), delay=0.0),
+    ]
+    FakeThread.active = FakeThread.max_active = 0
+    daemon_instance = daemon.DiscordDaemon.__new__(daemon.DiscordDaemon)
+    daemon_instance.client = FakeGuildClient(FakeGuild(threads))
+    monkeypatch.setattr(daemon, "rate_limiter", None)
+    streamed = []
+
+    async def on_thread(event):
+        streamed.append(event["thread"]["id"])
+
+    result = await daemon_instance._read_recent_threads(
+        1, within_hours=4, concurrency=2, on_thread=on_thread
+    )
+
+    assert FakeThread.max_active == 2
+    assert sorted(streamed) == [1, 2, 3]
+    assert streamed[0] == 2
+    assert [thread["id"] for thread in result["threads"]] == [2, 3, 1]
+    assert result["total_messages"] == 3
+
+
+def test_thread_concurrency_is_clamped(monkeypatch):
+    monkeypatch.setenv("DAEMON_THREAD_CONCURRENCY", "100")
+    assert daemon._thread_concurrency() == daemon.THREAD_CONCURRENCY_MAX
+    assert daemon._thread_concurrency("0") == 1
+    assert daemon._thread_concurrency("bogus") == daemon.THREAD_CONCURRENCY_DEFAULT
+
+
+@pytest.mark.asyncio
+async def test_subscribe_streams_matching_events_until_max_events(monkeypatch):
+    bus = EventBus()
+    monkeypatch.setattr(daemon, "get_event_bus", lambda: bus)
+    daemon_instance = daemon.DiscordDaemon.__new__(daemon.DiscordDaemon)
+    events = []
+
+    async def emit(event):
+        events.append(event)
+
+    task = asyncio.create_task(
+        daemon_instance._subscribe(["10"], [], max_events=2, emit=emit)
+    )
+    await asyncio.sleep(0)
+    message = {"message": {"id": 1, "content": "hi"}}
+    bus.publish("message_create", channel_id=99, guild_id=5, build=lambda: message)
+    bus.publish("message_create", channel_id=10, guild_id=5, build=lambda: message)
+    bus.publish("message_delete", channel_id=10, guild_id=5, build=lambda: {"message_ids": ["1"]})
+    result = await asyncio.wait_for(task, 1)
+
+    assert [event["type"] for event in events] == ["subscribed", "message_create", "message_delete"]
+    assert events[1]["channel_id"] == "10"
+    assert result == {"delivered": 2, "dropped": 0}
+    assert not bus.has_subscribers()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_requires_a_stream_and_a_filter():
+    daemon_instance = daemon.DiscordDaemon.__new__(daemon.DiscordDaemon)
+
+    async def emit(event):
+        pass
+
+    assert "streaming" in (await daemon_instance._subscribe(["1"], []))["error"]
+    assert "at least one" in (await daemon_instance._subscribe([], [], emit=emit))["error"]
+
+
+@pytest.mark.asyncio
+async def test_subscription_ends_when_the_client_disconnects(monkeypatch, tmp_path):
+    bus = EventBus()
+    monkeypatch.setattr(daemon, "get_event_bus", lambda: bus)
+    daemon_instance = daemon.DiscordDaemon.__new__(daemon.DiscordDaemon)
+    daemon_instance.auth_token = "secret"
+    socket_path = str(tmp_path / "daemon.sock")
+    server = await asyncio.start_unix_server(daemon_instance.handle_client, path=socket_path)
+
+    async with server:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        writer.write(encode_frame(hello_frame("secret")))
+        assert (await read_frame(reader))["ok"]
+        writer.write(
+            encode_frame(
+                {"id": 1, "stream": True, "command": "subscribe", "args": {"dms": True}}
+            )
+        )
+        assert (await read_frame(reader))["event"]["type"] == "subscribed"
+        assert bus.has_subscribers()
+
+        writer.close()
+        await writer.wait_closed()
+        for _ in range(50):
+            if not bus.has_subscribers():
+                break
+            await asyncio.sleep(0.01)
+
+    assert not bus.has_subscribers()
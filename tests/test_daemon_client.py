@@ -0,0 +1,255 @@
+import asyncio
+import json
+import socket
+
+import pytest
+from mcp.types import TextContent
+
+from discord_py_self_mcp import main
+from discord_py_self_mcp.daemon_client import (
+    DaemonClient,
+    DaemonError,
+    DaemonResponseLost,
+    DaemonUnavailable,
+)
+from discord_py_self_mcp.daemon_protocol import encode_frame, hello_frame, read_frame, recv_frame
+from discord_py_self_mcp.rate_limiter import current_priority
+from discord_py_self_mcp.tools.registry import ToolRegistry
+from scripts import daemon
+
+
+class FakeReadyClient:
+    def is_ready(self):
+        return True
+
+
+@pytest.fixture
+async def daemon_socket(tmp_path, monkeypatch):
+    tool_registry = ToolRegistry()
+
+    @tool_registry.register("echo", "Echo", {"type": "object"})
+    async def echo(arguments):
+        return [TextContent(type="text", text=f"{arguments['text']}:{current_priority.get()}")]
+
+    @tool_registry.register("slow", "Slow", {"type": "object"})
+    async def slow(arguments):
+        await asyncio.sleep(0.2)
+        return [TextContent(type="text", text="slow")]
+
+    monkeypatch.setattr(daemon, "registry", tool_registry)
+    instance = daemon.DiscordDaemon.__new__(daemon.DiscordDaemon)
+    instance.client = FakeReadyClient()
+    instance.auth_token = "secret"
+
+    socket_path = tmp_path / "daemon.sock"
+    auth_file = tmp_path / "daemon.auth"
+    auth_file.write_text("secret", encoding="utf-8")
+    server = await asyncio.start_unix_server(instance.handle_client, path=str(socket_path))
+    client = DaemonClient(socket_path, auth_file)
+    client.daemon = instance
+    try:
+        yield client
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_call_tool_round_trips_through_daemon(daemon_socket):
+    assert await daemon_socket.ping() is True
+
+    result = await daemon_socket.call_tool("echo", {"text": "hi"}, priority="background")
+
+    assert result == [TextContent(type="text", text="hi:background")]
+
+
+@pytest.mark.asyncio
+async def test_daemon_errors_are_raised(daemon_socket):
+    with pytest.raises(DaemonError, match="Unknown tool 'missing'"):
+        await daemon_socket.call_tool("missing", {})
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests_share_one_connection_and_finish_out_of_order(
+    daemon_socket,
+):
+    finished = []
+    assert await daemon_socket.ping() is True
+    connection = daemon_socket._writer
+
+    async def call(name, arguments):
+        result = await daemon_socket.call_tool(name, arguments)
+        finished.append(result[0].text)
+
+    await asyncio.gather(call("slow", {}), call("echo", {"text": "fast"}))
+
+    assert finished == ["fast:normal", "slow"]
+    assert daemon_socket._writer is connection
+
+
+@pytest.mark.asyncio
+async def test_large_request_is_not_truncated(daemon_socket):
+    text = "x" * 200_000
+
+    result = await daemon_socket.call_tool("echo", {"text": text})
+
+    assert result[0].text == f"{text}:normal"
+
+
+@pytest.mark.asyncio
+async def test_legacy_one_shot_client_still_works(daemon_socket):
+    reader, writer = await asyncio.open_unix_connection(str(daemon_socket.socket_path))
+    writer.write(json.dumps({"command": "ping", "args": {}, "auth": "secret"}).encode())
+    writer.write_eof()
+
+    response = json.loads((await reader.read()).decode())
+    writer.close()
+
+    assert response == {"ok": True, "ready": True}
+
+
+@pytest.mark.asyncio
+async def test_handshake_rejects_bad_auth_and_unknown_version(daemon_socket):
+    def handshake(payload):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(daemon_socket.socket_path))
+            sock.sendall(encode_frame(payload))
+            return recv_frame(sock)
+
+    bad_auth = await asyncio.to_thread(handshake, hello_frame("wrong"))
+    bad_version = await asyncio.to_thread(
+        handshake, {**hello_frame("secret"), "version": 99}
+    )
+
+    assert bad_auth["ok"] is False
+    assert "Unauthorized" in bad_auth["error"]
+    assert "Unsupported protocol version 99" in bad_version["error"]
+
+
+@pytest.mark.asyncio
+async def test_missing_socket_is_unavailable(tmp_path):
+    auth_file = tmp_path / "daemon.auth"
+    auth_file.write_text("secret", encoding="utf-8")
+    client = DaemonClient(tmp_path / "missing.sock", auth_file)
+
+    assert await client.ping() is False
+    with pytest.raises(DaemonUnavailable):
+        await client.call_tool("echo", {})
+
+
+@pytest.mark.asyncio
+async def test_main_forwards_to_daemon_and_falls_back_when_it_disappears(monkeypatch):
+    calls = []
+
+    class FlakyDaemon:
+        async def call_tool(
+            self, name, arguments, *, priority=None, ready_timeout=None, on_progress=None
+        ):
+            calls.append(("daemon", name))
+            if len(calls) > 1:
+                raise DaemonUnavailable("gone")
+            return [TextContent(type="text", text="from daemon")]
+
+    class LocalRegistry:
+        async def call_tool(self, name, arguments, *, priority=None, ready_timeout=None):
+            calls.append(("local", name))
+            return [TextContent(type="text", text="local")]
+
+    monkeypatch.setenv("MCP_DAEMON_MODE", "auto")
+    monkeypatch.setattr(main, "daemon", FlakyDaemon())
+    monkeypatch.setattr(main, "registry", LocalRegistry())
+    monkeypatch.setattr(main, "_start_local_client", lambda: calls.append(("start", None)))
+    monkeypatch.setattr(main, "_request_meta", lambda key: None)
+
+    assert (await main.call_tool("alpha", {}))[0].text == "from daemon"
+    assert (await main.call_tool("alpha", {}))[0].text == "local"
+
+    assert calls == [("daemon", "alpha"), ("daemon", "alpha"), ("start", None), ("local", "alpha")]
+    assert main.daemon is None
+
+
+@pytest.mark.asyncio
+async def test_request_lost_after_sending_raises_response_lost(tmp_path):
+    socket_path = tmp_path / "daemon.sock"
+    auth_file = tmp_path / "daemon.auth"
+    auth_file.write_text("secret", encoding="utf-8")
+
+    async def handle(reader, writer):
+        await read_frame(reader)
+        writer.write(encode_frame({"ok": True}))
+        await writer.drain()
+        await read_frame(reader)  # the request, then hang up without answering
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle, path=str(socket_path))
+    client = DaemonClient(socket_path, auth_file)
+    try:
+        with pytest.raises(DaemonResponseLost):
+            await client.call_tool("send_message", {})
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_main_does_not_replay_a_call_whose_response_was_lost(monkeypatch):
+    calls = []
+
+    class DroppingDaemon:
+        async def call_tool(
+            self, name, arguments, *, priority=None, ready_timeout=None, on_progress=None
+        ):
+            calls.append(("daemon", name))
+            raise DaemonResponseLost("Daemon closed the connection")
+
+    class LocalRegistry:
+        async def call_tool(self, name, arguments, *, priority=None, ready_timeout=None):
+            calls.append(("local", name))
+            return [TextContent(type="text", text="local")]
+
+    monkeypatch.setenv("MCP_DAEMON_MODE", "auto")
+    monkeypatch.setattr(main, "daemon", DroppingDaemon())
+    monkeypatch.setattr(main, "registry", LocalRegistry())
+    monkeypatch.setattr(main, "_start_local_client", lambda: calls.append(("start", None)))
+    monkeypatch.setattr(main, "_request_meta", lambda key: None)
+
+    result = await main.call_tool("send_message", {})
+
+    assert result[0].text.startswith("Error calling send_message: Daemon closed")
+    assert calls == [("daemon", "send_message")]
+
+
+@pytest.mark.asyncio
+async def test_dcli_send_request_uses_framed_protocol(daemon_socket, monkeypatch):
+    from scripts import dcli
+
+    monkeypatch.setattr(dcli, "is_daemon_running", lambda: True)
+    monkeypatch.setattr(dcli, "read_auth_token", lambda: "secret")
+    monkeypatch.setattr(dcli, "SOCKET_PATH", daemon_socket.socket_path)
+
+    response = await asyncio.to_thread(
+        dcli.send_request,
+        {"command": "call_tool", "args": {"name": "echo", "arguments": {"text": "cli"}}},
+    )
+
+    assert response["content"][0]["text"] == "cli:normal"
+
+
+@pytest.mark.asyncio
+async def test_streamed_events_arrive_before_final_result(daemon_socket):
+    async def fake_read_recent_threads(guild_id, *args, on_thread=None):
+        for thread_id in (2, 1):
+            await on_thread({"thread": {"id": thread_id}})
+        return {"threads": [{"id": 1}, {"id": 2}]}
+
+    daemon_socket.daemon._read_recent_threads = fake_read_recent_threads
+    events = []
+
+    result = await daemon_socket.request(
+        "read_recent_threads", {"guild_id": 1}, on_event=events.append
+    )
+
+    assert events == [{"thread": {"id": 2}}, {"thread": {"id": 1}}]
+    assert result == {"threads": [{"id": 1}, {"id": 2}]}
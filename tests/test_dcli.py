@@ -11,6 +11,7 @@ def test_cmd_get_message_attachments_saves_requested_downloads(
                 "channel_id": 123,
                 "message_id": 456,
                 "download_content": True,
+                "return_mode": "path",
             },
         }
         return {
@@ -55,3 +56,53 @@ def test_cmd_get_message_attachments_requires_output_dir_when_downloading(capsys
         "Error: --output-dir is required when --download is used"
         in capsys.readouterr().out
     )
+
+
+def test_cmd_get_message_attachments_copies_cached_files(monkeypatch, tmp_path, capsys):
+    cached = tmp_path / "cache" / "99-abc"
+    cached.parent.mkdir()
+    cached.write_bytes(b"cached payload")
+
+    def fake_send_request(payload):
+        return {
+            "message_id": 456,
+            "attachments": [],
+            "downloads": [{"index": 0, "filename": "log.txt", "path": str(cached)}],
+        }
+
+    monkeypatch.setattr(dcli, "send_request", fake_send_request)
+
+    dcli.cmd_get_message_attachments(
+        123, 456, download=True, output_dir=str(tmp_path / "out")
+    )
+
+    assert (tmp_path / "out" / "attachment-0-log.txt").read_bytes() == b"cached payload"
+
+
+def test_cmd_tail_prints_streamed_events(monkeypatch, capsys):
+    def fake_send_request(payload, timeout=30, on_event=None):
+        assert payload == {
+            "command": "subscribe",
+            "args": {"channel_ids": [123], "guild_ids": [], "dms": False},
+        }
+        assert timeout is None
+        on_event({"type": "subscribed", "max_buffer": 1000})
+        message = {"id": 1, "author": "alice", "content": "hello", "created_at": ""}
+        on_event({"type": "message_create", "channel_id": "123", "message": message})
+        on_event({"type": "message_edit", "channel_id": "123", "message": message})
+        on_event({"type": "message_delete", "channel_id": "123", "message_ids": ["1"]})
+        on_event({"type": "overflow", "dropped": 3})
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(dcli, "send_request", fake_send_request)
+
+    dcli.cmd_tail([123])
+
+    output = capsys.readouterr().out.splitlines()
+    assert output == [
+        "Waiting for messages (Ctrl-C to stop)...",
+        "[] alice: hello",
+        "[] alice: [edited] hello",
+        "[deleted] message_id=1",
+        "[!] fell behind, 3 events dropped",
+    ]
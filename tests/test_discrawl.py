@@ -1,8 +1,22 @@
+import json
+import sys
+
 import pytest
 
+from discord_py_self_mcp import discrawl_archive, discrawl_pool
+from discord_py_self_mcp.progress import current_progress
 from discord_py_self_mcp.tools import discrawl
 
 
+@pytest.fixture(autouse=True)
+def _no_archive(monkeypatch):
+    # These tests exercise the subprocess path; keep a local archive out of it.
+    config = discrawl_archive.DiscrawlArchiveConfig(mode="off")
+    monkeypatch.setattr(
+        discrawl_archive, "_global_discrawl_archive", discrawl_archive.DiscrawlArchive(config)
+    )
+
+
 def test_default_discrawl_candidates_are_fork_only():
     candidates = discrawl._default_discrawl_candidates()
 
@@ -39,3 +53,244 @@ async def test_missing_default_binary_points_to_microck_fork(monkeypatch):
 
     assert "https://github.com/Microck/discrawl-self" in result[0].text
     assert "../discrawl-self/bin/discrawl" in result[0].text
+
+
+FAKE_DISCRAWL = """#!{python}
+import json
+import sys
+
+args = sys.argv[1:]
+print(" ".join(args), file=sys.stderr)
+if "--json" not in args:
+    print("plain text output")
+    sys.exit(0)
+if {unsupported}:
+    print("flag provided but not defined: -json", file=sys.stderr)
+    sys.exit(2)
+limit = int(args[args.index("--limit") + 1])
+for i in range(limit):
+    print(json.dumps({{"id": i, "content": "x" * {width}}}), flush=True)
+"""
+
+
+def _fake_binary(tmp_path, unsupported=False, width=10):
+    binary = tmp_path / "discrawl"
+    binary.write_text(
+        FAKE_DISCRAWL.format(python=sys.executable, unsupported=unsupported, width=width)
+    )
+    binary.chmod(0o755)
+    return str(binary)
+
+
+def _rows(text):
+    return [json.loads(line) for line in text.splitlines() if line.startswith("{")]
+
+
+def test_row_stream_decodes_ndjson_split_across_chunks():
+    stream = discrawl.RowStream()
+    payload = b'{"id": 1}\n{"id": 2, "text": "caf\xc3\xa9"}\n'
+
+    rows = []
+    for index in range(len(payload)):
+        rows.extend(stream.feed(payload[index : index + 1]))
+    rows.extend(stream.feed(b"", final=True))
+
+    assert rows == [{"id": 1}, {"id": 2, "text": "café"}]
+    assert stream.mode == "lines"
+
+
+def test_row_stream_unwraps_arrays_and_result_objects():
+    array = discrawl.RowStream()
+    rows = array.feed(b'[{"id": 1}, {"id"') + array.feed(b': 2}]', final=True)
+    assert rows == [{"id": 1}, {"id": 2}]
+
+    wrapped = discrawl.RowStream()
+    assert wrapped.feed(b'{"results": [{"id": 3}]}', final=True) == [{"id": 3}]
+
+    text = discrawl.RowStream()
+    assert text.feed(b"no results\n", final=True) == []
+    assert text.mode == "text" and text.text == "no results\n"
+
+
+@pytest.mark.asyncio
+async def test_messages_returns_a_page_with_next_offset(tmp_path):
+    binary = _fake_binary(tmp_path)
+
+    result = await discrawl.discrawl_messages(
+        {"binary": binary, "channel": "general", "offset": 5, "max_rows": 3}
+    )
+
+    text = result[0].text
+    assert "--json --limit 9 --channel general" in text
+    assert [row["id"] for row in _rows(text)] == [5, 6, 7]
+    assert "next_offset: 8" in text
+
+
+@pytest.mark.asyncio
+async def test_search_stops_at_the_token_budget_on_a_row_boundary(tmp_path):
+    binary = _fake_binary(tmp_path, width=2000)
+
+    result = await discrawl.discrawl_search(
+        {"binary": binary, "query": "hello", "limit": 20, "max_output_tokens": 1200}
+    )
+
+    text = result[0].text
+    assert [row["id"] for row in _rows(text)] == [0, 1]
+    assert "next_offset: 2" in text
+
+
+@pytest.mark.asyncio
+async def test_last_page_reports_end_of_results(tmp_path):
+    binary = _fake_binary(tmp_path)
+
+    result = await discrawl.discrawl_mentions({"binary": binary, "limit": 2})
+
+    assert [row["id"] for row in _rows(result[0].text)] == [0, 1]
+    assert "End of results" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_text_when_json_is_unsupported(tmp_path):
+    binary = _fake_binary(tmp_path, unsupported=True)
+
+    result = await discrawl.discrawl_messages({"binary": binary})
+
+    assert "plain text output" in result[0].text
+    assert "exit_code=0" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_text_fallback_keeps_the_callers_arguments(tmp_path):
+    binary = _fake_binary(tmp_path, unsupported=True)
+
+    result = await discrawl.discrawl_messages(
+        {"binary": binary, "channel": "general", "limit": 500, "all": True, "max_rows": 3}
+    )
+
+    command = result[0].text.splitlines()[0]
+    assert "--json" not in command
+    assert "--limit 500" in command and "--all" in command
+
+
+@pytest.mark.asyncio
+async def test_text_fallback_rejects_an_offset(tmp_path):
+    binary = _fake_binary(tmp_path, unsupported=True)
+
+    result = await discrawl.discrawl_messages({"binary": binary, "offset": 10})
+
+    assert result[0].text.startswith("Error: offset needs a discrawl build with --json")
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache_until_sync(tmp_path, monkeypatch):
+    monkeypatch.setattr(discrawl_pool, "_global_discrawl_pool", None)
+    binary = _fake_binary(tmp_path)
+    log = tmp_path / "calls.log"
+    script = tmp_path / "discrawl"
+    script.write_text(
+        script.read_text().replace(
+            "args = sys.argv[1:]\n",
+            f"args = sys.argv[1:]\nopen({str(log)!r}, 'a').write('run\\n')\n",
+        )
+    )
+    arguments = {"binary": binary, "channel": "general", "max_rows": 2}
+
+    first = await discrawl.discrawl_messages(arguments)
+    second = await discrawl.discrawl_messages({**arguments, "timeout_seconds": 60})
+    assert second == first
+    assert log.read_text().count("run") == 1
+
+    await discrawl.discrawl_sync({"binary": binary})
+    await discrawl.discrawl_messages(arguments)
+    assert log.read_text().count("run") == 3
+
+
+FAKE_SYNC = """#!{python}
+import sys
+import time
+
+for index, name in enumerate(["a", "b", "c"], start=1):
+    print(f"channel #{{name}} done ({{index * 10}} messages)", file=sys.stderr, flush=True)
+    time.sleep(0.05)
+    if {hang} and index == 2:
+        time.sleep(30)
+print("sync complete: 3/3 channels, 60 messages", flush=True)
+"""
+
+
+def _fake_sync(tmp_path, hang=False):
+    binary = tmp_path / "discrawl"
+    binary.write_text(FAKE_SYNC.format(python=sys.executable, hang=hang))
+    binary.chmod(0o755)
+    return str(binary)
+
+
+def test_sync_progress_parses_text_and_json_lines():
+    progress = discrawl.SyncProgress()
+
+    assert progress.update("channel #general done (52 messages)")
+    assert progress.update("channel #random synced: 1,200 messages")
+    assert not progress.update("fetching guild metadata")
+    assert (progress.channels_done, progress.messages) == (2, 1252)
+
+    assert progress.update('{"msg": "sync", "channels_done": 5, "channels_total": 9}')
+    assert (progress.channels_done, progress.channels_total) == (5, 9)
+    assert progress.summary().startswith("5/9 channels, 1252 messages")
+
+
+@pytest.mark.asyncio
+async def test_sync_streams_progress_notifications(tmp_path, monkeypatch):
+    monkeypatch.setattr(discrawl, "SYNC_PROGRESS_INTERVAL", 0)
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append((progress, total, message))
+
+    token = current_progress.set(on_progress)
+    try:
+        result = await discrawl.discrawl_sync({"binary": _fake_sync(tmp_path)})
+    finally:
+        current_progress.reset(token)
+
+    text = result[0].text
+    assert "exit_code=0" in text
+    assert "progress: 3/3 channels, 60 messages" in text
+    assert [update[0] for update in updates] == [1, 2, 3, 3]
+    assert updates[-1][1] == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_timeout_keeps_partial_output(tmp_path, monkeypatch):
+    real_prepare = discrawl._prepare_command
+    monkeypatch.setattr(
+        discrawl, "_prepare_command", lambda arguments: (real_prepare(arguments)[0], 0.5)
+    )
+
+    result = await discrawl.discrawl_sync({"binary": _fake_sync(tmp_path, hang=True)})
+
+    text = result[0].text
+    assert "timed out after 0.5s; partial output below" in text
+    assert "channel #b done (20 messages)" in text
+    assert "progress: 2 channels, 30 messages" in text
+
+
+@pytest.mark.asyncio
+async def test_background_sync_job_can_be_polled(tmp_path, monkeypatch):
+    monkeypatch.setattr(discrawl_pool, "_global_discrawl_pool", None)
+    binary = _fake_sync(tmp_path)
+
+    started = await discrawl.discrawl_sync({"binary": binary, "background": True})
+    job_id = started[0].text.split()[3]
+    again = await discrawl.discrawl_sync({"binary": binary, "background": True})
+    assert job_id in again[0].text
+
+    running = await discrawl.discrawl_sync_status({"job_id": job_id})
+    assert f"job {job_id}: running" in running[0].text
+
+    await discrawl_pool.get_discrawl_pool().get_job(job_id).task
+    done = await discrawl.discrawl_sync_status({"job_id": job_id})
+    assert f"job {job_id}: succeeded" in done[0].text
+    assert "sync complete" in done[0].text
+
+    listing = await discrawl.discrawl_sync_status({})
+    assert listing[0].text.startswith(f"job {job_id}: succeeded")
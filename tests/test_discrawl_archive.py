@@ -0,0 +1,123 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from discord_py_self_mcp import discrawl_archive
+from discord_py_self_mcp.discrawl_archive import DiscrawlArchive, DiscrawlArchiveConfig
+from discord_py_self_mcp.tools import discrawl
+
+SCHEMA = """
+CREATE TABLE channels (id TEXT PRIMARY KEY, guild_id TEXT, name TEXT);
+CREATE TABLE members (
+    guild_id TEXT, user_id TEXT, username TEXT, display_name TEXT,
+    PRIMARY KEY (guild_id, user_id)
+);
+CREATE TABLE messages (
+    id TEXT PRIMARY KEY, guild_id TEXT, channel_id TEXT, author_id TEXT,
+    created_at TEXT, content TEXT
+);
+CREATE VIRTUAL TABLE message_fts USING fts5(message_id UNINDEXED, content);
+CREATE TABLE mention_events (
+    message_id TEXT, guild_id TEXT, channel_id TEXT,
+    target_type TEXT, target_id TEXT, target_name TEXT
+);
+"""
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    path = tmp_path / "discrawl.db"
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    db.executemany(
+        "INSERT INTO channels VALUES (?, ?, ?)",
+        [("10", "1", "general"), ("11", "1", "random")],
+    )
+    db.executemany(
+        "INSERT INTO members VALUES (?, ?, ?, ?)",
+        [("1", "100", "alice", None), ("1", "200", "bob", "Bobby")],
+    )
+    rows = [
+        ("1000", "1", "10", "100", "2026-01-01T00:00:00Z", "hello world"),
+        ("1001", "1", "10", "200", "2026-01-02T00:00:00Z", 'say "hi" @alice'),
+        ("1002", "1", "11", "100", "2026-01-03T00:00:00Z", "unrelated"),
+        ("1003", "1", "10", "100", "2026-01-04T00:00:00Z", ""),
+        ("1004", "1", "10", "100", "2026-01-05T00:00:00Z", "hello again"),
+    ]
+    db.executemany("INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)", rows)
+    db.executemany(
+        "INSERT INTO message_fts (message_id, content) VALUES (?, ?)",
+        [(row[0], row[5]) for row in rows],
+    )
+    db.execute(
+        "INSERT INTO mention_events VALUES ('1001', '1', '10', 'user', '100', 'alice')"
+    )
+    db.commit()
+    instance = DiscrawlArchive(DiscrawlArchiveConfig(path=path))
+    monkeypatch.setattr(discrawl_archive, "_global_discrawl_archive", instance)
+
+    async def no_subprocess(*args, **kwargs):
+        raise AssertionError("discrawl should not be started")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", no_subprocess)
+    yield instance
+    db.close()
+
+
+def _ids(result):
+    return [json.loads(line)["id"] for line in result[0].text.splitlines() if line.startswith("{")]
+
+
+@pytest.mark.asyncio
+async def test_messages_filter_by_names_and_page_newest_first(archive):
+    arguments = {"channel": "#general", "author": "alice", "max_rows": 1}
+
+    first = await discrawl.discrawl_messages(arguments)
+    second = await discrawl.discrawl_messages({**arguments, "offset": 1})
+
+    assert first[0].text.startswith("source=sqlite ")
+    assert _ids(first) == ["1004"] and "next_offset: 1" in first[0].text
+    # The empty message 1003 is skipped unless include_empty is set.
+    assert _ids(second) == ["1000"] and "End of results" in second[0].text
+
+
+@pytest.mark.asyncio
+async def test_search_uses_fts_and_treats_query_as_text(archive):
+    result = await discrawl.discrawl_search({"query": "hello", "channel": "10"})
+    assert sorted(_ids(result)) == ["1000", "1004"]
+
+    quoted = await discrawl.discrawl_search({"query": '"hi" OR'})
+    assert _ids(quoted) == []
+
+
+@pytest.mark.asyncio
+async def test_mentions_join_the_message_and_respect_limit(archive):
+    result = await discrawl.discrawl_mentions({"target": "@alice", "type": "user"})
+
+    assert _ids(result) == ["1001"]
+    assert '"author_name":"Bobby"' in result[0].text
+    assert '"target_type":"user"' in result[0].text
+
+    limited = await discrawl.discrawl_messages({"limit": 2, "max_rows": 10})
+    assert _ids(limited) == ["1004", "1002"]
+    assert "End of results" in limited[0].text
+
+
+@pytest.mark.asyncio
+async def test_unrecognised_schema_falls_back_to_discrawl(tmp_path):
+    path = tmp_path / "other.db"
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE messages (id TEXT, body TEXT)")
+    db.commit()
+    db.close()
+    instance = DiscrawlArchive(DiscrawlArchiveConfig(path=path))
+
+    assert await instance.query("messages", {}, 0, 10) is None
+    assert instance.get_stats()["fallbacks"] == 1
+
+
+def test_fts_phrase_query_quotes_every_word():
+    assert discrawl_archive.fts_phrase_query('a "b" NEAR') == '"a" """b""" "NEAR"'
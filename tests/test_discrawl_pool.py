@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from discord_py_self_mcp.discrawl_pool import DiscrawlPool, DiscrawlPoolConfig
+
+
+def _pool(**kwargs):
+    return DiscrawlPool(DiscrawlPoolConfig(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_identical_queries_share_one_run_and_are_cached():
+    pool = _pool()
+    calls = 0
+    release = asyncio.Event()
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "rows", True
+
+    first = asyncio.create_task(pool.query("k", call))
+    second = asyncio.create_task(pool.query("k", call))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == "rows"
+    assert await pool.query("k", call) == "rows"
+    assert calls == 1
+    assert pool.get_stats()["coalesced"] == 1 and pool.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_lru_bounded_and_skips_failures():
+    pool = _pool(cache_size=2)
+
+    async def ok(value):
+        return value, True
+
+    for key in ("a", "b", "a", "c"):
+        await pool.query(key, lambda key=key: ok(key))
+
+    assert list(pool._cache) == ["a", "c"]
+
+    async def failed():
+        return "error", False
+
+    await pool.query("d", failed)
+    assert "d" not in pool._cache
+
+
+@pytest.mark.asyncio
+async def test_sync_is_single_flight_and_invalidates_the_cache():
+    pool = _pool()
+    release = asyncio.Event()
+    runs = []
+
+    async def sync(name):
+        runs.append(name)
+        await release.wait()
+        return name
+
+    async def query():
+        return "stale", True
+
+    await pool.query("q", query)
+    first = asyncio.create_task(pool.sync("all", lambda: sync("all")))
+    joined = asyncio.create_task(pool.sync("all", lambda: sync("all")))
+    other = asyncio.create_task(pool.sync("guild", lambda: sync("guild")))
+    await asyncio.sleep(0.01)
+    # The other sync waits for the running one instead of overlapping it.
+    assert runs == ["all"]
+
+    release.set()
+    assert await first == await joined == "all"
+    assert await other == "guild"
+    assert runs == ["all", "guild"]
+    assert pool._cache == {} and pool.syncs == 2
+
+
+@pytest.mark.asyncio
+async def test_query_started_before_a_sync_is_not_cached():
+    pool = _pool()
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "old", True
+
+    async def sync():
+        return None
+
+    query = asyncio.create_task(pool.query("q", slow))
+    await asyncio.sleep(0)
+    await pool.sync("s", sync)
+    release.set()
+
+    assert await query == "old"
+    assert "q" not in pool._cache
@@ -0,0 +1,53 @@
+import pytest
+
+from discord_py_self_mcp.event_bus import EventBus, EventFilter, subscriber_buffer
+
+
+def _message(message_id):
+    return lambda: {"message": {"id": message_id}}
+
+
+def test_filter_matches_channels_threads_guilds_and_dms():
+    channel = EventFilter(channel_ids=frozenset({10}))
+    guild = EventFilter(guild_ids=frozenset({5}))
+    dms = EventFilter(dms=True)
+
+    assert channel.matches(10, 5)
+    assert channel.matches(11, 5, parent_id=10)
+    assert not channel.matches(12, 5)
+    assert guild.matches(12, 5)
+    assert not guild.matches(12, None)
+    assert dms.matches(30, None)
+    assert not dms.matches(30, 5)
+
+
+def test_publish_skips_building_events_nobody_wants():
+    bus = EventBus()
+    bus.subscribe(EventFilter(channel_ids=frozenset({10})))
+
+    def build():
+        raise AssertionError("should not serialize")
+
+    assert bus.publish("message_create", channel_id=11, guild_id=None, build=build) == 0
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_drops_oldest_and_reports_overflow():
+    bus = EventBus()
+    subscription = bus.subscribe(EventFilter(channel_ids=frozenset({10})), max_buffer=2)
+
+    for message_id in range(1, 5):
+        bus.publish("message_create", channel_id=10, guild_id=None, build=_message(message_id))
+
+    assert await subscription.get() == {"type": "overflow", "dropped": 2}
+    assert (await subscription.get())["message"]["id"] == 3
+    assert (await subscription.get())["message"]["id"] == 4
+    assert bus.get_stats()["dropped"] == 2
+
+
+def test_subscriber_buffer_is_clamped(monkeypatch):
+    monkeypatch.setenv("DAEMON_SUBSCRIBER_BUFFER", "50")
+
+    assert subscriber_buffer() == 50
+    assert subscriber_buffer(0) == 1
+    assert subscriber_buffer(10**9) == 10000
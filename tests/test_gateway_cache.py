@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from discord_py_self_mcp.gateway_cache import GatewayCache, GatewayCacheConfig
+
+
+class FakeGuild:
+    def __init__(self, guild_id, *, members=0, chunked=False, chunk_error=None):
+        self.id = guild_id
+        self.name = f"guild-{guild_id}"
+        self.member_count = 100
+        self.members = [object()] * members
+        self.channels = [object()] * 3
+        self.threads = []
+        self.roles = [object()]
+        self.emojis = []
+        self.chunked = chunked
+        self.chunk_calls = 0
+        self._chunk_error = chunk_error
+
+    async def chunk(self):
+        self.chunk_calls += 1
+        await asyncio.sleep(0)
+        if self._chunk_error:
+            raise self._chunk_error
+        self.chunked = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.requested = []
+
+    async def request_guild(self, guild_id):
+        self.requested.append(guild_id)
+
+
+class FakeMessage:
+    def __init__(self, guild):
+        self.guild = guild
+
+
+class FakeClient:
+    def __init__(self, guilds, cached_messages=()):
+        self.guilds = guilds
+        self.users = []
+        self.private_channels = []
+        self.cached_messages = list(cached_messages)
+        self._connection = FakeConnection()
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("DISCORD_MAX_MESSAGES", "0")
+    monkeypatch.setenv("DISCORD_MEMBER_CACHE", "voice")
+    monkeypatch.setenv("DISCORD_GUILD_IDS", "10, 20")
+    monkeypatch.setenv("DISCORD_GUILD_CHUNKING", "lazy")
+
+    cache = GatewayCache()
+    options = cache.client_options()
+
+    assert cache.config.guild_ids == frozenset({10, 20})
+    assert options["max_messages"] is None
+    assert options["member_cache_flags"].voice and not options["member_cache_flags"].other
+    assert options["request_guilds"] is False
+    assert options["chunk_guilds_at_startup"] is False
+
+
+def test_defaults_match_discord_py():
+    options = GatewayCache(GatewayCacheConfig()).client_options()
+
+    assert options["max_messages"] == 1000
+    assert options["request_guilds"] is True
+    assert options["chunk_guilds_at_startup"] is True
+
+
+def test_invalid_policy_is_rejected(monkeypatch):
+    monkeypatch.setenv("DISCORD_MEMBER_CACHE", "some")
+
+    with pytest.raises(ValueError, match="DISCORD_MEMBER_CACHE"):
+        GatewayCache()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_scope_only_requests_listed_guilds():
+    cache = GatewayCache(GatewayCacheConfig(guild_ids=frozenset({2}), chunking="startup"))
+    listed, other = FakeGuild(2), FakeGuild(3)
+    client = FakeClient([listed, other])
+
+    await cache.subscribe_scope(client)
+    await asyncio.sleep(0.01)
+
+    assert client._connection.requested == [2]
+    assert listed.chunk_calls == 1
+    assert other.chunk_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_schedule_chunk_runs_once_and_remembers_failures():
+    cache = GatewayCache(GatewayCacheConfig(chunking="lazy"))
+    guild = FakeGuild(5)
+    large = FakeGuild(6, chunk_error=RuntimeError("This guild cannot be chunked"))
+
+    cache.schedule_chunk(guild)
+    cache.schedule_chunk(guild)
+    cache.schedule_chunk(large)
+    await asyncio.sleep(0.01)
+    cache.schedule_chunk(guild)
+    cache.schedule_chunk(large)
+    await asyncio.sleep(0.01)
+
+    assert guild.chunk_calls == 1
+    assert guild.chunked
+    assert large.chunk_calls == 1
+
+
+def test_report_lists_cache_sizes_per_guild():
+    cache = GatewayCache(GatewayCacheConfig(guild_ids=frozenset({1})))
+    small, big = FakeGuild(1, members=2, chunked=True), FakeGuild(2, members=40)
+    client = FakeClient([small, big], [FakeMessage(small), FakeMessage(None)])
+
+    report = cache.report(client)
+
+    assert [entry["id"] for entry in report["guilds"]] == ["2", "1"]
+    assert report["guilds"][1]["cached_messages"] == 1
+    assert report["guilds"][1]["subscribed"] is True
+    assert report["guilds"][0]["subscribed"] is False
+    assert report["totals"]["cached_members"] == 42
+    assert report["totals"]["dm_cached_messages"] == 1
+    assert "rss_bytes" in report["process"]
+    assert cache.report(client, guild_id=1)["guilds"][0]["id"] == "1"
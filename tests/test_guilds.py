@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from discord_py_self_mcp.tools import guilds
@@ -15,6 +17,7 @@ class FakeGuild:
     def __init__(self, name="Guild", guild_id=1):
         self.name = name
         self.id = guild_id
+        self.member_count = 2
 
 
 class FakeClient:
@@ -44,3 +47,26 @@ async def test_get_user_info_prefers_global_name(monkeypatch):
     result = await guilds.get_user_info({})
 
     assert result[0].text == "User: Display Name (@handle) (123)"
+
+
+@pytest.mark.asyncio
+async def test_list_guilds_ndjson_output(monkeypatch):
+    guild_list = [FakeGuild("One", 1), FakeGuild("Two", 2)]
+    monkeypatch.setattr(guilds, "client", FakeClient(guild_list=guild_list))
+
+    result = await guilds.list_guilds({"output": "ndjson"})
+
+    rows = [json.loads(line) for line in result[0].text.splitlines()]
+    assert rows == [
+        {"id": 1, "name": "One", "member_count": 2},
+        {"id": 2, "name": "Two", "member_count": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_guilds_rejects_unknown_output(monkeypatch):
+    monkeypatch.setattr(guilds, "client", FakeClient())
+
+    result = await guilds.list_guilds({"output": "xml"})
+
+    assert result[0].text.startswith("Error listing guilds: Invalid output 'xml'")
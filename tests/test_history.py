@@ -0,0 +1,196 @@
+import json
+import re
+from datetime import datetime, timezone
+
+import pytest
+
+from discord_py_self_mcp.cursors import encode_continuation
+from discord_py_self_mcp.progress import current_progress
+from discord_py_self_mcp.tools import history
+
+
+class FakeAuthor:
+    name = "tester"
+    id = 1
+
+
+class FakeMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+        self.author = FakeAuthor()
+        self.content = f"m{message_id}"
+        self.clean_content = ""
+        self.attachments = []
+        self.embeds = []
+        self.reference = None
+        self.created_at = datetime(2026, 4, 17, tzinfo=timezone.utc)
+
+
+class FakeHistoryIterator:
+    def __init__(self, messages_list):
+        self._iter = iter(messages_list)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+class FakeMessageable:
+    pass
+
+
+class FakeHistoryChannel(FakeMessageable):
+    """Honours ``before``/``after``/``oldest_first`` like discord.py."""
+
+    def __init__(self, count):
+        self._messages = [FakeMessage(i) for i in range(1, count + 1)]
+        self.history_calls = []
+
+    def history(self, *, limit, before=None, after=None, oldest_first=None):
+        self.history_calls.append({"limit": limit, "before": before, "after": after})
+        selected = self._messages
+        if before is not None:
+            selected = [m for m in selected if m.id < before.id]
+        if after is not None:
+            selected = [m for m in selected if m.id > after.id]
+        if oldest_first:
+            return FakeHistoryIterator(selected[:limit])
+        return FakeHistoryIterator(list(reversed(selected))[:limit])
+
+
+class FakeClient:
+    def __init__(self, channel):
+        self._channel = channel
+
+    def get_channel(self, channel_id):
+        return self._channel
+
+
+def _message_ids(text):
+    return [int(match) for match in re.findall(r"message_id=(\d+)", text)]
+
+
+def _continuation(result):
+    match = re.search(r"continuation: (\S+)", result[-1].text)
+    return match.group(1) if match else None
+
+
+@pytest.fixture
+def history_channel(monkeypatch):
+    fake_channel = FakeHistoryChannel(250)
+    monkeypatch.setattr(history.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(history, "client", FakeClient(fake_channel))
+    route_waits = []
+
+    async def fake_apply_rate_limit(action_type, route=None):
+        pass
+
+    async def fake_wait_for_route(route):
+        route_waits.append(route)
+
+    monkeypatch.setattr(history, "apply_rate_limit", fake_apply_rate_limit)
+    monkeypatch.setattr(history, "wait_for_route", fake_wait_for_route)
+    fake_channel.route_waits = route_waits
+    return fake_channel
+
+
+@pytest.mark.asyncio
+async def test_history_pages_backward_and_resumes_from_continuation(history_channel):
+    first = await history.read_message_history({"channel_id": "5", "max_messages": 150})
+
+    ids = _message_ids(first[0].text)
+    assert ids == list(range(250, 100, -1))
+    assert [call["limit"] for call in history_channel.history_calls] == [100, 50]
+    assert len(history_channel.route_waits) == 1
+    token = _continuation(first)
+    assert token is not None
+
+    rest = await history.read_message_history(
+        {"channel_id": "5", "continuation": token, "max_messages": 500}
+    )
+
+    assert _message_ids(rest[0].text) == list(range(100, 0, -1))
+    assert "End of channel history reached" in rest[-1].text
+    assert _continuation(rest) is None
+
+
+@pytest.mark.asyncio
+async def test_history_forward_walks_oldest_first(history_channel):
+    result = await history.read_message_history(
+        {"channel_id": "5", "direction": "forward", "after": "240"}
+    )
+
+    assert _message_ids(result[0].text) == list(range(241, 251))
+    assert "(forward, oldest first)" in result[-1].text
+
+
+@pytest.mark.asyncio
+async def test_history_stops_at_the_output_budget(history_channel):
+    result = await history.read_message_history(
+        {"channel_id": "5", "max_messages": 250, "max_output_bytes": 200}
+    )
+
+    ids = _message_ids(result[0].text)
+    assert 0 < len(ids) < 250
+    assert len(result[0].text.encode()) <= 200
+    assert "Stopped at max_output_bytes=200" in result[-1].text
+
+    rest = await history.read_message_history(
+        {"channel_id": "5", "continuation": _continuation(result), "max_messages": 1}
+    )
+    assert _message_ids(rest[0].text) == [ids[-1] - 1]
+
+
+@pytest.mark.asyncio
+async def test_history_never_writes_to_the_filesystem(history_channel, tmp_path):
+    output_file = tmp_path / "export" / "history.txt"
+
+    result = await history.read_message_history(
+        {"channel_id": "5", "max_messages": 5, "output_file": str(output_file)}
+    )
+
+    assert _message_ids(result[0].text) == [250, 249, 248, 247, 246]
+    assert not output_file.parent.exists()
+
+
+@pytest.mark.asyncio
+async def test_history_reports_progress_per_page(history_channel):
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append((progress, total))
+
+    token = current_progress.set(on_progress)
+    try:
+        await history.read_message_history({"channel_id": "5", "max_messages": 300})
+    finally:
+        current_progress.reset(token)
+
+    assert updates == [(100, 300), (200, 300)]
+
+
+@pytest.mark.asyncio
+async def test_history_rejects_a_continuation_for_another_channel(history_channel):
+    result = await history.read_message_history(
+        {"channel_id": "5", "continuation": encode_continuation(6, "backward", 10)}
+    )
+
+    assert result[0].text.startswith("Error reading history: Cursor belongs to channel 6")
+    assert history_channel.history_calls == []
+
+
+@pytest.mark.asyncio
+async def test_history_json_output_returns_one_document(history_channel):
+    result = await history.read_message_history(
+        {"channel_id": "1", "max_messages": 3, "output": "json"}
+    )
+
+    document = json.loads(result[0].text)
+    assert [message["id"] for message in document["messages"]] == [250, 249, 248]
+    assert document["messages"][0]["content"] == "m250"
+    assert _continuation(result)
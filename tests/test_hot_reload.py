@@ -0,0 +1,149 @@
+import asyncio
+import importlib
+import sys
+import textwrap
+import types
+
+import pytest
+
+from discord_py_self_mcp import hot_reload
+from discord_py_self_mcp.tools.registry import ToolRegistry
+
+FIXTURE = "discord_py_self_mcp.tools._reload_fixture"
+REGISTRY_MODULE = sys.modules["discord_py_self_mcp.tools.registry"]
+
+TOOL_SOURCE = """
+import asyncio
+
+from mcp.types import TextContent
+
+from discord_py_self_mcp.tools.registry import registry
+
+VERSION = "{version}"
+release = asyncio.Event()
+
+
+def label():
+    return VERSION
+
+
+@registry.register(
+    name="hot_echo", description="echo", input_schema={{"type": "object"}}, needs="none"
+)
+async def hot_echo(arguments: dict):
+    if arguments.get("wait"):
+        await release.wait()
+    return [TextContent(type="text", text=VERSION)]
+{extra}
+"""
+
+
+@pytest.fixture
+def tool_module(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    tools_package = sys.modules["discord_py_self_mcp.tools"]
+    monkeypatch.setattr(tools_package, "__path__", [*tools_package.__path__, str(tmp_path)])
+    monkeypatch.setattr(REGISTRY_MODULE, "registry", ToolRegistry())
+    path = tmp_path / "_reload_fixture.py"
+
+    def write(version, extra=""):
+        path.write_text(TOOL_SOURCE.format(version=version, extra=extra))
+
+    write("v1", extra=textwrap.dedent("""
+        @registry.register(name="hot_gone", description="gone", input_schema={"type": "object"})
+        async def hot_gone(arguments: dict):
+            return []
+    """))
+    importlib.invalidate_caches()
+    module = importlib.import_module(FIXTURE)
+    yield module, path, write
+    sys.modules.pop(FIXTURE, None)
+    vars(tools_package).pop("_reload_fixture", None)
+    sys.modules.pop("discord_py_self_mcp._reload_probe", None)
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_handlers_and_lets_running_calls_finish(tool_module):
+    module, path, write = tool_module
+    registry = REGISTRY_MODULE.registry
+    in_flight = asyncio.create_task(registry.call_tool("hot_echo", {"wait": True}))
+    await asyncio.sleep(0)
+    old_release = module.release
+
+    write("v2")
+    modules, restart = hot_reload.split_changes([path])
+    assert modules == [FIXTURE] and restart == []
+    hot_reload.reload_modules(modules)
+
+    fresh = await registry.call_tool("hot_echo", {})
+    old_release.set()
+    assert (await in_flight)[0].text == "v1"
+    assert fresh[0].text == "v2"
+    assert "hot_gone" not in registry.tools
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_keeps_the_old_registrations(tool_module):
+    _, path, _ = tool_module
+    registry = REGISTRY_MODULE.registry
+    path.write_text("def broken(:\n")
+
+    with pytest.raises(SyntaxError):
+        hot_reload.reload_modules([FIXTURE])
+
+    result = await registry.call_tool("hot_echo", {})
+    assert result[0].text == "v1"
+    assert "hot_gone" in registry.handlers
+
+
+def test_reload_rebinds_from_imports_in_other_modules(tool_module):
+    module, _, write = tool_module
+    probe = types.ModuleType("discord_py_self_mcp._reload_probe")
+    probe.label = module.label
+    sys.modules[probe.__name__] = probe
+
+    write("v3")
+    hot_reload.reload_modules([FIXTURE])
+
+    assert probe.label() == "v3"
+
+
+def test_split_changes_sends_stateful_modules_to_restart(tmp_path):
+    readiness_file = sys.modules["discord_py_self_mcp.readiness"].__file__
+
+    unimported = tmp_path / "never_imported.py"
+
+    modules, restart = hot_reload.split_changes([readiness_file, unimported])
+
+    assert modules == []
+    assert [str(path) for path in restart] == [readiness_file]
+
+
+DAEMON_SOURCE = """
+class Daemon:
+    def connect(self):
+        return "{connect}"
+
+    def handle(self):
+        return "{handle}"
+"""
+
+
+def test_reload_class_swaps_handlers_unless_connection_code_changed(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    path = tmp_path / "fake_daemon.py"
+    path.write_text(DAEMON_SOURCE.format(connect="c1", handle="h1"))
+    spec = importlib.util.spec_from_file_location("fake_daemon", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    daemon = module.Daemon()
+
+    # Shifting the connection code down a few lines does not count as a change.
+    path.write_text("\n\n# comment\n" + DAEMON_SOURCE.format(connect="c1", handle="h2"))
+    assert hot_reload.reload_class(daemon, path, ["connect"])
+    assert daemon.handle() == "h2"
+
+    path.write_text(DAEMON_SOURCE.format(connect="c2", handle="h3"))
+    assert not hot_reload.reload_class(daemon, path, ["connect"])
+    assert daemon.handle() == "h2"
+    assert daemon.connect() == "c1"
@@ -8,9 +8,28 @@ async def test_run_app_exits_with_actionable_error_when_token_missing(
     monkeypatch, capsys
 ):
     monkeypatch.delenv("DISCORD_TOKEN", raising=False)
+    monkeypatch.setenv("MCP_DAEMON_MODE", "off")
 
     with pytest.raises(SystemExit) as exc:
         await main.run_app()
 
     assert exc.value.code == 1
     assert "DISCORD_TOKEN is not set" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_run_app_requires_daemon_when_configured(monkeypatch, capsys):
+    class MissingDaemon:
+        socket_path = "/nonexistent/daemon.sock"
+
+        async def ping(self):
+            return False
+
+    monkeypatch.setenv("MCP_DAEMON_MODE", "require")
+    monkeypatch.setattr(main, "DaemonClient", MissingDaemon)
+
+    with pytest.raises(SystemExit) as exc:
+        await main.run_app()
+
+    assert exc.value.code == 1
+    assert "MCP_DAEMON_MODE=require" in capsys.readouterr().err
@@ -27,6 +27,7 @@ class FakeRole:
 
 class FakeGuild:
     def __init__(self, member=None, fetched_member=None, role=None):
+        self.id = 1
         self._member = member
         self._fetched_member = fetched_member
         self._role = role
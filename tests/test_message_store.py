@@ -0,0 +1,218 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from discord_py_self_mcp.message_store import MessageStore, MessageStoreConfig
+from discord_py_self_mcp.tools import messages
+
+
+class FakeAuthor:
+    def __init__(self, name="tester", user_id=1):
+        self.name = name
+        self.id = user_id
+
+
+class FakeChannelRef:
+    def __init__(self, channel_id):
+        self.id = channel_id
+
+
+class FakeMessage:
+    def __init__(self, message_id, content, channel_id=1):
+        self.id = message_id
+        self.author = FakeAuthor()
+        self.content = content
+        self.clean_content = content
+        self.attachments = []
+        self.embeds = []
+        self.reference = None
+        self.guild = None
+        self.channel = FakeChannelRef(channel_id)
+        self.created_at = datetime(2026, 4, 17, 19, 0, tzinfo=timezone.utc)
+
+
+class FakeHistoryIterator:
+    def __init__(self, messages_list):
+        self._iter = iter(messages_list)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+class FakeMessageable:
+    pass
+
+
+class FakeChannel(FakeMessageable):
+    def __init__(self, messages_list):
+        self._messages = messages_list
+        self.history_calls = []
+
+    def history(self, **kwargs):
+        self.history_calls.append(kwargs)
+        candidates = self._messages
+        before = kwargs.get("before")
+        if before is not None:
+            candidates = [msg for msg in candidates if msg.id < before.id]
+        return FakeHistoryIterator(candidates[: kwargs["limit"]])
+
+
+class FakeClient:
+    def __init__(self, channel):
+        self._channel = channel
+
+    def get_channel(self, channel_id):
+        return self._channel
+
+
+def make_store(tmp_path):
+    return MessageStore(MessageStoreConfig(enabled=True, path=tmp_path / "messages.db"))
+
+
+def test_gateway_messages_open_live_range_and_are_searchable(tmp_path):
+    store = make_store(tmp_path)
+
+    store.add_message(FakeMessage(100, "hello world"))
+    store.add_message(FakeMessage(101, "unrelated"))
+    store.add_message(FakeMessage(102, "Hello again"))
+
+    assert store.live_since(1) == 100
+    lines = store.search(1, "hello", 10, min_id=100)
+    assert [line.split("message_id=")[1][:3] for line in lines] == ["102", "100"]
+
+
+def test_short_queries_fall_back_to_like_scan(tmp_path):
+    store = make_store(tmp_path)
+    store.add_message(FakeMessage(100, "ok then"))
+    store.add_message(FakeMessage(101, "nope"))
+
+    lines = store.search(1, "ok", 10)
+
+    assert len(lines) == 1
+    assert "message_id=100" in lines[0]
+
+
+def test_search_records_include_stored_fields(tmp_path):
+    store = make_store(tmp_path)
+    store.add_message(FakeMessage(100, "hello world"))
+
+    (record,) = store.search_records(1, "hello", 10)
+
+    assert record["id"] == 100
+    assert "message_id=100" in record["line"]
+    assert set(record) == {"id", "author_id", "created_at", "line"}
+
+
+def test_edits_and_deletes_update_the_index(tmp_path):
+    store = make_store(tmp_path)
+    store.add_message(FakeMessage(100, "before edit"))
+    store.add_message(FakeMessage(101, "to be deleted"))
+
+    store.update_message(FakeMessage(100, "after edit"))
+    store.delete_messages([101])
+
+    assert store.search(1, "before", 10) == []
+    assert len(store.search(1, "after edit", 10)) == 1
+    assert store.search(1, "deleted", 10) == []
+
+
+def test_reset_live_keeps_rows_but_closes_coverage(tmp_path):
+    store = make_store(tmp_path)
+    store.add_message(FakeMessage(100, "hello"))
+
+    store.reset_live()
+
+    assert store.live_since(1) is None
+    assert store.find_range(1, 100)[1:] == (100, 100)
+
+
+@pytest.mark.asyncio
+async def test_search_messages_answers_from_store_without_history(monkeypatch, tmp_path):
+    store = make_store(tmp_path)
+    for index in range(5):
+        store.add_message(FakeMessage(100 + index, f"hello {index}"))
+    fake_channel = FakeChannel([])
+    rate_limit_calls = []
+
+    async def fake_apply_rate_limit(action_type, route=None):
+        rate_limit_calls.append(action_type)
+
+    monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
+    monkeypatch.setattr(messages, "message_store", store)
+    monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
+
+    result = await messages.search_messages(
+        {"channel_id": "1", "query": "hello", "limit": 3}
+    )
+
+    assert fake_channel.history_calls == []
+    assert rate_limit_calls == []
+    assert [line.split("message_id=")[1][:3] for line in result[0].text.splitlines()] == [
+        "102",
+        "103",
+        "104",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_messages_scans_only_below_covered_range(monkeypatch, tmp_path):
+    store = make_store(tmp_path)
+    store.add_message(FakeMessage(200, "hello live"))
+    history = [FakeMessage(message_id, "hello old") for message_id in (150, 140, 130)]
+    fake_channel = FakeChannel(history)
+
+    async def fake_apply_rate_limit(action_type, route=None):
+        pass
+
+    monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
+    monkeypatch.setattr(messages, "message_store", store)
+    monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
+
+    result = await messages.search_messages(
+        {"channel_id": "1", "query": "hello", "limit": 10}
+    )
+
+    assert fake_channel.history_calls[0]["before"].id == 200
+    assert result[0].text.count("message_id=") == 4
+    # The scanned window is now part of the live range.
+    assert store.live_since(1) == 130
+
+
+@pytest.mark.asyncio
+async def test_search_messages_bridges_into_range_from_earlier_session(
+    monkeypatch, tmp_path
+):
+    store = make_store(tmp_path)
+    store.add_message(FakeMessage(100, "hello archived"))
+    store.add_message(FakeMessage(110, "hello archived too"))
+    store.reset_live()
+    history = [
+        FakeMessage(130, "hello new"),
+        FakeMessage(120, "nothing"),
+        FakeMessage(110, "hello archived too"),
+    ]
+    fake_channel = FakeChannel(history)
+
+    async def fake_apply_rate_limit(action_type, route=None):
+        pass
+
+    monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
+    monkeypatch.setattr(messages, "message_store", store)
+    monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
+
+    result = await messages.search_messages(
+        {"channel_id": "1", "query": "hello", "limit": 10}
+    )
+
+    ids = [line.split("message_id=")[1][:3] for line in result[0].text.splitlines()]
+    assert ids == ["100", "110", "130"]
+    assert store.live_since(1) == 100
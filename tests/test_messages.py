@@ -1,9 +1,19 @@
+import json
+import re
 from datetime import datetime, timezone
 
+import discord
 import pytest
-from mcp.types import ImageContent
+from mcp.types import ImageContent, ResourceLink
 
+from discord_py_self_mcp.attachment_cache import AttachmentCache, AttachmentCacheConfig
+from discord_py_self_mcp.cursors import CursorStore, encode_cursor
 from discord_py_self_mcp.tools import messages
+from discord_py_self_mcp.tools.embed import (
+    CompactFormatter,
+    render_message_listing,
+    shorten_cdn_urls,
+)
 
 
 class FakeAuthor:
@@ -90,6 +100,7 @@ class FakeMessageable:
 
 class FakeChannel(FakeMessageable):
     def __init__(self, *, messages_list=None, fetched_message=None, sent_message=None):
+        self.id = 1
         self._messages = messages_list or []
         self._fetched_message = fetched_message
         self._sent_message = sent_message or FakeMessage(message_id=999)
@@ -127,7 +138,7 @@ async def test_send_message_without_reply_has_no_reference(monkeypatch):
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         rate_limit_calls.append(action_type)
 
     monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
@@ -146,7 +157,7 @@ async def test_send_message_empty_reply_id_sends_normally(monkeypatch):
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         pass
 
     monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
@@ -168,7 +179,7 @@ async def test_send_message_includes_reply_reference(monkeypatch):
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         rate_limit_calls.append(action_type)
 
     monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
@@ -194,7 +205,7 @@ async def test_read_messages_includes_attachment_metadata(monkeypatch):
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         rate_limit_calls.append(action_type)
 
     monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
@@ -222,7 +233,7 @@ async def test_read_messages_includes_reply_reference_id(monkeypatch):
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         pass
 
     monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
@@ -238,13 +249,28 @@ async def test_read_messages_includes_reply_reference_id(monkeypatch):
     assert "reply_to=" not in plain_line
 
 
+class FakeAttachmentCache(AttachmentCache):
+    def __init__(self, path, attachments, inline_max_bytes=1024):
+        super().__init__(AttachmentCacheConfig(path=path, inline_max_bytes=inline_max_bytes))
+        self._payloads = {attachment.url: attachment._payload for attachment in attachments}
+        self.downloads = 0
+
+    async def _iter_chunks(self, url, http=None):
+        self.downloads += 1
+        payload = self._payloads[url]
+        for start in range(0, len(payload), 4):
+            yield payload[start : start + 4]
+
+
 @pytest.mark.asyncio
-async def test_get_message_attachments_returns_image_content(monkeypatch):
+async def test_get_message_attachments_returns_image_content(monkeypatch, tmp_path):
     attachment = FakeAttachment(payload=b"png-bytes")
     fake_message = FakeMessage(message_id=456, attachments=[attachment])
     fake_channel = FakeChannel(fetched_message=fake_message)
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
+    cache = FakeAttachmentCache(tmp_path, [attachment])
+    monkeypatch.setattr(messages, "get_attachment_cache", lambda: cache)
 
     result = await messages.get_message_attachments(
         {"channel_id": "1", "message_id": "456"}
@@ -255,6 +281,33 @@ async def test_get_message_attachments_returns_image_content(monkeypatch):
     assert result[1].mimeType == "image/png"
 
 
+@pytest.mark.asyncio
+async def test_get_message_attachments_links_large_files_from_cache(monkeypatch, tmp_path):
+    payload = b"x" * 4096
+    attachment = FakeAttachment(
+        filename="log.txt", content_type="text/plain", size=len(payload), payload=payload
+    )
+    fake_message = FakeMessage(message_id=456, attachments=[attachment])
+    fake_channel = FakeChannel(fetched_message=fake_message)
+    monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
+    cache = FakeAttachmentCache(tmp_path, [attachment])
+    monkeypatch.setattr(messages, "get_attachment_cache", lambda: cache)
+
+    linked = await messages.get_message_attachments({"channel_id": "1", "message_id": "456"})
+    by_path = await messages.get_message_attachments(
+        {"channel_id": "1", "message_id": "456", "return_mode": "path"}
+    )
+
+    assert isinstance(linked[1], ResourceLink)
+    assert str(linked[1].uri).startswith("file://")
+    assert linked[1].size == len(payload)
+    cached_file = next(tmp_path.glob("99-*"))
+    assert cached_file.read_bytes() == payload
+    assert str(cached_file) in by_path[1].text
+    assert cache.downloads == 1
+
+
 @pytest.mark.asyncio
 async def test_get_message_attachments_can_skip_binary_download(monkeypatch):
     attachment = FakeAttachment()
@@ -295,7 +348,7 @@ async def test_search_messages_applies_rate_limit_and_caps_fetch_window(monkeypa
     monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
     monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         rate_limit_calls.append(action_type)
 
     monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
@@ -307,3 +360,198 @@ async def test_search_messages_applies_rate_limit_and_caps_fetch_window(monkeypa
     assert rate_limit_calls == ["action"]
     assert fake_channel.last_history_limit == 300
     assert "message_id=" in result[0].text
+
+
+class FakeCursorChannel(FakeMessageable):
+    """History in newest-first order, honouring ``after`` like discord.py."""
+
+    def __init__(self, message_ids):
+        self._messages = [FakeMessage(message_id=i, content=f"m{i}") for i in message_ids]
+        self.history_calls = []
+
+    def history(self, *, limit, after=None, oldest_first=None):
+        self.history_calls.append({"limit": limit, "after": after and after.id})
+        newest_first = sorted(self._messages, key=lambda m: m.id, reverse=True)
+        if after is None:
+            return FakeHistoryIterator(newest_first[:limit])
+        newer = sorted((m for m in newest_first if m.id > after.id), key=lambda m: m.id)
+        return FakeHistoryIterator(newer[:limit])
+
+    def post(self, message_id):
+        self._messages.append(FakeMessage(message_id=message_id, content=f"m{message_id}"))
+
+
+def _message_ids(text):
+    return [int(match) for match in re.findall(r"message_id=(\d+)", text)]
+
+
+@pytest.fixture
+def cursor_channel(monkeypatch):
+    fake_channel = FakeCursorChannel([10, 11, 12])
+    monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(messages, "client", FakeClient(fake_channel))
+    store = CursorStore()
+    monkeypatch.setattr(messages, "get_cursor_store", lambda: store)
+
+    async def fake_apply_rate_limit(action_type, route=None):
+        pass
+
+    monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
+    return fake_channel
+
+
+@pytest.mark.asyncio
+async def test_read_messages_cursor_returns_only_newer_messages(cursor_channel):
+    first = await messages.read_messages({"channel_id": "1", "limit": 5})
+    assert _message_ids(first[0].text) == [10, 11, 12]
+    cursor = first[1].text.split()[1]
+
+    empty = await messages.read_messages({"channel_id": "1", "cursor": cursor})
+    assert empty[0].text.startswith("No new messages")
+    assert len(empty) == 1
+
+    cursor_channel.post(13)
+    cursor_channel.post(14)
+    cursor_channel.post(15)
+    page = await messages.read_messages({"channel_id": "1", "cursor": cursor, "limit": 2})
+    assert _message_ids(page[0].text) == [13, 14]
+    assert "more messages may follow" in page[1].text
+
+    rest = await messages.read_messages({"channel_id": "1", "cursor": page[1].text.split()[1]})
+    assert _message_ids(rest[0].text) == [15]
+    assert cursor_channel.history_calls[-1]["after"] == 14
+
+
+@pytest.mark.asyncio
+async def test_read_messages_since_last_read_uses_the_retained_cursor(cursor_channel):
+    await messages.read_messages({"channel_id": "1"})
+    cursor_channel.post(20)
+
+    result = await messages.read_messages({"channel_id": "1", "since_last_read": True})
+
+    assert _message_ids(result[0].text) == [20]
+    again = await messages.read_messages({"channel_id": "1", "since_last_read": True})
+    assert again[0].text.startswith("No new messages")
+
+
+@pytest.mark.asyncio
+async def test_read_messages_rejects_a_cursor_from_another_channel(cursor_channel):
+    result = await messages.read_messages(
+        {"channel_id": "1", "cursor": encode_cursor(2, 10)}
+    )
+
+    assert result[0].text.startswith("Error reading messages: Cursor belongs to channel 2")
+    assert cursor_channel.history_calls == []
+
+
+def _compact_message(message_id, author, content, embeds=()):
+    message = FakeMessage(
+        message_id=message_id, author=author, content=content, clean_content=content
+    )
+    message.embeds = list(embeds)
+    return message
+
+
+def test_shorten_cdn_urls_replaces_links_with_ids():
+    text = (
+        "see https://cdn.discordapp.com/attachments/1/222/photo.png?ex=1 and "
+        "https://media.discordapp.net/emojis/333.webp plus https://example.com/x"
+    )
+
+    assert shorten_cdn_urls(text) == "see att:222 and emoji:333 plus https://example.com/x"
+
+
+def test_compact_formatter_groups_authors_and_dedupes_embeds():
+    alice, bob = FakeAuthor("alice", 1), FakeAuthor("bob", 2)
+    embed = discord.Embed(title="Release notes", description="v2 is out")
+    formatter = CompactFormatter()
+
+    lines = [
+        formatter.format(_compact_message(1, alice, "hello\nthere", [embed])),
+        formatter.format(_compact_message(2, alice, "again", [embed.copy()])),
+        formatter.format(_compact_message(3, bob, "hi")),
+    ]
+
+    assert lines == [
+        "alice:\n  1: hello / there [embed: Release notes | v2 is out]",
+        "  2: again [embed as in 1]",
+        "bob:\n  3: hi",
+    ]
+
+
+def test_render_message_listing_elides_older_messages_over_budget():
+    author = FakeAuthor("alice", 1)
+    items = [_compact_message(i, author, "x" * 40) for i in range(1, 11)]
+
+    text, kept = render_message_listing(items, {"format": "compact", "max_output_chars": 250})
+
+    assert len(text) <= 250
+    assert kept == items[-len(kept) :] and 0 < len(kept) < len(items)
+    summary = text.splitlines()[0]
+    assert summary.startswith(f"[{10 - len(kept)} earlier messages elided to fit 250 chars")
+    assert "ids 1-" in summary and "alice" in summary
+
+
+@pytest.mark.asyncio
+async def test_read_messages_compact_format_keeps_newest_within_budget(monkeypatch):
+    author = FakeAuthor("alice", 1)
+    newest_first = [
+        _compact_message(i, author, f"message {i} " + "y" * 30) for i in range(20, 0, -1)
+    ]
+    monkeypatch.setattr(messages.discord.abc, "Messageable", FakeMessageable)
+    monkeypatch.setattr(messages, "client", FakeClient(FakeChannel(messages_list=newest_first)))
+    monkeypatch.setattr(messages, "get_cursor_store", lambda: CursorStore())
+
+    async def fake_apply_rate_limit(action_type, route=None):
+        pass
+
+    monkeypatch.setattr(messages, "apply_rate_limit", fake_apply_rate_limit)
+
+    result = await messages.read_messages(
+        {"channel_id": "1", "limit": 20, "format": "compact", "max_output_tokens": 100}
+    )
+    text = result[0].text
+
+    assert len(text) <= 400
+    assert "earlier messages elided" in text.splitlines()[0]
+    assert text.count("alice:") == 1
+    assert text.rstrip().endswith("message 20 " + "y" * 30)
+    assert "message_id=" not in text
+
+
+@pytest.mark.asyncio
+async def test_read_messages_json_output_serializes_messages(cursor_channel):
+    result = await messages.read_messages({"channel_id": "1", "output": "json"})
+
+    document = json.loads(result[0].text)
+    assert [message["id"] for message in document["messages"]] == [10, 11, 12]
+    assert document["messages"][0]["content"] == "m10"
+    assert document["messages"][0]["author"] == "tester"
+    assert result[1].text.startswith("next_cursor: ")
+
+    cursor = result[1].text.split()[1]
+    empty = await messages.read_messages(
+        {"channel_id": "1", "cursor": cursor, "output": "ndjson"}
+    )
+    assert empty[0].text == ""
+    assert empty[1].text.startswith("next_cursor: ")
+
+
+@pytest.mark.asyncio
+async def test_read_messages_cursor_advances_past_a_message_over_budget(cursor_channel):
+    first = await messages.read_messages({"channel_id": "1"})
+    cursor = first[1].text.split()[1]
+    cursor_channel.post(13)
+    cursor_channel._messages[-1].content = "z" * 500
+    cursor_channel.post(14)
+
+    page = await messages.read_messages(
+        {"channel_id": "1", "cursor": cursor, "max_output_chars": 100}
+    )
+
+    assert len(page[0].text) <= 100
+    assert _message_ids(page[0].text) == [13]
+    assert "[truncated]" in page[0].text
+    assert "[1 later messages elided]" in page[0].text
+    rest = await messages.read_messages({"channel_id": "1", "cursor": page[1].text.split()[1]})
+    assert _message_ids(rest[0].text) == [14]
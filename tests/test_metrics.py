@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from mcp.types import TextContent
+
+from discord_py_self_mcp.metrics import (
+    LatencyHistogram,
+    ServerMetrics,
+    add_http_time,
+    add_rate_limit_wait,
+    start_metrics_server,
+)
+from discord_py_self_mcp.tools.registry import ToolRegistry
+
+
+def test_histogram_percentiles_follow_the_observed_distribution():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.observe(0.02)
+    for _ in range(10):
+        histogram.observe(2.0)
+
+    assert 0.01 <= histogram.percentile(0.50) <= 0.025
+    assert 1.0 <= histogram.percentile(0.95) <= 2.0
+    assert histogram.percentile(0.99) <= histogram.max == 2.0
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_call_tool_records_counts_errors_waits_and_bytes():
+    registry = ToolRegistry()
+
+    @registry.register("send", "Send", {"type": "object"})
+    async def send(arguments):
+        add_rate_limit_wait(0.25)
+        add_http_time(0.1)
+        if arguments.get("fail"):
+            return [TextContent(type="text", text="Error sending message: boom")]
+        return [TextContent(type="text", text="sent")]
+
+    @registry.register("crash", "Crash", {"type": "object"})
+    async def crash(arguments):
+        raise RuntimeError("boom")
+
+    await registry.call_tool("send", {})
+    await registry.call_tool("send", {"fail": True})
+    with pytest.raises(RuntimeError):
+        await registry.call_tool("crash", {})
+    add_rate_limit_wait(5.0)  # outside a call: not charged to any tool
+
+    report = registry.metrics.snapshot()
+    send_stats = report["tools"]["send"]
+    assert send_stats["calls"] == 2
+    assert send_stats["errors"] == 1
+    assert send_stats["rate_limit_wait_seconds"] == 0.5
+    assert send_stats["http_seconds"] == 0.2
+    assert send_stats["response_bytes"] > len("sent")
+    assert report["tools"]["crash"]["calls"] == 1
+    assert report["tools"]["crash"]["errors"] == 1
+    assert (report["calls"], report["errors"]) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_prometheus_endpoint_serves_text_format():
+    metrics = ServerMetrics()
+    metrics.record_call("read_messages", elapsed=0.3, response_bytes=120)
+    server = await start_metrics_server(metrics, 0, host="127.0.0.1")
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = (await reader.read()).decode()
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert 'discord_mcp_tool_calls_total{tool="read_messages"} 1' in response
+    assert 'discord_mcp_tool_duration_seconds_bucket{tool="read_messages",le="0.5"} 1' in response
+    assert 'discord_mcp_tool_duration_seconds_bucket{tool="read_messages",le="0.25"} 0' in response
+    assert 'discord_mcp_tool_response_bytes_total{tool="read_messages"} 120' in response
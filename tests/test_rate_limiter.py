@@ -1,6 +1,8 @@
+import asyncio
+
 import pytest
 
-from discord_py_self_mcp.rate_limiter import RateLimitConfig, RateLimiter
+from discord_py_self_mcp.rate_limiter import RateLimitConfig, RateLimiter, current_priority
 
 
 class FakeClock:
@@ -11,6 +13,18 @@ class FakeClock:
         return self.now
 
 
+def patch_clock(monkeypatch, clock: FakeClock) -> list[float]:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float):
+        sleeps.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr("discord_py_self_mcp.rate_limiter.time.monotonic", clock.time)
+    monkeypatch.setattr("discord_py_self_mcp.rate_limiter.asyncio.sleep", fake_sleep)
+    return sleeps
+
+
 @pytest.mark.asyncio
 async def test_wait_if_needed_preserves_minute_window_before_cooldown(monkeypatch):
     limiter = RateLimiter(
@@ -22,21 +36,131 @@ async def test_wait_if_needed_preserves_minute_window_before_cooldown(monkeypatc
             cooldown_on_limit=60,
         )
     )
-    limiter._message_timestamps = [0.8, 1.4]
-    clock = FakeClock(1.5)
-    sleeps: list[float] = []
+    clock = FakeClock(0.8)
+    sleeps = patch_clock(monkeypatch, clock)
 
-    async def fake_sleep(delay: float):
-        sleeps.append(delay)
-        clock.now += delay
+    await limiter.wait_if_needed("message")
+    clock.now = 1.4
+    await limiter.wait_if_needed("message")
+    clock.now = 1.5
+    await limiter.wait_if_needed("message")
+
+    assert sleeps == [60]
+    assert clock.now == pytest.approx(61.5)
+    assert limiter.get_stats()["messages_last_minute"] == 1
 
-    monkeypatch.setattr("discord_py_self_mcp.rate_limiter.time.time", clock.time)
-    monkeypatch.setattr("discord_py_self_mcp.rate_limiter.asyncio.sleep", fake_sleep)
+
+@pytest.mark.asyncio
+async def test_messages_per_second_paces_without_cooldown(monkeypatch):
+    limiter = RateLimiter(
+        RateLimitConfig(enabled=True, messages_per_minute=100, messages_per_second=1)
+    )
+    clock = FakeClock(10.0)
+    sleeps = patch_clock(monkeypatch, clock)
 
+    await limiter.wait_if_needed("message")
     await limiter.wait_if_needed("message")
 
-    assert sleeps == [60]
-    assert limiter._message_timestamps[-1] == pytest.approx(61.5)
+    assert sleeps == [pytest.approx(1.0)]
+    assert limiter.get_cooldown_remaining() == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_are_admitted_in_arrival_order(monkeypatch):
+    limiter = RateLimiter(RateLimitConfig(enabled=True, actions_per_minute=1000))
+    clock = FakeClock(100.0)
+    patch_clock(monkeypatch, clock)
+    admitted: list[int] = []
+
+    async def waiter(index: int):
+        await limiter.wait_if_needed("action")
+        admitted.append(index)
+
+    await asyncio.gather(*(waiter(index) for index in range(50)))
+
+    assert admitted == list(range(50))
+    assert limiter.get_stats()["queued_actions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_block_queue():
+    limiter = RateLimiter(RateLimitConfig(enabled=True, actions_per_minute=1000))
+    limiter._min_action_interval = 0.01
+    limiter.reset()
+
+    await limiter.wait_if_needed("action")
+    cancelled = asyncio.create_task(limiter.wait_if_needed("action"))
+    follower = asyncio.create_task(limiter.wait_if_needed("action"))
+    await asyncio.sleep(0)
+    assert limiter.get_stats()["queued_actions"] == 2
+    cancelled.cancel()
+
+    await asyncio.wait_for(follower, timeout=1)
+
+    assert cancelled.cancelled()
+    assert limiter.get_stats()["queued_actions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_lane_is_admitted_before_queued_background_work(monkeypatch):
+    limiter = RateLimiter(RateLimitConfig(enabled=True, actions_per_minute=1000))
+    clock = FakeClock(100.0)
+    patch_clock(monkeypatch, clock)
+    admitted: list[str] = []
+    await limiter.wait_if_needed("action")
+
+    async def waiter(name: str, priority: str):
+        await limiter.wait_if_needed("action", priority=priority)
+        admitted.append(name)
+
+    await asyncio.gather(
+        waiter("bulk-0", "background"),
+        waiter("bulk-1", "background"),
+        waiter("normal", "normal"),
+        waiter("send", "interactive"),
+    )
+
+    assert admitted == ["send", "normal", "bulk-0", "bulk-1"]
+    lanes = limiter.get_stats()["lanes"]
+    assert lanes["background"]["admitted"] == 2
+    assert lanes["background"]["max_wait"] == pytest.approx(4.0)
+    assert lanes["interactive"]["avg_wait"] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_aged_background_waiter_overtakes_fresh_interactive_work():
+    limiter = RateLimiter(RateLimitConfig(enabled=True, priority_aging=10))
+    loop = asyncio.get_running_loop()
+    lanes = limiter._waiters["action"]
+    lanes["background"].append((loop.create_future(), 0.0))
+    lanes["interactive"].append((loop.create_future(), 15.0))
+
+    # Two lanes apart: background wins once it has waited 20s longer.
+    assert limiter._next_lane("action", 15.0) == "interactive"
+    lanes["interactive"][0] = (lanes["interactive"][0][0], 25.0)
+    assert limiter._next_lane("action", 25.0) == "background"
+
+    stats = limiter.get_stats()["lanes"]
+    assert stats["background"]["queued"] == 1
+    assert stats["interactive"]["queued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_current_priority_context_selects_lane(monkeypatch):
+    limiter = RateLimiter(RateLimitConfig(enabled=True, actions_per_minute=1000))
+    clock = FakeClock(100.0)
+    patch_clock(monkeypatch, clock)
+    await limiter.wait_if_needed("action")
+
+    token = current_priority.set("background")
+    try:
+        await limiter.wait_if_needed("action")
+    finally:
+        current_priority.reset(token)
+
+    assert limiter.get_stats()["lanes"]["background"]["admitted"] == 1
+    with pytest.raises(ValueError):
+        await limiter.wait_if_needed("action", priority="urgent")
 
 
 def test_load_from_env_enables_rate_limiting_by_default(monkeypatch):
@@ -49,11 +173,13 @@ def test_load_from_env_enables_rate_limiting_by_default(monkeypatch):
 
 def test_get_stats_drops_stale_timestamps(monkeypatch):
     limiter = RateLimiter(RateLimitConfig(enabled=True))
-    limiter._message_timestamps = [0.0, 61.0]
-    limiter._action_timestamps = [10.0, 61.0]
+    limiter._recent["message"].add(0.0)
+    limiter._recent["message"].add(61.0)
+    limiter._recent["action"].add(10.0)
+    limiter._recent["action"].add(61.0)
     clock = FakeClock(70.0)
 
-    monkeypatch.setattr("discord_py_self_mcp.rate_limiter.time.time", clock.time)
+    monkeypatch.setattr("discord_py_self_mcp.rate_limiter.time.monotonic", clock.time)
 
     stats = limiter.get_stats()
 
@@ -1,6 +1,11 @@
+import asyncio
+import sys
+
 import pytest
 from mcp.types import TextContent
 
+from discord_py_self_mcp.readiness import Readiness
+from discord_py_self_mcp.rate_limiter import current_priority
 from discord_py_self_mcp.tools.registry import ToolRegistry
 
 
@@ -17,3 +22,114 @@ async def test_call_tool_lists_available_tools_for_unknown_name():
         await registry.call_tool("missing", {})
 
     assert str(exc.value) == "Unknown tool 'missing'. Available tools: alpha"
+
+
+@pytest.mark.asyncio
+async def test_call_tool_sets_registered_priority_and_allows_override():
+    registry = ToolRegistry()
+
+    async def lane_handler(arguments):
+        return [TextContent(type="text", text=current_priority.get())]
+
+    registry.register("send", "Send", {"type": "object"}, priority="interactive")(lane_handler)
+    registry.register("plain", "Plain", {"type": "object"})(lane_handler)
+
+    assert (await registry.call_tool("send", {}))[0].text == "interactive"
+    assert (await registry.call_tool("plain", {}))[0].text == "normal"
+    assert (await registry.call_tool("send", {}, priority="background"))[0].text == "background"
+    assert current_priority.get() == "normal"
+
+
+def test_register_rejects_unknown_priority():
+    registry = ToolRegistry()
+
+    with pytest.raises(ValueError):
+        registry.register("bad", "Bad", {"type": "object"}, priority="urgent")
+
+
+@pytest.fixture
+def fresh_readiness(monkeypatch):
+    state = Readiness()
+    registry_module = sys.modules["discord_py_self_mcp.tools.registry"]
+    monkeypatch.setattr(registry_module, "readiness", state)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_call_tool_waits_for_the_readiness_its_tool_needs(fresh_readiness):
+    registry = ToolRegistry()
+    ran = []
+
+    def handler_for(name):
+        async def handler(arguments):
+            ran.append(name)
+            return [TextContent(type="text", text=name)]
+
+        return handler
+
+    registry.register("cached", "Cached", {"type": "object"})(handler_for("cached"))
+    registry.register("fetch", "Fetch", {"type": "object"}, needs="rest")(handler_for("fetch"))
+    registry.register("local", "Local", {"type": "object"}, needs="none")(handler_for("local"))
+
+    fresh_readiness.begin()
+    cached = asyncio.create_task(registry.call_tool("cached", {}))
+    fetch = asyncio.create_task(registry.call_tool("fetch", {}))
+    assert (await registry.call_tool("local", {}))[0].text == "local"
+
+    fresh_readiness.mark("rest")
+    assert (await fetch)[0].text == "fetch"
+    assert not cached.done()
+
+    await asyncio.sleep(0.05)
+    fresh_readiness.mark("gateway")
+    assert (await cached)[0].text == "cached"
+    assert ran == ["local", "fetch", "cached"]
+
+    stats = registry.metrics.snapshot()["tools"]
+    assert stats["local"]["ready_wait_seconds"] == 0
+    assert stats["cached"]["ready_wait_seconds"] >= 0.05
+    assert stats["cached"]["max_ready_wait_seconds"] == stats["cached"]["ready_wait_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_reports_not_ready_after_its_deadline(fresh_readiness):
+    registry = ToolRegistry()
+    handler_calls = []
+
+    async def handler(arguments):
+        handler_calls.append(arguments)
+        return [TextContent(type="text", text="ran")]
+
+    registry.register("cached", "Cached", {"type": "object"})(handler)
+    fresh_readiness.begin()
+
+    result = await registry.call_tool("cached", {}, ready_timeout=0.01)
+
+    assert "not ready yet" in result[0].text
+    assert handler_calls == []
+    assert registry.metrics.snapshot()["tools"]["cached"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_login_failure_releases_waiting_calls(fresh_readiness):
+    registry = ToolRegistry()
+
+    async def handler(arguments):
+        return [TextContent(type="text", text="ran")]
+
+    registry.register("cached", "Cached", {"type": "object"})(handler)
+    fresh_readiness.begin()
+    pending = asyncio.create_task(registry.call_tool("cached", {}, ready_timeout=5))
+    await asyncio.sleep(0)
+
+    fresh_readiness.fail("LoginFailure: Improper token has been passed.")
+
+    result = await asyncio.wait_for(pending, 1)
+    assert result[0].text == "Discord login failed: LoginFailure: Improper token has been passed."
+
+
+def test_register_rejects_unknown_readiness():
+    registry = ToolRegistry()
+
+    with pytest.raises(ValueError):
+        registry.register("bad", "Bad", {"type": "object"}, needs="voice")
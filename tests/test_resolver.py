@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from discord_py_self_mcp.resolver import Resolver, ResolverConfig, get_resolver
+
+
+class FakeMessage:
+    def __init__(self, message_id, content="hi", channel=None):
+        self.id = message_id
+        self.content = content
+        self.channel = channel
+
+
+class FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.message_fetches = 0
+
+    async def fetch_message(self, message_id):
+        self.message_fetches += 1
+        await asyncio.sleep(0.01)
+        return FakeMessage(message_id, content=f"v{self.message_fetches}")
+
+
+class FakeConnectionState:
+    def __init__(self):
+        self.messages = {}
+
+    def _get_message(self, message_id):
+        return self.messages.get(message_id)
+
+
+class FakeClient:
+    def __init__(self, cached=None):
+        self.cached = cached or {}
+        self._connection = FakeConnectionState()
+        self.channel_fetches = 0
+
+    def get_channel(self, channel_id):
+        return self.cached.get(channel_id)
+
+    async def fetch_channel(self, channel_id):
+        self.channel_fetches += 1
+        await asyncio.sleep(0.01)
+        return FakeChannel(channel_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch_and_later_ones_hit_the_cache():
+    client = FakeClient()
+    resolver = Resolver(client, ResolverConfig())
+
+    first, second = await asyncio.gather(resolver.channel(5), resolver.channel("5"))
+    third = await resolver.channel(5)
+
+    assert first is second is third
+    assert client.channel_fetches == 1
+    assert resolver.get_stats()["channels"] == {"entries": 1, "hits": 2, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_gateway_cache_is_preferred_and_never_stored():
+    gateway_channel = FakeChannel(7)
+    client = FakeClient(cached={7: gateway_channel})
+    client._connection.messages[70] = FakeMessage(70, content="live", channel=gateway_channel)
+    resolver = Resolver(client, ResolverConfig())
+
+    assert await resolver.channel(7) is gateway_channel
+    assert (await resolver.message(gateway_channel, 70)).content == "live"
+    assert client.channel_fetches == 0
+    assert gateway_channel.message_fetches == 0
+
+
+@pytest.mark.asyncio
+async def test_message_ids_are_resolved_within_the_given_channel():
+    class EmptyChannel(FakeChannel):
+        async def fetch_message(self, message_id):
+            self.message_fetches += 1
+            raise LookupError(f"Unknown message {message_id}")
+
+    channel_a = FakeChannel(1)
+    channel_b = EmptyChannel(2)
+    client = FakeClient()
+    client._connection.messages[70] = FakeMessage(70, content="live", channel=channel_a)
+    resolver = Resolver(client, ResolverConfig())
+
+    await resolver.message(channel_a, 10)
+    with pytest.raises(LookupError):
+        await resolver.message(channel_b, 70)
+    with pytest.raises(LookupError):
+        await resolver.message(channel_b, 10)
+    assert channel_b.message_fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_invalidation_forces_a_refetch():
+    client = FakeClient()
+    channel = FakeChannel(1)
+    resolver = Resolver(client, ResolverConfig(message_ttl=0.05))
+
+    assert (await resolver.message(channel, 10)).content == "v1"
+    assert (await resolver.message(channel, 10)).content == "v1"
+    resolver.invalidate_message(1, 10)
+    assert (await resolver.message(channel, 10)).content == "v2"
+    await asyncio.sleep(0.06)
+    assert (await resolver.message(channel, 10)).content == "v3"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_a_fetch_keeps_the_stale_result_out():
+    client = FakeClient()
+    channel = FakeChannel(1)
+    resolver = Resolver(client, ResolverConfig())
+
+    pending = asyncio.create_task(resolver.message(channel, 10))
+    await asyncio.sleep(0)
+    resolver.invalidate_message(1, 10)
+    assert (await pending).content == "v1"
+
+    assert (await resolver.message(channel, 10)).content == "v2"
+
+
+@pytest.mark.asyncio
+async def test_disabled_resolver_always_fetches():
+    client = FakeClient()
+    resolver = Resolver(client, ResolverConfig(enabled=False))
+
+    await resolver.channel(3)
+    await resolver.channel(3)
+
+    assert client.channel_fetches == 2
+
+
+def test_get_resolver_is_per_client():
+    first, second = FakeClient(), FakeClient()
+
+    assert get_resolver(first) is get_resolver(first)
+    assert get_resolver(first) is not get_resolver(second)
@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from discord_py_self_mcp.route_limits import RouteBucketRegistry, parse_route
+
+
+def test_parse_route_normalizes_ids_and_major_parameter():
+    key = parse_route("get", "https://discord.com/api/v9/channels/123/messages/456")
+    assert key == ("GET", "/channels/{channel_id}/messages/{id}", "123")
+
+    key = parse_route("PUT", "/channels/1/messages/2/reactions/%F0%9F%91%8D/@me")
+    assert key.template == "/channels/{channel_id}/messages/{id}/reactions/{emoji}/@me"
+
+    key = parse_route("POST", "/api/v9/webhooks/9/secret-token")
+    assert key == ("POST", "/webhooks/{webhook_id}/{webhook_token}", "9")
+
+
+def test_observe_tracks_buckets_per_major_parameter():
+    registry = RouteBucketRegistry()
+    headers = {
+        "X-RateLimit-Bucket": "abc",
+        "X-RateLimit-Limit": "5",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset-After": "2.5",
+    }
+
+    registry.observe("POST", "https://discord.com/api/v9/channels/1/messages", 200, headers)
+
+    assert registry.get_bucket("POST", "/channels/1/messages").remaining == 0
+    assert registry.get_bucket("POST", "/channels/2/messages") is None
+    assert registry.get_stats() == {"tracked": 1, "exhausted": 1}
+
+
+@pytest.mark.asyncio
+async def test_exhausted_route_waits_while_other_channel_proceeds():
+    registry = RouteBucketRegistry()
+
+    async def handler(request):
+        return web.Response(
+            text="{}",
+            headers={
+                "X-RateLimit-Bucket": "send",
+                "X-RateLimit-Limit": "1",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset-After": "0.2",
+            },
+        )
+
+    app = web.Application()
+    app.router.add_post("/api/v9/channels/{channel_id}/messages", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with aiohttp.ClientSession(trace_configs=[registry.trace_config()]) as session:
+            url = f"http://127.0.0.1:{port}/api/v9/channels/1/messages"
+            async with session.post(url) as response:
+                assert response.status == 200
+
+        started = time.monotonic()
+        await asyncio.wait_for(registry.acquire("POST", "/channels/2/messages"), 0.05)
+        assert time.monotonic() - started < 0.05
+
+        started = time.monotonic()
+        await registry.acquire("POST", "/channels/1/messages")
+        assert time.monotonic() - started >= 0.15
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_global_limit_pauses_every_route(monkeypatch):
+    registry = RouteBucketRegistry()
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        registry._global_until = 0
+
+    monkeypatch.setattr("discord_py_self_mcp.route_limits.asyncio.sleep", fake_sleep)
+    registry.observe(
+        "POST",
+        "/api/v9/channels/1/messages",
+        429,
+        {"X-RateLimit-Global": "true", "Retry-After": "3"},
+    )
+
+    await registry.acquire("GET", "/guilds/5/members")
+
+    assert len(sleeps) == 1
+    assert 2.5 < sleeps[0] <= 3
@@ -0,0 +1,99 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_startup import measure_daemon_mode, measure_local_mode
+from discord_py_self_mcp.tools.catalog import CATALOG_PATH, build_catalog, load_catalog
+
+HEAVY_MODULES = (
+    "discord",
+    "hcaptcha_challenger",
+    "playwright",
+    "discord_py_self_mcp.bot",
+    "discord_py_self_mcp.tools.messages",
+)
+
+
+def test_tool_catalog_matches_registered_tools():
+    assert load_catalog() == build_catalog(), (
+        f"{CATALOG_PATH.name} is stale; run `python -m discord_py_self_mcp.tools.catalog`"
+    )
+
+
+def test_importing_server_does_not_load_discord_or_captcha_stack():
+    code = (
+        "import json, sys\n"
+        "import discord_py_self_mcp.main\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert json.loads(output) == []
+
+
+# Startup time is recorded rather than held to a tight budget, which would be
+# flaky on loaded machines; the limit only catches a server that hangs or
+# regresses badly. Compare with benchmarks/bench_startup.py for real numbers.
+STARTUP_LIMIT_SECONDS = 15.0
+
+
+@pytest.mark.asyncio
+async def test_time_to_initialize_over_stdio_as_daemon_client(record_property):
+    samples = await measure_daemon_mode(runs=2, timeout=STARTUP_LIMIT_SECONDS)
+
+    record_property("daemon_startup_seconds", round(min(samples), 3))
+    assert min(samples) < STARTUP_LIMIT_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_time_to_initialize_over_stdio_with_local_client(record_property):
+    # The default path: discord.py is imported and the client started before
+    # the handshake. The login is stubbed out so the test stays offline.
+    samples = await measure_local_mode(runs=2, offline=True, timeout=STARTUP_LIMIT_SECONDS)
+
+    record_property("local_startup_seconds", round(min(samples), 3))
+    assert min(samples) < STARTUP_LIMIT_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_catalog_tools_load_their_module_on_first_call(monkeypatch, tmp_path):
+    from discord_py_self_mcp.tools.registry import ToolRegistry
+
+    (tmp_path / "lazy_probe_tool.py").write_text(
+        "from mcp.types import TextContent\n"
+        "from discord_py_self_mcp.tools.registry import registry\n"
+        "\n"
+        "@registry.register('lazy_probe', 'Probe', {'type': 'object'})\n"
+        "async def lazy_probe(arguments):\n"
+        "    return [TextContent(type='text', text='loaded')]\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    probe_registry = ToolRegistry()
+    # The tools package re-exports the registry object under the module's name.
+    registry_module = sys.modules["discord_py_self_mcp.tools.registry"]
+    monkeypatch.setattr(registry_module, "registry", probe_registry)
+    probe_registry.load_catalog(
+        [
+            {
+                "name": "lazy_probe",
+                "description": "Probe",
+                "inputSchema": {"type": "object"},
+                "priority": "normal",
+                "module": "lazy_probe_tool",
+            }
+        ]
+    )
+
+    assert "lazy_probe_tool" not in sys.modules
+    assert [tool.name for tool in probe_registry.get_tool_definitions()] == ["lazy_probe"]
+
+    result = await probe_registry.call_tool("lazy_probe", {})
+
+    assert result[0].text == "loaded"
+    assert "lazy_probe_tool" in sys.modules
+    monkeypatch.delitem(sys.modules, "lazy_probe_tool")
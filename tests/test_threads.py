@@ -38,7 +38,7 @@ async def test_create_thread_supports_forum_content(monkeypatch):
     monkeypatch.setattr(threads.discord, "ForumChannel", FakeForumChannel)
     monkeypatch.setattr(threads, "client", FakeClient(channel))
 
-    async def fake_apply_rate_limit(action_type):
+    async def fake_apply_rate_limit(action_type, route=None):
         rate_limit_calls.append(action_type)
 
     monkeypatch.setattr(threads, "apply_rate_limit", fake_apply_rate_limit)